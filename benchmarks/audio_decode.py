@@ -0,0 +1,131 @@
+"""
+Compare the old and new audio decoding paths for an answer recording.
+
+    python benchmarks/audio_decode.py --seconds 60 --repeat 5
+
+Encodes a synthetic webm/opus recording like the browser's MediaRecorder
+output, then times:
+
+  file      write a temp file, faster_whisper.decode_audio(path), delete it
+  memory    audio_decode.decode_bytes(data, "webm")
+  redecode  the old streaming path: decode everything received at each chunk
+  incremental  IncrementalDecoder: only new packets at each chunk
+"""
+import argparse
+import importlib.util
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import av
+import numpy as np
+from faster_whisper.audio import decode_audio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_audio_decode():
+    # Load the module by path so the Flask app (and its models) isn't imported
+    path = os.path.join(ROOT, "interview_app", "audio_decode.py")
+    spec = importlib.util.spec_from_file_location("audio_decode", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_recording(seconds, rate=48000):
+    """webm/opus bytes: a warbling tone with pauses and a little noise."""
+    buffer = io.BytesIO()
+    container = av.open(buffer, mode="w", format="webm")
+    stream = container.add_stream("libopus", rate=rate)
+    stream.layout = "mono"
+    frame_size = 960
+    rng = np.random.default_rng(0)
+    for start in range(0, int(seconds * rate), frame_size):
+        t = (np.arange(frame_size) + start) / rate
+        voiced = (t % 4.0) < 2.5
+        tone = 0.3 * np.sin(2 * np.pi * (220 + 40 * np.sin(2 * np.pi * 0.5 * t)) * t) * voiced
+        samples = (tone + 0.01 * rng.standard_normal(frame_size)).astype(np.float32)
+        frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="flt", layout="mono")
+        frame.sample_rate = rate
+        frame.pts = start
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return buffer.getvalue()
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(samples), 2), "min_ms": round(min(samples), 2)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0, help="length of the synthetic answer")
+    parser.add_argument("--chunk-seconds", type=float, default=1.0, help="MediaRecorder timeslice")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    audio_decode = load_audio_decode()
+    data = synthetic_recording(args.seconds)
+    chunk_count = max(1, int(args.seconds / args.chunk_seconds))
+    chunk_size = max(1, len(data) // chunk_count)
+    prefixes = [data[:end] for end in range(chunk_size, len(data), chunk_size)] + [data]
+
+    def file_path():
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            decode_audio(path, sampling_rate=16000)
+        finally:
+            os.remove(path)
+
+    def memory():
+        audio_decode.decode_bytes(data, "webm")
+
+    def redecode():
+        for prefix in prefixes:
+            try:
+                decode_audio(io.BytesIO(prefix), sampling_rate=16000)
+            except Exception:
+                pass
+
+    def incremental():
+        decoder = audio_decode.IncrementalDecoder("webm")
+        for prefix in prefixes[:-1]:
+            decoder.decode(prefix)
+        decoder.decode(prefixes[-1], final=True)
+
+    reference = decode_audio(io.BytesIO(data), sampling_rate=16000)
+    decoder = audio_decode.IncrementalDecoder("webm")
+    for prefix in prefixes[:-1]:
+        decoder.decode(prefix)
+    decoder.decode(prefixes[-1], final=True)
+
+    report = {
+        "seconds": args.seconds,
+        "bytes": len(data),
+        "chunks": len(prefixes),
+        "whole_recording": {"file": timed(file_path, args.repeat), "memory": timed(memory, args.repeat)},
+        "while_recording": {"redecode": timed(redecode, args.repeat), "incremental": timed(incremental, args.repeat)},
+        "incremental_samples": int(decoder.audio().size),
+        "reference_samples": int(reference.size),
+    }
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
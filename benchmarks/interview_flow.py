@@ -0,0 +1,392 @@
+"""
+End-to-end latency benchmark of the interview flow, without OpenAI.
+
+    python benchmarks/interview_flow.py --users 16 --concurrency 4 --latency-ms 800
+
+Starts the mock Chat Completions server (mock_openai.py) and, unless --url
+points at a running app, the Flask app itself in a temporary working
+directory with OPENAI_BASE_URL aimed at the mock. Each virtual user then
+walks one interview with the fixtures in benchmarks/fixtures:
+
+  upload reference image -> check_face x N -> submit_form (JD + resume)
+  -> start_interview -> per turn: upload the WAV answer, finish_audio_upload + wait for the transcription job, next_question
+  -> end_interview
+
+Per endpoint it reports p50/p95/p99/mean/max latency, status codes and
+throughput, and writes everything (plus the settings and the app's own
+/llm_stats etc.) to a JSON file under benchmarks/results/.
+
+Put a photo of a face at fixtures/face.jpg (or pass --face-image) to
+benchmark a real match; otherwise a generated placeholder is used and
+check_face measures the detection path ending in "no face" (HTTP 400).
+When benchmarking an external server (--url), start it with
+OPENAI_BASE_URL set to the printed mock URL, or pass --openai-url.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import wave
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+sys.path.insert(0, BENCH_DIR)
+
+from mock_openai import MockOpenAI  # noqa: E402
+
+
+# -- fixtures -----------------------------------------------------------------
+def placeholder_png(width=320, height=240):
+    """A grey gradient PNG, built with zlib so no imaging library is needed."""
+    rows = b"".join(b"\x00" + bytes((x + y) % 256 for x in range(width)) for y in range(height))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+def synthetic_answer_wav(seconds, rate=16000):
+    """16 kHz mono WAV: voiced bursts with pauses, roughly the shape of a spoken answer."""
+    frames = bytearray()
+    for n in range(int(seconds * rate)):
+        t = n / rate
+        voiced = (t % 3.0) < 2.2
+        pitch = 140 + 30 * math.sin(2 * math.pi * 0.7 * t)
+        value = 0.3 * math.sin(2 * math.pi * pitch * t) * (0.6 + 0.4 * math.sin(2 * math.pi * 4 * t)) if voiced else 0.0
+        frames += struct.pack("<h", int(value * 32767))
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def load_fixtures(args):
+    def read(name):
+        with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+            return f.read()
+
+    face_path = args.face_image or os.path.join(FIXTURES_DIR, "face.jpg")
+    if os.path.exists(face_path):
+        with open(face_path, "rb") as f:
+            face = (os.path.basename(face_path), f.read(), "image/jpeg", True)
+    else:
+        face = ("placeholder.png", placeholder_png(), "image/png", False)
+
+    if args.answer_wav:
+        with open(args.answer_wav, "rb") as f:
+            audio = f.read()
+    else:
+        audio = synthetic_answer_wav(args.audio_seconds)
+
+    return {
+        "face": face,
+        "job_description": read("job_description.txt"),
+        "resume": read("resume.txt"),
+        "answers": json.loads(read("answers.json")),
+        "audio": audio,
+    }
+
+
+# -- measurement --------------------------------------------------------------
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.errors = defaultdict(int)
+
+    def add(self, name, elapsed_ms, status, ok):
+        with self._lock:
+            self.samples[name].append(elapsed_ms)
+            self.statuses[name][str(status)] += 1
+            if not ok:
+                self.errors[name] += 1
+
+    def report(self, wall_s):
+        report = {}
+        for name in sorted(self.samples):
+            values = sorted(self.samples[name])
+            report[name] = {
+                "count": len(values),
+                "errors": self.errors[name],
+                "statuses": dict(self.statuses[name]),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "mean_ms": round(sum(values) / len(values), 1),
+                "max_ms": round(values[-1], 1),
+                "throughput_rps": round(len(values) / wall_s, 3) if wall_s else None,
+            }
+        return report
+
+
+class Client:
+    """One virtual candidate: a cookie session whose calls are timed by endpoint name."""
+
+    def __init__(self, base_url, recorder, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.timeout = timeout
+        self.http = requests.Session()
+
+    def call(self, name, method, path, expect=(200,), stream=False, **kwargs):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = self.http.request(method, self.base_url + path, timeout=self.timeout,
+                                         allow_redirects=False, stream=stream, **kwargs)
+            status = response.status_code
+            if stream:
+                self._drain(name, response, started)
+            return response
+        finally:
+            self.recorder.add(name, (time.perf_counter() - started) * 1000, status, status in expect)
+
+    def _drain(self, name, response, started):
+        """Read an SSE response to the end, recording when its first event arrived."""
+        events = []
+        first = None
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event:"):
+                if first is None:
+                    first = (time.perf_counter() - started) * 1000
+                    self.recorder.add(f"{name} (first event)", first, response.status_code, True)
+                events.append(line.split(":", 1)[1].strip())
+            elif line.startswith("data:") and events:
+                events[-1] = (events[-1], json.loads(line.split(":", 1)[1]))
+        response.events = [event for event in events if isinstance(event, tuple)]
+
+
+def upload_answer(client, audio, chunk_bytes, poll_s):
+    """Upload a recording the way the browser does; returns its transcription (or None)."""
+    file_id = uuid.uuid4().hex
+    for offset in range(0, len(audio), chunk_bytes):
+        client.call("upload_audio_chunk", "POST", "/upload_audio_chunk",
+                    params={"file_id": file_id, "offset": offset, "mime": "audio/wav"},
+                    data=audio[offset:offset + chunk_bytes],
+                    headers={"Content-Type": "application/octet-stream"})
+
+    started = time.perf_counter()
+    response = client.call("finish_audio_upload", "POST", "/finish_audio_upload", expect=(202,),
+                           json={"file_id": file_id, "size": len(audio), "mime": "audio/wav"})
+    if response.status_code != 202:
+        return None
+    job_id = response.json()["job_id"]
+    job = {"status": "queued"}
+    while job["status"] in ("queued", "running"):
+        time.sleep(poll_s)
+        job = client.http.get(f"{client.base_url}/transcription_status/{job_id}", timeout=client.timeout).json()
+    client.recorder.add("transcription (upload finished -> text)", (time.perf_counter() - started) * 1000,
+                        job["status"], job["status"] == "done")
+    return job.get("transcription")
+
+
+def run_interview(base_url, fixtures, recorder, args):
+    """Walk one complete interview; returns True if it reached the summary."""
+    client = Client(base_url, recorder, args.timeout)
+    face_name, face_bytes, face_type, real_face = fixtures["face"]
+    face_ok = (200,) if real_face else (200, 400)
+
+    client.call("upload_reference", "POST", "/", expect=(302,), files={"file": (face_name, face_bytes, face_type)})
+    for _ in range(args.face_frames):
+        client.call("check_face", "POST", "/api/check_face", expect=face_ok,
+                    files={"image": (face_name, face_bytes, face_type)})
+
+    response = client.call("submit_form", "POST", "/submit_form", data={
+        "board_name": "CBSE", "grade": "Secondary", "subject_name": "Mathematics", "country_name": "India",
+    }, files={
+        "job_description": ("job_description.txt", fixtures["job_description"], "text/plain"),
+        "resume": ("resume.txt", fixtures["resume"], "text/plain"),
+    })
+    if response.status_code != 200:
+        return False
+    if client.call("start_interview", "GET", "/start_interview").status_code != 200:
+        return False
+
+    answers = fixtures["answers"]
+    for turn in range(args.max_turns):
+        transcription = None
+        if not args.skip_audio:
+            transcription = upload_answer(client, fixtures["audio"], args.chunk_bytes, args.poll_ms / 1000)
+
+        # Like the browser, submit the transcript (the server prefetched the next question from it)
+        payload = {"candidate_answer": transcription or answers[turn % len(answers)]}
+        if args.stream:
+            response = client.call("next_question_stream", "POST", "/next_question_stream", stream=True, json=payload)
+            finished = any(data.get("interview_finished") for event, data in response.events if event == "done")
+        else:
+            response = client.call("next_question", "POST", "/next_question", json=payload)
+            finished = response.status_code == 200 and response.json().get("interview_finished")
+        if response.status_code != 200:
+            return False
+        if finished:
+            break
+
+    if args.stream:
+        response = client.call("end_interview_stream", "POST", "/end_interview_stream", stream=True, json={})
+        return any(event == "summary" for event, _ in response.events)
+    return client.call("end_interview", "POST", "/end_interview", json={}).status_code == 200
+
+
+# -- app under test -----------------------------------------------------------
+def start_local_app(workdir):
+    """Import and serve the app in this process, with its files under `workdir`."""
+    from werkzeug.serving import make_server
+
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+    from interview_app import app
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, name="app-under-test", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def wait_until_ready(base_url, timeout_s):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/readyz", timeout=5).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(1.0)
+    return False
+
+
+def server_stats(base_url):
+    stats = {}
+    for path in ("llm_stats", "scoring_stats", "transcription_metrics", "topic_summary_stats", "llm_cache_stats"):
+        try:
+            response = requests.get(f"{base_url}/{path}", timeout=10)
+            if response.ok:
+                stats[path] = response.json()
+        except (requests.RequestException, ValueError):
+            pass
+    return stats
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(endpoints, out=sys.stderr):
+    print(f"{'endpoint':44} {'count':>6} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>7}", file=out)
+    for name, row in endpoints.items():
+        print(f"{name:44} {row['count']:>6} {row['errors']:>4} {row['p50_ms']:>9} {row['p95_ms']:>9} "
+              f"{row['p99_ms']:>9} {row['throughput_rps']:>7}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=8, help="interviews to run")
+    parser.add_argument("--concurrency", type=int, default=4, help="interviews in flight at once")
+    parser.add_argument("--url", default=None, help="benchmark a running app instead of starting one")
+    parser.add_argument("--openai-url", default=None, help="use a running mock instead of starting one")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="mock LLM time to first byte")
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--tokens-per-s", type=float, default=60.0, help="mock LLM streaming speed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of mock LLM calls that fail")
+    parser.add_argument("--max-turns", type=int, default=10, help="answers per interview at most")
+    parser.add_argument("--face-frames", type=int, default=3, help="check_face calls per interview")
+    parser.add_argument("--face-image", default=None)
+    parser.add_argument("--answer-wav", default=None, help="recorded answer (default: synthetic)")
+    parser.add_argument("--audio-seconds", type=float, default=8.0, help="length of the synthetic answer")
+    parser.add_argument("--chunk-bytes", type=int, default=64 * 1024, help="audio upload piece size")
+    parser.add_argument("--skip-audio", action="store_true", help="don't upload or transcribe answers")
+    parser.add_argument("--stream", action="store_true", help="use the SSE question and summary endpoints")
+    parser.add_argument("--poll-ms", type=float, default=50.0, help="transcription status poll interval")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-request timeout in seconds")
+    parser.add_argument("--ready-timeout", type=float, default=600.0, help="how long to wait for /readyz")
+    parser.add_argument("--workdir", default=None, help="app working directory (default: a fresh temp dir)")
+    parser.add_argument("--output", default=None, help="results file (default: benchmarks/results/...)")
+    args = parser.parse_args(argv)
+
+    mock = None
+    openai_url = args.openai_url
+    if openai_url is None:
+        mock = MockOpenAI(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, tokens_per_s=args.tokens_per_s,
+                          error_rate=args.error_rate, seed=0).start()
+        openai_url = mock.base_url
+        print(f"Mock OpenAI API on {openai_url}", file=sys.stderr)
+
+    base_url = args.url
+    if base_url is None:
+        os.environ["OPENAI_BASE_URL"] = openai_url
+        os.environ.setdefault("OPENAI_API_KEY", "mock")
+        base_url = start_local_app(args.workdir or tempfile.mkdtemp(prefix="interview-bench-"))
+    if not wait_until_ready(base_url, args.ready_timeout):
+        print(f"{base_url} did not become ready", file=sys.stderr)
+        return 1
+
+    fixtures = load_fixtures(args)
+    recorder = Recorder()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda _: run_interview(base_url, fixtures, recorder, args), range(args.users)))
+    wall_s = time.perf_counter() - started
+
+    completed = sum(1 for ok in results if ok)
+    endpoints = recorder.report(wall_s)
+    report = {
+        "benchmark": "interview_flow",
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": git_commit(),
+        "settings": vars(args),
+        "real_face": fixtures["face"][3],
+        "wall_s": round(wall_s, 2),
+        "interviews": {
+            "started": args.users,
+            "completed": completed,
+            "per_minute": round(completed / wall_s * 60, 2) if wall_s else None,
+        },
+        "endpoints": endpoints,
+        "mock_llm_calls": mock.calls if mock is not None else None,
+        "server_stats": server_stats(base_url),
+    }
+
+    output = args.output or os.path.join(BENCH_DIR, "results", f"interview_flow-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_table(endpoints)
+    print(f"{completed}/{args.users} interviews completed in {wall_s:.1f}s; results written to {output}", file=sys.stderr)
+    if mock is not None:
+        mock.stop()
+    return 0 if completed == args.users else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Local stand-in for the OpenAI Chat Completions API.
+
+    python benchmarks/mock_openai.py --port 8089 --latency-ms 800 --tokens-per-s 60
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=mock python main.py
+
+Replies come from fixtures/responses.json: the first rule whose `match`
+string appears in the request's messages wins (an empty match is the
+fallback). `content` may be a string or a JSON value, which is sent
+serialized. Every call waits `latency_ms` (+/- `jitter_ms`) before the
+first byte; streamed replies then arrive at roughly `tokens_per_s`, four
+characters per token, like the real API. Usage is estimated the same way.
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CHARS_PER_TOKEN = 4
+
+
+def load_rules(path=None):
+    with open(path or os.path.join(FIXTURES_DIR, "responses.json"), "r", encoding="utf-8") as f:
+        rules = json.load(f)
+    for rule in rules:
+        if not isinstance(rule["content"], str):
+            rule["content"] = json.dumps(rule["content"])
+    return rules
+
+
+def _tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class MockOpenAI:
+    """A threaded HTTP server answering /v1/chat/completions from canned rules."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=500.0, jitter_ms=100.0,
+                 tokens_per_s=60.0, error_rate=0.0, rules=None, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tokens_per_s = tokens_per_s
+        self.error_rate = error_rate
+        self.rules = rules if rules is not None else load_rules()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-openai", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reply_for(self, messages):
+        text = "\n".join(str(message.get("content", "")) for message in messages)
+        for rule in self.rules:
+            if rule["match"] in text:
+                return rule["match"], rule["content"]
+        raise LookupError("no fixture matches the request")
+
+    def _delay(self):
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            fail = self._random.random() < self.error_rate
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+        return fail
+
+    def _count(self, match):
+        with self._lock:
+            self.calls[match or "<default>"] = self.calls.get(match or "<default>", 0) + 1
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_chunk(self, data):
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+                    return
+                messages = body.get("messages", [])
+                try:
+                    match, content = mock.reply_for(messages)
+                except LookupError as e:
+                    self._send_json(400, {"error": {"message": str(e)}})
+                    return
+                mock._count(match)
+                if mock._delay():
+                    self._send_json(500, {"error": {"message": "injected failure", "type": "server_error"}})
+                    return
+
+                prompt_tokens = sum(_tokens(str(m.get("content", ""))) for m in messages)
+                completion_tokens = _tokens(content)
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                         "total_tokens": prompt_tokens + completion_tokens}
+                base = {"id": "chatcmpl-mock", "created": int(time.time()), "model": body.get("model", "mock")}
+                if body.get("stream"):
+                    self._stream(base, content, usage, (body.get("stream_options") or {}).get("include_usage"))
+                else:
+                    self._send_json(200, dict(base, object="chat.completion", usage=usage, choices=[{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }]))
+
+            def _stream(self, base, content, usage, include_usage):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def event(choices, **extra):
+                    chunk = dict(base, object="chat.completion.chunk", choices=choices, **extra)
+                    self._send_chunk(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+
+                interval = 1.0 / mock.tokens_per_s if mock.tokens_per_s > 0 else 0.0
+                for start in range(0, len(content), CHARS_PER_TOKEN):
+                    event([{"index": 0, "delta": {"content": content[start:start + CHARS_PER_TOKEN]},
+                            "finish_reason": None}])
+                    if interval:
+                        time.sleep(interval)
+                event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+                if include_usage:
+                    event([], usage=usage)
+                self._send_chunk(b"data: [DONE]\n\n")
+                self._send_chunk(b"")
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="delay before the first byte")
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--tokens-per-s", type=float, default=60.0, help="streaming speed (0 = all at once)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls answered with a 500")
+    parser.add_argument("--responses", default=None, help="rules file (default: fixtures/responses.json)")
+    args = parser.parse_args(argv)
+
+    mock = MockOpenAI(args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                      tokens_per_s=args.tokens_per_s, error_rate=args.error_rate, rules=load_rules(args.responses))
+    print(f"Mock OpenAI API on {mock.base_url}")
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Production server settings:
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Requests run on gthread workers: LLM calls, uploads and SSE streams are
+I/O-bound and release the GIL while they wait, so one process serves many
+of them on threads. Whisper and MTCNN/FaceNet run in their own worker
+processes (see `process_pools` in interview_app/config.yaml), and PDF
+extraction in the documents pool, so inference never competes with
+request threads for the GIL.
+
+Interview state that lives in memory (grading, transcription jobs,
+prefetched questions) belongs to one process, so keep WEB_CONCURRENCY at 1
+and scale with GUNICORN_THREADS and the pool sizes.
+"""
+import os
+
+bind = os.getenv("BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "32"))
+
+# Long answers upload and summaries stream for a while; gthread workers still heartbeat meanwhile
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+
+# Each worker imports the app itself: the app starts threads and forks its
+# inference pools at import, and neither survives being forked from a preloaded master
+preload_app = False
+
+# Turns on process_pools.enabled: null in config.yaml
+os.environ.setdefault("INTERVIEW_PROCESS_POOLS", "1")
+
+accesslog = "-"
+errorlog = "-"
@@ -1,19 +1,25 @@
 import os
 from flask import Flask
-from flask_session import Session
 from flask_cors import CORS
 from datetime import timedelta
 
+from interview_app.config import get_section
+from interview_app.session_store import CompactSessionInterface
+from interview_app.metrics import metrics, ServerTimingMiddleware
+
 app = Flask(__name__)
 app.secret_key = os.urandom(24)
-app.config['SESSION_TYPE'] = 'filesystem'
 app.config['SESSION_PERMANENT'] = True
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(minutes=50)
 app.config['MAX_CONTENT_LENGTH'] = 200 * 1024 * 1024  # 200 MB upload limit
 
-Session(app)
+# Small mutable state per session; resume/JD/syllabus stored once by content hash
+app.session_interface = CompactSessionInterface.from_config(get_section('session_store'))
 CORS(app)
 
+# Stage timings of each request are returned in a Server-Timing header
+app.wsgi_app = ServerTimingMiddleware(app.wsgi_app, metrics)
+
 # ...existing configuration code (e.g. directory creation)...
 BASE_DIR = os.getcwd()
 UPLOADS_DIR = os.path.join(BASE_DIR, "uploads")
@@ -0,0 +1,191 @@
+import io
+
+import av
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# MediaRecorder MIME types -> FFmpeg demuxer names, so the container isn't probed
+MIME_FORMATS = {
+    "audio/webm": "webm",
+    "video/webm": "webm",
+    "audio/ogg": "ogg",
+    "audio/mp4": "mp4",
+    "video/mp4": "mp4",
+    "audio/mpeg": "mp3",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+}
+
+# Demuxing can restart at these byte patterns (a Matroska cluster, an Ogg page)
+# once the container header is prepended, so a growing recording needn't be re-read
+# from byte 0. The count is how many sync points before the last decoded packet's to
+# restart at: Ogg only timestamps packets from the second page read.
+SYNC_MARKERS = {
+    "webm": (b"\x1f\x43\xb6\x75", 0),
+    "matroska": (b"\x1f\x43\xb6\x75", 0),
+    "ogg": (b"OggS", 1),
+}
+
+
+class ResyncFailed(Exception):
+    """Demuxing from `resume_offset` didn't pick up where the last pass ended; decode from byte 0."""
+
+
+def format_from_mime(mime_type):
+    """FFmpeg format name for a MIME type such as 'audio/webm;codecs=opus', or None."""
+    if not mime_type:
+        return None
+    return MIME_FORMATS.get(mime_type.split(";")[0].strip().lower())
+
+
+def _audio_packets(container):
+    """Demux the audio packets of an open container, stopping at a truncated tail."""
+    stream = container.streams.audio[0]
+    packets = []
+    try:
+        for packet in container.demux(stream):
+            if packet.size and packet.pts is not None:
+                packets.append(packet)
+    except (av.error.InvalidDataError, av.error.EOFError):
+        pass
+    return packets
+
+
+class IncrementalDecoder:
+    """
+    Decodes a recording that grows chunk by chunk into 16 kHz mono float32.
+
+    `decode` is given the bytes from `resume_offset` on. For WebM and Ogg
+    that is the cluster or page holding the last decoded packet, demuxed
+    behind a copy of the container header, so a pass costs the new bytes
+    rather than the whole recording; other formats are always demuxed from
+    byte 0. Only packets after the last decoded one are run through the
+    codec, with one packet before them to prime the decoder; the primer's
+    output is dropped. Until `final`, the last packet is held back in case
+    the chunk boundary cut it short. `drop` releases samples the caller is
+    done with.
+    """
+
+    def __init__(self, format_hint=None, sampling_rate=SAMPLE_RATE):
+        self.format_hint = format_hint
+        self.sampling_rate = sampling_rate
+        self._chunks = []
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._last_pts = None
+        self._last_pos = None
+        self._sync, self._sync_back = SYNC_MARKERS.get(format_hint, (None, 0))
+        self._header = None
+        self.resume_offset = 0
+
+    def _resample(self, frames):
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=self.sampling_rate)
+        out = []
+        for frame in frames + [None]:
+            if frame is not None:
+                frame.pts = None
+            for resampled in resampler.resample(frame):
+                out.append(resampled.to_ndarray().reshape(-1))
+        return np.concatenate(out) if out else np.zeros(0, dtype=np.float32)
+
+    def decode(self, data, final=False, start=0):
+        """
+        Decode the packets not seen yet; `data` holds the recording from byte
+        `start` (0 or `resume_offset`). Returns the number of new samples.
+        """
+        prefix = self._header if start else b""
+        blob = prefix + data if start else data
+        try:
+            # Packets are decoded by the container's codec context, so keep it open until done
+            container = av.open(io.BytesIO(blob), mode="r", format=self.format_hint)
+        except Exception:
+            if start:
+                self._disable_resume()
+                raise ResyncFailed()
+            raise
+        try:
+            packets = _audio_packets(container)
+            if start and (not packets or packets[0].pts > self._last_pts):
+                # The last decoded packet isn't there to continue from
+                self._disable_resume()
+                raise ResyncFailed()
+            new_samples = self._decode_packets(packets, final)
+        finally:
+            container.close()
+        if self._sync is not None and packets:
+            self._advance_resume(blob, len(prefix), start, packets[0].pos)
+        return new_samples
+
+    def _disable_resume(self):
+        self._sync = None
+        self.resume_offset = 0
+
+    def _advance_resume(self, blob, prefix_len, start, first_pos):
+        if self._header is None:
+            first = blob.rfind(self._sync, 0, max(0, first_pos) + len(self._sync))
+            if first <= 0:
+                self._disable_resume()
+                return
+            self._header = bytes(blob[:first])
+        if self._last_pos is None or self._last_pos < 0:
+            return
+        # The next pass primes the codec with the last decoded packet, so it starts at (or before) its cluster/page
+        low = max(prefix_len, len(self._header))
+        marker = blob.rfind(self._sync, low, self._last_pos + len(self._sync))
+        for _ in range(self._sync_back):
+            if marker < 0:
+                break
+            marker = blob.rfind(self._sync, low, marker)
+        if marker >= 0:
+            self.resume_offset = start + marker - prefix_len
+
+    def _decode_packets(self, packets, final):
+        if not final and packets:
+            packets = packets[:-1]
+
+        start = 0
+        if self._last_pts is not None:
+            start = next((i for i, packet in enumerate(packets) if packet.pts > self._last_pts), len(packets))
+        if start >= len(packets):
+            return 0
+
+        primer = max(0, start - 1) if start else 0
+        primer_frames, frames = [], []
+        for index in range(primer, len(packets)):
+            decoded = packets[index].decode()
+            (frames if index >= start else primer_frames).extend(decoded)
+
+        audio = self._resample(primer_frames + frames)
+        if primer_frames:
+            native_rate = primer_frames[0].sample_rate
+            primer_samples = sum(frame.samples for frame in primer_frames)
+            audio = audio[int(round(primer_samples * self.sampling_rate / native_rate)):]
+
+        self._last_pts = packets[-1].pts
+        self._last_pos = packets[-1].pos
+        if audio.size:
+            self._chunks.append(audio.astype(np.float32, copy=False))
+            self._audio = None
+        return int(audio.size)
+
+    def audio(self):
+        """All samples decoded so far, less those released with `drop`."""
+        if self._audio is None:
+            self._audio = np.concatenate(self._chunks) if self._chunks else np.zeros(0, dtype=np.float32)
+            self._chunks = [self._audio]
+        return self._audio
+
+    def drop(self, count):
+        """Release the first `count` samples of `audio()`."""
+        if count <= 0:
+            return
+        self._audio = self.audio()[count:].copy()
+        self._chunks = [self._audio]
+
+
+def decode_bytes(data, format_hint=None, sampling_rate=SAMPLE_RATE):
+    """Decode a complete in-memory recording to mono float32 at `sampling_rate`."""
+    decoder = IncrementalDecoder(format_hint, sampling_rate)
+    decoder.decode(data, final=True)
+    return decoder.audio()
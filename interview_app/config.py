@@ -0,0 +1,17 @@
+import os
+import yaml
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.yaml")
+
+
+def load_config(path=CONFIG_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
+config = load_config()
+
+
+def get_section(name):
+    """Return a config section as a dict (empty if missing)."""
+    return config.get(name) or {}
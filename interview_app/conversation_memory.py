@@ -0,0 +1,112 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class _Conversation:
+    __slots__ = ("summary", "turns", "folding")
+
+    def __init__(self):
+        self.summary = ""
+        self.turns = []
+        self.folding = False
+
+
+class ConversationMemory:
+    """
+    Bounded per-session memory of the interview for question generation.
+
+    The last `max_turns` question/answer pairs are kept verbatim; older ones
+    are folded into a rolling summary by `summarize(summary, turns)` on a
+    background thread, so a turn never waits for it. Until a fold lands the
+    overflow turns are still sent, capped at `max_pending` of them, which
+    keeps the prompt bounded however long the interview runs.
+    """
+
+    def __init__(self, summarize, max_turns=4, max_pending=4, max_sessions=1024):
+        self.summarize = summarize
+        self.max_turns = max_turns
+        self.max_pending = max_pending
+        self.max_sessions = max_sessions
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="memory-fold")
+        self._conversations = OrderedDict()
+        self._lock = threading.Lock()
+        self.folds = 0
+        self.failed_folds = 0
+
+    def _conversation(self, session_id):
+        conversation = self._conversations.get(session_id)
+        if conversation is None:
+            conversation = self._conversations[session_id] = _Conversation()
+            while len(self._conversations) > self.max_sessions:
+                self._conversations.popitem(last=False)
+        self._conversations.move_to_end(session_id)
+        return conversation
+
+    def add_turn(self, session_id, topic, question, answer):
+        with self._lock:
+            conversation = self._conversation(session_id)
+            conversation.turns.append({"topic": topic, "question": question, "answer": answer})
+            self._schedule_fold(session_id, conversation)
+
+    def _schedule_fold(self, session_id, conversation):
+        if conversation.folding or len(conversation.turns) <= self.max_turns:
+            return
+        conversation.folding = True
+        overflow = conversation.turns[:len(conversation.turns) - self.max_turns]
+        self._executor.submit(self._fold, session_id, conversation, conversation.summary, overflow)
+
+    def _fold(self, session_id, conversation, summary, overflow):
+        try:
+            summary = self.summarize(summary, overflow)
+        except Exception:
+            logger.exception("Conversation summary failed for %s", session_id)
+            with self._lock:
+                self.failed_folds += 1
+                conversation.folding = False
+            return
+        with self._lock:
+            conversation.summary = summary
+            # Turns added meanwhile are after the folded ones, so drop from the front
+            del conversation.turns[:len(overflow)]
+            conversation.folding = False
+            self.folds += 1
+            self._schedule_fold(session_id, conversation)
+
+    def messages(self, session_id, pending=None):
+        """
+        Chat messages for the conversation so far: the summary, then recent
+        turns. `pending` is a (question, answer) turn not added yet, sent last.
+        """
+        with self._lock:
+            conversation = self._conversations.get(session_id)
+            summary = conversation.summary if conversation is not None else ""
+            turns = conversation.turns[-(self.max_turns + self.max_pending):] if conversation is not None else []
+
+        if pending is not None:
+            turns = turns + [{"question": pending[0], "answer": pending[1]}]
+        messages = []
+        if summary:
+            messages.append({"role": "system", "content": f"Summary of the interview so far:\n{summary}"})
+        for turn in turns:
+            messages.append({"role": "assistant", "content": turn["question"]})
+            messages.append({"role": "user", "content": turn["answer"]})
+        return messages
+
+    def discard(self, session_id):
+        with self._lock:
+            self._conversations.pop(session_id, None)
+
+    def stats(self):
+        with self._lock:
+            conversations = list(self._conversations.values())
+            return {
+                "sessions": len(conversations),
+                "folds": self.folds,
+                "failed_folds": self.failed_folds,
+                "max_turns_held": max((len(c.turns) for c in conversations), default=0),
+                "max_summary_chars": max((len(c.summary) for c in conversations), default=0),
+            }
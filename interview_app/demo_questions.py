@@ -1,6 +1,10 @@
 import os
-from openai import OpenAI
+from interview_app.llm_cache import cached
+from interview_app.llm_gateway import gateway
 
+MODEL = "gpt-4o-mini"
+
+@cached("demo_questions", MODEL)
 def demo_question_gpt(selected_board: str, selected_subject: str, extracted_jd: str, selected_grade: str, syllabus: str, API_KEY_OPEN_AI: str):
     prompt = [{
         "role": "system",
@@ -14,9 +18,10 @@ def demo_question_gpt(selected_board: str, selected_subject: str, extracted_jd:
         "role": "user",
         "content": f"Generate 10 questions for a teacher interview based on: {extracted_jd}"
     }]
-    openai_client = OpenAI(api_key=API_KEY_OPEN_AI)
-    response = openai_client.chat.completions.create(
-        model="gpt-4o-mini",
+    response = gateway.chat_completion(
+        "demo_question_gpt",
+        API_KEY_OPEN_AI,
+        model=MODEL,
         messages=prompt,
         temperature=0.7
     )
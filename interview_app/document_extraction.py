@@ -0,0 +1,250 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from docx import Document
+from PyPDF2 import PdfReader
+
+from interview_app.config import get_section
+from interview_app.inference_pool import launch_workers
+
+# Bump when extraction output changes so old cache entries are ignored
+EXTRACTOR_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentTooLarge(ValueError):
+    pass
+
+
+def _pdf_page_count(path):
+    return len(PdfReader(path).pages)
+
+
+def _pdf_pages(path, start, end):
+    """Text of pages [start, end); runs in a worker process."""
+    pages = PdfReader(path).pages
+    return [(pages[index].extract_text() or "") for index in range(start, end)]
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DocumentExtractor:
+    """
+    Text extraction for uploaded resumes and job descriptions.
+
+    Documents are keyed by a hash of their bytes, so a JD uploaded for every
+    candidate is parsed once; pages are cached in memory and as JSON files
+    under `cache_dir`. PDFs are split into ranges of `pages_per_task` pages
+    that are extracted in parallel in a process pool and yielded in order as
+    they finish. Files over `max_bytes` are rejected and only the first
+    `max_pages` pages are read; pages not ready by `deadline_s` are left
+    out (logged, counted in `stats()` and not cached).
+
+    The process pool is forked by `fork()` and `start()`, which should run
+    at startup before the app has started any threads (see `start_pools`).
+    """
+
+    def __init__(self, cache_dir, max_workers=0, pages_per_task=4, max_pages=50,
+                 max_bytes=10 * 1024 * 1024, deadline_s=30.0, max_entries=256, processes=True):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.pages_per_task = max(1, pages_per_task)
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.deadline_s = deadline_s
+        self.max_entries = max_entries
+        self.processes = processes
+        self._memory = OrderedDict()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.truncated = 0
+        self.deadline_misses = 0
+        self.total_ms = 0.0
+
+    @classmethod
+    def from_config(cls, settings):
+        return cls(
+            settings.get('cache_dir') or os.path.join(os.getcwd(), "cache", "documents"),
+            max_workers=int(settings.get('workers', 0)),
+            pages_per_task=int(settings.get('pages_per_task', 4)),
+            max_pages=int(settings.get('max_pages', 50)),
+            max_bytes=int(float(settings.get('max_mb', 10)) * 1024 * 1024),
+            deadline_s=float(settings.get('deadline_s', 30)),
+            processes=settings.get('processes', True),
+        )
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                if self.processes:
+                    # fork: workers start without re-importing the Flask app
+                    context = multiprocessing.get_context("fork") if os.name == "posix" else None
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="documents")
+            return self._executor
+
+    def fork(self):
+        """Fork the extraction processes without starting the executor's manager thread."""
+        pool = self._pool()
+        if self.processes:
+            launch_workers(pool)
+
+    def start(self):
+        """Fork the extraction processes now (e.g. at startup) instead of on the first large PDF."""
+        pool = self._pool()
+        if self.processes:
+            # Submitting a task is what launches the workers
+            pool.submit(os.getpid).result()
+
+    # -- cache ----------------------------------------------------------
+    def _cache_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _cached(self, key):
+        with self._lock:
+            pages = self._memory.get(key)
+            if pages is not None:
+                self._memory.move_to_end(key)
+                return pages
+        try:
+            with open(self._cache_path(key), 'r', encoding='utf-8') as f:
+                pages = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        self._remember(key, pages)
+        return pages
+
+    def _remember(self, key, pages):
+        with self._lock:
+            self._memory[key] = pages
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _store(self, key, pages):
+        self._remember(key, pages)
+        # Created on the first write, so importing the module leaves the disk alone
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._cache_path(key) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(pages, f, ensure_ascii=False)
+        os.replace(tmp_path, self._cache_path(key))
+
+    # -- extraction -----------------------------------------------------
+    def _pdf_pages(self, path):
+        """Yield (page_text, complete) for each page, in order."""
+        count = _pdf_page_count(path)
+        if count > self.max_pages:
+            with self._lock:
+                self.truncated += 1
+            count = self.max_pages
+        if count <= self.pages_per_task:
+            # Not worth a round trip to the pool
+            for text in _pdf_pages(path, 0, count):
+                yield text, True
+            return
+
+        deadline = time.monotonic() + self.deadline_s
+        pool = self._pool()
+        futures = [
+            pool.submit(_pdf_pages, path, start, min(start + self.pages_per_task, count))
+            for start in range(0, count, self.pages_per_task)
+        ]
+        for index, future in enumerate(futures):
+            try:
+                pages = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                for pending in futures[index:]:
+                    pending.cancel()
+                logger.warning(
+                    "Extracted only %d of %d pages of %s: %r",
+                    index * self.pages_per_task, count, os.path.basename(path), e
+                )
+                yield None, False
+                return
+            for text in pages:
+                yield text, True
+
+    def _extract(self, path, extension):
+        if extension == 'txt':
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                yield f.read(), True
+        elif extension in ('doc', 'docx'):
+            doc = Document(path)
+            yield "\n".join(paragraph.text for paragraph in doc.paragraphs), True
+        elif extension == 'pdf':
+            yield from self._pdf_pages(path)
+        else:
+            raise ValueError(f"Unsupported file format: .{extension}")
+
+    def check_size(self, size, name):
+        """Raise DocumentTooLarge if a file of `size` bytes is over the limit."""
+        if size > self.max_bytes:
+            raise DocumentTooLarge(
+                f"{name} is {size / 1024 / 1024:.1f} MB; the limit is {self.max_bytes / 1024 / 1024:.0f} MB."
+            )
+
+    def iter_pages(self, path):
+        """Yield the document's text page by page (a single item for non-PDF files)."""
+        self.check_size(os.path.getsize(path), os.path.basename(path))
+        extension = path.rsplit('.', 1)[-1].lower()
+        key = f"{_file_digest(path)}-{extension}-{self.max_pages}-v{EXTRACTOR_VERSION}"
+
+        pages = self._cached(key)
+        if pages is not None:
+            with self._lock:
+                self.hits += 1
+            yield from pages
+            return
+
+        started = time.perf_counter()
+        pages = []
+        complete = True
+        for text, ok in self._extract(path, extension):
+            if not ok:
+                complete = False
+                break
+            pages.append(text)
+            yield text
+        with self._lock:
+            self.misses += 1
+            self.total_ms += (time.perf_counter() - started) * 1000
+        if complete:
+            self._store(key, pages)
+        else:
+            with self._lock:
+                self.deadline_misses += 1
+
+    def extract(self, path):
+        return "\n".join(self.iter_pages(path))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "truncated": self.truncated,
+                "deadline_misses": self.deadline_misses,
+                "avg_extract_ms": round(self.total_ms / self.misses, 1) if self.misses else 0.0,
+                "cached_in_memory": len(self._memory),
+            }
+
+
+document_extractor = DocumentExtractor.from_config(get_section('documents'))
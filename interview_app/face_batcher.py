@@ -0,0 +1,164 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from interview_app.face_preprocess import map_box
+from interview_app.metrics import timed
+from interview_app.inference_pool import worker_model
+
+
+def embed_batch(detector, embedder, items):
+    """
+    Run MTCNN once over the `detect_image`s of `items` (image, detect_image,
+    transform) and FaceNet once over the faces found. Returns (embedding,
+    box) of the first face per item, or (None, None).
+    """
+    # MTCNN accepts a list of images and returns one detection list per image
+    with timed("mtcnn_detect"):
+        detections = detector.detect_faces([detect_image for _, detect_image, _ in items])
+
+    results = [(None, None)] * len(items)
+    crops, owners = [], []
+    for index, ((image, _, transform), faces) in enumerate(zip(items, detections)):
+        if not faces:
+            continue
+        box = map_box(faces[0]['box'], transform)
+        x, y, w, h = box
+        crop = image[y:y+h, x:x+w]
+        if crop.size == 0:
+            continue
+        crops.append(crop)
+        owners.append((index, box))
+
+    if crops:
+        with timed("facenet_embed"):
+            embeddings = embedder.embeddings(crops)
+        for (index, box), embedding in zip(owners, embeddings):
+            results[index] = (embedding, box)
+    return results
+
+
+def load_face_models():
+    """MTCNN and FaceNet for one inference worker process."""
+    from mtcnn import MTCNN
+    from keras_facenet import FaceNet
+    return MTCNN(), FaceNet()
+
+
+def embed_batch_in_worker(items):
+    detector, embedder = worker_model('face')
+    return embed_batch(detector, embedder, items)
+
+
+class _FrameRequest:
+    __slots__ = ("image", "detect_image", "transform", "future")
+
+    def __init__(self, image, detect_image, transform):
+        self.image = image
+        self.detect_image = detect_image
+        self.transform = transform
+        self.future = Future()
+
+
+class FaceBatcher:
+    """
+    Micro-batching worker for live verification frames.
+
+    Requests from concurrent check_face calls are queued; a single worker
+    thread collects up to `batch_size` frames (waiting at most `max_wait_ms`
+    after the first one), runs MTCNN and FaceNet once for the whole batch and
+    resolves each caller's future with its own (embedding, box) pair, or
+    (None, None) if no face was found.
+
+    Detection can run on a smaller `detect_image` (see face_preprocess); the
+    box is mapped back with `transform` and the face is cropped from `image`.
+
+    `get_detector`/`get_embedder` return the MTCNN and FaceNet models and are
+    only called from the worker thread, so the models may load lazily. With
+    a `pool` (an InferencePool loaded by `load_face_models`) batches run in
+    its worker processes instead, one collecting thread per process.
+    """
+
+    def __init__(self, get_detector, get_embedder, batch_size=8, max_wait_ms=15, pool=None):
+        self.get_detector = get_detector
+        self.get_embedder = get_embedder
+        self.pool = pool
+        self.batch_size = max(1, int(batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = []
+        self.batches = 0
+        self.frames = 0
+        self.largest_batch = 0
+
+    def _ensure_worker(self):
+        with self._lock:
+            count = self.pool.workers if self.pool is not None else 1
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            while len(self._workers) < count:
+                worker = threading.Thread(target=self._run, name="face-batcher", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(self, rgb_frame, detect_image=None, transform=None):
+        if detect_image is None:
+            detect_image, transform = rgb_frame, (0, 0, 1.0)
+        request = _FrameRequest(rgb_frame, detect_image, transform)
+        self._ensure_worker()
+        self._queue.put(request)
+        return request.future
+
+    def embed(self, rgb_frame, detect_image=None, transform=None, timeout=None):
+        """Blocking helper: returns (embedding, box) of the first face, or (None, None)."""
+        return self.submit(rgb_frame, detect_image, transform).result(timeout=timeout)
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                self._process(batch)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _process(self, batch):
+        items = [(request.image, request.detect_image, request.transform) for request in batch]
+        if self.pool is not None:
+            results = self.pool.call(embed_batch_in_worker, items)
+        else:
+            results = embed_batch(self.get_detector(), self.get_embedder(), items)
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
+
+        with self._lock:
+            self.batches += 1
+            self.frames += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "frames": self.frames,
+                "avg_batch_size": round(self.frames / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "queued": self._queue.qsize(),
+                "batch_size": self.batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+            }
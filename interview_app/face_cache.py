@@ -0,0 +1,109 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from werkzeug.utils import secure_filename
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU of reference-face embeddings keyed by session id.
+    Every entry is also written to disk as a .npy file, so entries evicted
+    from memory (or lost on restart) are reloaded instead of recomputed.
+    The disk tier is bounded too: files older than `max_disk_age_s` and the
+    oldest beyond `max_disk_entries` are removed when new ones are written.
+    """
+
+    def __init__(self, cache_dir, max_entries=256, max_disk_entries=4096, max_disk_age_s=24 * 3600):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_age_s = max_disk_age_s
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_evictions = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{secure_filename(key)}.npy")
+
+    def _remember(self, key, embedding):
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return embedding
+
+        path = self._path(key)
+        if os.path.exists(path):
+            embedding = np.load(path)
+            with self._lock:
+                self._remember(key, embedding)
+                self.disk_hits += 1
+            return embedding
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, embedding):
+        embedding = np.asarray(embedding, dtype=np.float32)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        np.save(self._path(key), embedding)
+        with self._lock:
+            self._remember(key, embedding)
+        self._prune_disk()
+
+    def _prune_disk(self):
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".npy"):
+                try:
+                    files.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    pass
+        files.sort()
+        cutoff = time.time() - self.max_disk_age_s
+        excess = len(files) - self.max_disk_entries
+        removed = 0
+        for index, (mtime, path) in enumerate(files):
+            if mtime >= cutoff and index >= excess:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        if removed:
+            with self._lock:
+                self.disk_evictions += removed
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.memory_hits + self.disk_hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_evictions": self.disk_evictions,
+            }
@@ -0,0 +1,90 @@
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+# cv2 can decode JPEG/PNG straight to 1/2, 1/4 or 1/8 resolution,
+# which is much cheaper than decoding full size and resizing afterwards.
+_REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def decode_frame(data, reduction=2):
+    """Decode an uploaded frame at reduced resolution and return it as RGB (or None)."""
+    flag = _REDUCED_DECODE_FLAGS.get(int(reduction), cv2.IMREAD_COLOR)
+    frame = cv2.imdecode(np.frombuffer(data, np.uint8), flag)
+    if frame is None:
+        return None
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+def plan_detection(image, last_box=None, max_side=320, roi_margin=0.6):
+    """
+    Build the (small) image MTCNN should run on.
+
+    If the face was seen on a previous frame, only a region around that box is
+    searched. The region is then downscaled so its longest side is at most
+    `max_side`. Returns the detection image and the (x0, y0, scale) transform
+    needed by `map_box` to go back to `image` coordinates.
+    """
+    height, width = image.shape[:2]
+    x0, y0, x1, y1 = 0, 0, width, height
+
+    if last_box is not None:
+        x, y, w, h = last_box
+        pad_x, pad_y = int(w * roi_margin), int(h * roi_margin)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(width, x + w + pad_x), min(height, y + h + pad_y)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            x0, y0, x1, y1 = 0, 0, width, height
+
+    region = image[y0:y1, x0:x1]
+    longest = max(region.shape[:2])
+    scale = min(1.0, float(max_side) / longest) if longest else 1.0
+    if scale < 1.0:
+        region = cv2.resize(region, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return region, (x0, y0, scale)
+
+
+def map_box(box, transform):
+    """Map a box found on a detection image back to the source image."""
+    x0, y0, scale = transform
+    x, y, w, h = box
+    return (
+        int(round(x0 + max(0, x) / scale)),
+        int(round(y0 + max(0, y) / scale)),
+        int(round(w / scale)),
+        int(round(h / scale)),
+    )
+
+
+class FaceTracker:
+    """Bounded per-session memory of the last face box seen on a live frame."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._boxes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            box = self._boxes.get(key)
+            if box is not None:
+                self._boxes.move_to_end(key)
+            return box
+
+    def update(self, key, box):
+        with self._lock:
+            self._boxes[key] = box
+            self._boxes.move_to_end(key)
+            while len(self._boxes) > self.max_entries:
+                self._boxes.popitem(last=False)
+
+    def forget(self, key):
+        with self._lock:
+            self._boxes.pop(key, None)
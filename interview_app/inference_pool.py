@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from interview_app.metrics import metrics
+
+# What this worker process's loader returned, by pool name
+_worker_models = {}
+_startup_barrier = None
+
+
+def worker_model(name):
+    """The model(s) loaded in this worker process for pool `name`."""
+    return _worker_models[name]
+
+
+def _init_worker(name, loader, loader_args, barrier):
+    global _startup_barrier
+    _startup_barrier = barrier
+    _worker_models[name] = loader(*loader_args)
+
+
+def _ping():
+    # Held until every worker has taken one, so each worker answers exactly one ping
+    _startup_barrier.wait(timeout=600)
+    return os.getpid()
+
+
+def launch_workers(executor):
+    """Fork the workers of a fork-context ProcessPoolExecutor without starting its manager thread."""
+    # ProcessPoolExecutor has no public way to do this: the first submit forks
+    # the workers and then starts the thread that feeds them
+    with executor._shutdown_lock:
+        if executor._executor_manager_thread is None:
+            executor._launch_processes()
+
+
+def start_pools(*pools):
+    """
+    Fork the workers of every pool, then start them.
+
+    Each started executor runs a manager thread, and a process forked while
+    another thread holds a lock inherits it locked. So every pool forks
+    before any is started; `pools` are InferencePools or anything else with
+    `fork` and `start` (the DocumentExtractor).
+    """
+    for pool in pools:
+        pool.fork()
+    for pool in pools:
+        pool.start()
+
+
+def _run_task(fn, args, kwargs):
+    # Stages timed in the worker are sent back so the parent can record them
+    with metrics.collect() as timings:
+        result = fn(*args, **kwargs)
+    return result, timings
+
+
+class InferencePool:
+    """
+    Worker processes for one kind of CPU-bound inference.
+
+    Each worker is forked (where available, so the already imported
+    libraries are shared copy-on-write) and runs `loader(*loader_args)` once;
+    tasks then find the result with `worker_model(name)`. Inference runs
+    outside the web process, so it doesn't hold the GIL while requests wait
+    on I/O. The workers are forked at import, before the app starts its own
+    threads: `fork` forks them, `start` has each load its models (and starts
+    the executor's manager thread), and `warm` also waits for the loads.
+    Several pools are started together with `start_pools`.
+    """
+
+    def __init__(self, name, workers, loader, loader_args=()):
+        self.name = name
+        self.workers = max(1, int(workers))
+        self.loader = loader
+        self.loader_args = tuple(loader_args)
+        self._executor = None
+        self._startup = []
+        self._lock = threading.Lock()
+        self.tasks = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.pids = []
+
+    def _pool(self):
+        # Caller holds self._lock
+        if self._executor is None:
+            context = multiprocessing.get_context("fork" if os.name == "posix" else None)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context, initializer=_init_worker,
+                initargs=(self.name, self.loader, self.loader_args, context.Barrier(self.workers)),
+            )
+        return self._executor
+
+    def fork(self):
+        """Fork the worker processes without starting any thread."""
+        with self._lock:
+            launch_workers(self._pool())
+
+    def start(self):
+        with self._lock:
+            executor = self._pool()
+            if not self._startup:
+                # The first submit launches every worker not forked yet, so they fork now rather than mid-request
+                self._startup = [executor.submit(_ping) for _ in range(self.workers)]
+            return executor
+
+    def warm(self, timeout=None):
+        """Start the workers and wait until each has loaded its models."""
+        self.start()
+        self.pids = sorted({future.result(timeout=timeout) for future in self._startup})
+        return self
+
+    def call(self, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` in a worker and return its result (blocks the caller)."""
+        executor = self.start()
+        started = time.perf_counter()
+        try:
+            result, timings = executor.submit(_run_task, fn, args, kwargs).result()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        for stage, seconds in timings:
+            metrics.observe_stage(stage, seconds)
+        with self._lock:
+            self.tasks += 1
+            self.total_ms += (time.perf_counter() - started) * 1000
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pids": self.pids,
+                "tasks": self.tasks,
+                "failed": self.failed,
+                "avg_ms": round(self.total_ms / self.tasks, 1) if self.tasks else 0.0,
+            }
@@ -1,8 +1,11 @@
 import json
-from openai import OpenAI
+from interview_app.llm_cache import cached
+from interview_app.llm_gateway import gateway
 
+MODEL = "gpt-4o-mini"
+
+@cached("extract_key_points", MODEL)
 def extract_key_points(job_description: str, API_KEY_OPEN_AI: str):
-    client = OpenAI(api_key=API_KEY_OPEN_AI)
     prompty = f"""
         Extract the most relevant keywords from the following job description:
         {job_description}
@@ -21,8 +24,10 @@ def extract_key_points(job_description: str, API_KEY_OPEN_AI: str):
             "Other Requirements": ["Requirement 1"]
         }}
         """
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
+    response = gateway.chat_completion(
+        "extract_key_points",
+        API_KEY_OPEN_AI,
+        model=MODEL,
         messages=[
             {"role": "system", "content": "Extract key points from JD."},
             {"role": "user", "content": prompty}
@@ -31,11 +36,13 @@ def extract_key_points(job_description: str, API_KEY_OPEN_AI: str):
     res = response.choices[0].message.content.replace("```json", "").replace("```", "").strip()
     return json.loads(res)
 
+@cached("interview_related_topics", MODEL)
 def interview_related_topics(extracted_job_description: str, selected_board: str, selected_grade: str, 
                              subject_syllabus: str, API_KEY_OPEN_AI: str):
-    client = OpenAI(api_key=API_KEY_OPEN_AI)
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
+    response = gateway.chat_completion(
+        "interview_related_topics",
+        API_KEY_OPEN_AI,
+        model=MODEL,
         messages=[
             {"role": "user", "content": f"Extract interview topics from: {extracted_job_description}"},
             {"role": "system", "content": f"Return topics (max 3) with allocated minutes summing 4 based on syllabus: ```{subject_syllabus}```"}
@@ -44,11 +51,13 @@ def interview_related_topics(extracted_job_description: str, selected_board: str
     res = response.choices[0].message.content.replace("```json", "").replace("```", "").strip()
     return json.loads(res)
 
+@cached("subject_syllabus", MODEL)
 def get_subject_syllabus(extracted_job_description: str, selected_country: str, selected_board: str, 
                          selected_subject: str, selected_grade: str, API_KEY_OPEN_AI: str):
-    client = OpenAI(api_key=API_KEY_OPEN_AI)
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
+    response = gateway.chat_completion(
+        "get_subject_syllabus",
+        API_KEY_OPEN_AI,
+        model=MODEL,
         messages=[
             {"role": "user", "content": f"Syllabus for {selected_subject} for country {selected_country}, board {selected_board}, grade {selected_grade}:"},
             {"role": "system", "content": f"Use the extracted JD: {extracted_job_description}. Return syllabus only."}
@@ -0,0 +1,201 @@
+import json
+
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_LITERAL_END = set(',}] \t\r\n')
+
+
+class _Frame:
+    __slots__ = ("container", "path", "key", "state")
+
+    def __init__(self, container, path, state):
+        self.container = container
+        self.path = path
+        self.key = None
+        self.state = state
+
+    @property
+    def is_object(self):
+        return isinstance(self.container, dict)
+
+    def child_path(self):
+        return self.path + ((self.key,) if self.is_object else (len(self.container),))
+
+
+class IncrementalJSONParser:
+    """
+    Parses one JSON object that arrives in pieces, such as LLM tokens.
+
+    Anything before the first '{' (for example a ```json fence) and after the
+    closing '}' is ignored. `feed` returns a list of events:
+
+      ("delta", path, text)   new characters of a string value still arriving
+      ("value", path, value)  a value at `path` (scalar, object or array) is complete
+
+    `path` is a tuple of object keys / array indexes; the whole document is
+    reported as ("value", (), document) and also stored in `result`.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self._started = False
+        self.done = False
+        self.result = None
+        self._mode = None
+        self._literal = []
+        self._chars = []
+        self._delta_start = 0
+        self._is_key = False
+        self._escape = None
+        self._high_surrogate = None
+        self._events = []
+
+    def feed(self, text):
+        self._events = []
+        for char in text:
+            if self.done:
+                break
+            self._consume(char)
+        self._flush_delta()
+        return self._events
+
+    # -- events ---------------------------------------------------------
+    def _emit_value(self, path, value):
+        self._flush_delta()
+        self._events.append(("value", path, value))
+
+    def _flush_delta(self):
+        if self._mode == 'string' and not self._is_key and self._delta_start < len(self._chars):
+            path = self._stack[-1].child_path()
+            self._events.append(("delta", path, "".join(self._chars[self._delta_start:])))
+            self._delta_start = len(self._chars)
+
+    # -- characters -----------------------------------------------------
+    def _consume(self, char):
+        if not self._started:
+            if char == '{':
+                self._started = True
+                self._stack.append(_Frame({}, (), 'key'))
+            return
+
+        if self._mode == 'string':
+            self._consume_string(char)
+            return
+        if self._mode == 'literal':
+            if char not in _LITERAL_END:
+                self._literal.append(char)
+                return
+            self._mode = None
+            self._complete(json.loads("".join(self._literal)))
+
+        if char in ' \t\r\n':
+            return
+
+        frame = self._stack[-1]
+        if frame.is_object:
+            if frame.state == 'key':
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == '}':
+                    self._close()
+            elif frame.state == 'colon':
+                if char == ':':
+                    frame.state = 'value'
+            elif frame.state == 'value':
+                self._start_value(char)
+            elif frame.state == 'comma':
+                if char == ',':
+                    frame.state = 'key'
+                elif char == '}':
+                    self._close()
+        else:
+            if frame.state == 'value':
+                if char == ']':
+                    self._close()
+                else:
+                    self._start_value(char)
+            elif frame.state == 'comma':
+                if char == ',':
+                    frame.state = 'value'
+                elif char == ']':
+                    self._close()
+
+    def _start_value(self, char):
+        frame = self._stack[-1]
+        if char == '"':
+            self._start_string(is_key=False)
+        elif char == '{':
+            self._stack.append(_Frame({}, frame.child_path(), 'key'))
+        elif char == '[':
+            self._stack.append(_Frame([], frame.child_path(), 'value'))
+        else:
+            self._mode = 'literal'
+            self._literal = [char]
+
+    def _start_string(self, is_key):
+        self._mode = 'string'
+        self._is_key = is_key
+        self._chars = []
+        self._delta_start = 0
+        self._escape = None
+
+    def _append_char(self, char):
+        if self._high_surrogate is not None:
+            pending, self._high_surrogate = self._high_surrogate, None
+            if 0xDC00 <= ord(char) <= 0xDFFF:
+                char = chr(0x10000 + ((ord(pending) - 0xD800) << 10) + (ord(char) - 0xDC00))
+            else:
+                self._chars.append(pending)
+        if 0xD800 <= ord(char) <= 0xDBFF:
+            self._high_surrogate = char
+            return
+        self._chars.append(char)
+
+    def _consume_string(self, char):
+        if self._escape is not None:
+            if self._escape == '' and char != 'u':
+                self._escape = None
+                self._append_char(_ESCAPES.get(char, char))
+                return
+            self._escape += char
+            if len(self._escape) == 5:
+                code, self._escape = self._escape[1:], None
+                self._append_char(chr(int(code, 16)))
+            return
+
+        if char == '\\':
+            self._escape = ''
+        elif char == '"':
+            if self._high_surrogate is not None:
+                self._chars.append(self._high_surrogate)
+                self._high_surrogate = None
+            self._flush_delta()
+            self._mode = None
+            value = "".join(self._chars)
+            if self._is_key:
+                frame = self._stack[-1]
+                frame.key = value
+                frame.state = 'colon'
+            else:
+                self._complete(value)
+        else:
+            self._append_char(char)
+
+    # -- structure ------------------------------------------------------
+    def _complete(self, value):
+        frame = self._stack[-1]
+        path = frame.child_path()
+        if frame.is_object:
+            frame.container[frame.key] = value
+        else:
+            frame.container.append(value)
+        frame.state = 'comma'
+        self._emit_value(path, value)
+
+    def _close(self):
+        frame = self._stack.pop()
+        if self._stack:
+            self._complete(frame.container)
+        else:
+            self.done = True
+            self.result = frame.container
+            self._emit_value((), frame.container)
@@ -0,0 +1,157 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from interview_app.config import get_section
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(value):
+    """Normalize inputs so cosmetic differences (whitespace, key order) hash the same."""
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    if isinstance(value, dict):
+        return {str(key).strip(): normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return value
+
+
+def make_key(namespace, model, inputs):
+    payload = json.dumps(
+        {"namespace": namespace, "model": model, "inputs": normalize(inputs)},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """
+    SQLite-backed cache of LLM results keyed by a hash of the normalized inputs.
+
+    Entries expire after `ttl_seconds`; once more than `max_entries` are
+    stored the least recently used ones are evicted. SQLite in WAL mode lets
+    several worker processes share the same cache file. The file (and its
+    directory) is opened on first use, so importing the module creates
+    nothing and a forked process never inherits an open connection.
+    """
+
+    def __init__(self, path, ttl_seconds=7 * 24 * 3600, max_entries=5000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        # Called with self._lock held
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, namespace TEXT, value TEXT,"
+                " created_at REAL, accessed_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key):
+        """Return (found, value)."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT value, created_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                return False, None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return True, json.loads(row[0])
+
+    def set(self, key, namespace, value):
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, namespace, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, namespace, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,))
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def stats(self):
+        with self._lock:
+            entries = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+_settings = get_section('llm_cache')
+llm_cache = None
+if _settings.get('enabled', True):
+    llm_cache = LLMCache(
+        _settings.get('path') or os.path.join(os.getcwd(), "cache", "llm_cache.sqlite3"),
+        ttl_seconds=float(_settings.get('ttl_hours', 168)) * 3600,
+        max_entries=int(_settings.get('max_entries', 5000)),
+    )
+
+
+def cached(namespace, model, ignore=('API_KEY_OPEN_AI',)):
+    """
+    Cache a function's JSON-serialisable result on its (normalized) arguments
+    plus the model name. Arguments listed in `ignore` are not part of the key.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if llm_cache is None:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            inputs = {name: value for name, value in bound.arguments.items() if name not in ignore}
+            key = make_key(namespace, model, inputs)
+
+            found, value = llm_cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            llm_cache.set(key, namespace, value)
+            return value
+
+        return wrapper
+    return decorator
@@ -0,0 +1,226 @@
+import os
+import random
+import threading
+import time
+
+import httpx
+from openai import OpenAI, APIConnectionError, RateLimitError, InternalServerError
+
+from interview_app.config import get_section
+from interview_app.metrics import metrics
+
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+llm_tokens = metrics.counter("interview_llm_tokens_total", "Tokens used by LLM calls, per helper.", ("helper", "kind"))
+llm_errors = metrics.counter("interview_llm_errors_total", "LLM calls that failed after retries, per helper.", ("helper",))
+llm_retries = metrics.counter("interview_llm_retries_total", "Retried LLM requests, per helper.", ("helper",))
+llm_first_token = metrics.histogram("interview_llm_first_token_seconds", "Time to first token of streamed LLM calls.",
+                                    ("helper",))
+
+
+def _cached_tokens(usage):
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", 0) or 0
+
+
+class _CallStats:
+    __slots__ = ("calls", "errors", "retries", "total_ms", "max_ms", "prompt_tokens", "completion_tokens",
+                 "streams", "total_first_token_ms", "cached_tokens")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.streams = 0
+        self.total_first_token_ms = 0.0
+        # Prompt tokens served from the provider's prompt cache
+        self.cached_tokens = 0
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "avg_first_token_ms": round(self.total_first_token_ms / self.streams, 1) if self.streams else None,
+        }
+
+
+class LLMGateway:
+    """
+    Process-wide access point for OpenAI chat completions.
+
+    All clients share one keep-alive httpx connection pool. Calls are limited
+    to `max_concurrency` in flight, retried on connection errors, 429s and
+    5xx with jittered exponential backoff, and their latency and token usage
+    are recorded per helper name. `base_url` lets a local stub server stand
+    in for the OpenAI API.
+    """
+
+    def __init__(self, base_url=None, max_connections=20, max_keepalive_connections=10,
+                 keepalive_expiry_s=30.0, timeout_s=60.0, connect_timeout_s=5.0,
+                 max_concurrency=16, max_retries=3, backoff_base_s=0.5, backoff_max_s=8.0):
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.timeout = httpx.Timeout(timeout_s, connect=connect_timeout_s)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base_s
+        self.backoff_max = backoff_max_s
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self._http = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._clients = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, settings):
+        keys = (
+            "base_url", "max_connections", "max_keepalive_connections", "keepalive_expiry_s",
+            "timeout_s", "connect_timeout_s", "max_concurrency", "max_retries",
+            "backoff_base_s", "backoff_max_s",
+        )
+        return cls(**{key: settings[key] for key in keys if settings.get(key) is not None})
+
+    def client(self, api_key):
+        with self._lock:
+            if self._http is None:
+                # Opened on first use, so the gateway built at import holds nothing the pools' forks inherit
+                self._http = httpx.Client(limits=self._limits, timeout=self.timeout)
+            client = self._clients.get(api_key)
+            if client is None:
+                # Retries are handled here so they can be jittered and counted
+                client = OpenAI(api_key=api_key, base_url=self.base_url, http_client=self._http,
+                                timeout=self.timeout, max_retries=0)
+                self._clients[api_key] = client
+            return client
+
+    def _backoff(self, attempt):
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _create(self, name, client, kwargs):
+        """Issue the request, retrying retryable errors. Returns (response, started)."""
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                return client.chat.completions.create(**kwargs), started
+            except RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    self.record(name, (time.perf_counter() - started) * 1000, error=True)
+                    raise
+                self.record_retry(name)
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+            except Exception:
+                self.record(name, (time.perf_counter() - started) * 1000, error=True)
+                raise
+
+    def chat_completion(self, name, api_key, **kwargs):
+        """`chat.completions.create(**kwargs)` with pooling, retries and stats under `name`."""
+        client = self.client(api_key)
+        with self._slots:
+            response, started = self._create(name, client, kwargs)
+            usage = getattr(response, "usage", None)
+            self.record(
+                name,
+                (time.perf_counter() - started) * 1000,
+                prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+                completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+                cached_tokens=_cached_tokens(usage),
+            )
+            return response
+
+    def stream_chat_completion(self, name, api_key, **kwargs):
+        """
+        Streaming variant of `chat_completion`: yields content deltas as they
+        arrive. Only the initial request is retried; time to first token is
+        recorded alongside the usual stats.
+
+        The concurrency slot is held until the stream ends or the generator
+        is closed; callers that may stop early (e.g. a client disconnecting
+        from an SSE response) should close() it.
+        """
+        client = self.client(api_key)
+        kwargs.update(stream=True, stream_options={"include_usage": True})
+        self._slots.acquire()
+        try:
+            stream, started = self._create(name, client, kwargs)
+            first_token_ms = None
+            prompt_tokens = completion_tokens = cached_tokens = 0
+            try:
+                for chunk in stream:
+                    if chunk.usage is not None:
+                        prompt_tokens = chunk.usage.prompt_tokens or 0
+                        completion_tokens = chunk.usage.completion_tokens or 0
+                        cached_tokens = _cached_tokens(chunk.usage)
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if first_token_ms is None:
+                            first_token_ms = (time.perf_counter() - started) * 1000
+                        yield delta
+            except Exception:
+                self.record(name, (time.perf_counter() - started) * 1000, error=True)
+                raise
+            finally:
+                stream.close()
+            self.record(name, (time.perf_counter() - started) * 1000,
+                        prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                        cached_tokens=cached_tokens, first_token_ms=first_token_ms)
+        finally:
+            self._slots.release()
+
+    def _entry(self, name):
+        entry = self._stats.get(name)
+        if entry is None:
+            entry = self._stats[name] = _CallStats()
+        return entry
+
+    def record(self, name, elapsed_ms, prompt_tokens=0, completion_tokens=0, error=False, first_token_ms=None,
+               cached_tokens=0):
+        with self._lock:
+            entry = self._entry(name)
+            if first_token_ms is not None:
+                entry.streams += 1
+                entry.total_first_token_ms += first_token_ms
+            entry.calls += 1
+            entry.errors += int(error)
+            entry.total_ms += elapsed_ms
+            entry.max_ms = max(entry.max_ms, elapsed_ms)
+            entry.prompt_tokens += prompt_tokens
+            entry.completion_tokens += completion_tokens
+            entry.cached_tokens += cached_tokens
+        # Each call is also a stage (llm.<helper>) in /metrics and the request's Server-Timing
+        metrics.observe_stage(f"llm.{name}", elapsed_ms / 1000)
+        if error:
+            llm_errors.inc((name,))
+        if first_token_ms is not None:
+            llm_first_token.observe(first_token_ms / 1000, (name,))
+        for kind, count in (("prompt", prompt_tokens), ("completion", completion_tokens), ("cached", cached_tokens)):
+            if count:
+                llm_tokens.inc((name, kind), count)
+
+    def record_retry(self, name):
+        with self._lock:
+            self._entry(name).retries += 1
+        llm_retries.inc((name,))
+
+    def stats(self):
+        with self._lock:
+            return {name: entry.to_dict() for name, entry in self._stats.items()}
+
+
+gateway = LLMGateway.from_config(get_section('llm'))
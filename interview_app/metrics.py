@@ -0,0 +1,203 @@
+import bisect
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from interview_app.config import get_section
+
+# Seconds; spans cheap stages (session load, log appends) up to LLM calls and Whisper
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_TOKEN_UNSAFE = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name, help, label_names=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_labels(self.label_names, labels)} {value}" for labels, value in values]
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram; an observation is a bisect and a few additions under a lock."""
+
+    def __init__(self, name, help, label_names=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts (plus +Inf), sum
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self):
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = _labels(self.label_names, labels, 'le="%s"' % le)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {round(total, 6)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    In-process metrics rendered in the Prometheus text format at /metrics.
+
+    Stages are timed with `timed(stage)` (a context manager or decorator).
+    Each one lands in the `interview_stage_seconds` histogram and, when it
+    runs on a request thread between `begin_request` and `end_request`, in
+    that request's list of timings for the Server-Timing header. Every
+    worker process keeps its own registry.
+    """
+
+    def __init__(self, enabled=True, server_timing=True):
+        self.enabled = enabled
+        self.server_timing = server_timing
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._request = threading.local()
+        self.stage_seconds = self.histogram(
+            "interview_stage_seconds", "Time spent in each stage of a request or background job.", ("stage",))
+
+    @classmethod
+    def from_config(cls, settings):
+        return cls(enabled=settings.get('enabled', True), server_timing=settings.get('server_timing', True))
+
+    def _register(self, cls, name, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+            return metric
+
+    def counter(self, name, help, label_names=()):
+        return self._register(Counter, name, help, label_names)
+
+    def histogram(self, name, help, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, help, label_names, buckets)
+
+    # -- stages -----------------------------------------------------------
+    def observe_stage(self, stage, seconds):
+        if not self.enabled:
+            return
+        self.stage_seconds.observe(seconds, (stage,))
+        timings = getattr(self._request, "timings", None)
+        if timings is not None:
+            timings.append((stage, seconds))
+
+    @contextmanager
+    def timed(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.perf_counter() - started)
+
+    @contextmanager
+    def collect(self):
+        """Gather the stages timed on this thread into a list, e.g. to send them back from a worker process."""
+        previous = getattr(self._request, "timings", None)
+        timings = self._request.timings = []
+        try:
+            yield timings
+        finally:
+            self._request.timings = previous
+
+    # -- per request ------------------------------------------------------
+    def begin_request(self):
+        self._request.timings = [] if self.enabled and self.server_timing else None
+
+    def end_request(self):
+        """The stages timed on this thread since `begin_request`, as [(stage, seconds)]."""
+        timings = getattr(self._request, "timings", None) or []
+        self._request.timings = None
+        return timings
+
+    @staticmethod
+    def server_timing_header(timings, total_seconds=None):
+        """`Server-Timing` value: one entry per stage, repeated stages summed."""
+        totals = {}
+        for stage, seconds in timings:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        if total_seconds is not None:
+            totals["total"] = total_seconds
+        return ", ".join(f"{_TOKEN_UNSAFE.sub('_', stage)};dur={seconds * 1000:.1f}" for stage, seconds in totals.items())
+
+    def render(self):
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class ServerTimingMiddleware:
+    """
+    WSGI wrapper that collects the stages timed while a request is handled
+    (including session load/save, which run outside Flask's request hooks)
+    and sends them as a `Server-Timing` header. For streamed responses only
+    the stages before the first byte are included.
+    """
+
+    def __init__(self, wsgi_app, registry):
+        self.wsgi_app = wsgi_app
+        self.registry = registry
+
+    def __call__(self, environ, start_response):
+        if not (self.registry.enabled and self.registry.server_timing):
+            return self.wsgi_app(environ, start_response)
+        self.registry.begin_request()
+        started = time.perf_counter()
+
+        def start_with_timing(status, headers, exc_info=None):
+            timings = self.registry.end_request()
+            headers.append(("Server-Timing", self.registry.server_timing_header(timings, time.perf_counter() - started)))
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, start_with_timing)
+
+
+metrics = MetricsRegistry.from_config(get_section('metrics'))
+timed = metrics.timed
@@ -0,0 +1,91 @@
+import threading
+import time
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class _ModelEntry:
+    def __init__(self, name, loader):
+        self.name = name
+        self.loader = loader
+        self.value = None
+        self.state = PENDING
+        self.error = None
+        self.load_seconds = None
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Loads heavy models on first use or in background threads at startup.
+
+    Each model is registered with a zero-argument loader. `get` blocks until
+    that one model is loaded (loading it on the calling thread if nobody has
+    started yet); `preload` starts every loader in parallel so the app can
+    serve non-ML routes while the models warm up.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def register(self, name, loader):
+        self._entries[name] = _ModelEntry(name, loader)
+
+    def _load(self, entry):
+        with entry.lock:
+            if entry.state == READY:
+                return entry.value
+            entry.state = LOADING
+            entry.error = None
+            started = time.perf_counter()
+            try:
+                entry.value = entry.loader()
+            except Exception as e:
+                entry.state = FAILED
+                entry.error = str(e)
+                raise
+            finally:
+                entry.load_seconds = round(time.perf_counter() - started, 3)
+            entry.state = READY
+            return entry.value
+
+    def get(self, name):
+        entry = self._entries[name]
+        if entry.state == READY:
+            return entry.value
+        return self._load(entry)
+
+    def preload(self, names=None):
+        """Start loading the given models (all by default) in background threads."""
+        threads = []
+        for name in names or list(self._entries):
+            entry = self._entries[name]
+            if entry.state in (READY, LOADING):
+                continue
+            thread = threading.Thread(target=self._preload_one, args=(entry,), name=f"load-{name}", daemon=True)
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    def _preload_one(self, entry):
+        try:
+            self._load(entry)
+        except Exception:
+            # The failure is recorded on the entry and retried on the next get()
+            pass
+
+    def is_ready(self, names=None):
+        return all(self._entries[name].state == READY for name in names or self._entries)
+
+    def status(self):
+        return {
+            name: {
+                "state": entry.state,
+                "load_seconds": entry.load_seconds,
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Stage:
+    """
+    One step of a pipeline. `func` is called with the results of the stages
+    named in `deps` as keyword arguments.
+    """
+
+    def __init__(self, name, func, deps=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+
+class PipelineError(Exception):
+    def __init__(self, stage, error):
+        super().__init__(f"Stage '{stage}' failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+def _timed_call(stage, kwargs):
+    started = time.perf_counter()
+    result = stage.func(**kwargs)
+    return result, round((time.perf_counter() - started) * 1000, 1)
+
+
+def iter_pipeline(stages, max_workers=None):
+    """
+    Run `stages` as a DAG with maximum concurrency: every stage starts as soon
+    as all of its dependencies have finished. Yields (name, result, elapsed_ms)
+    in completion order and raises PipelineError on the first failure.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.deps if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages {missing}")
+
+    results = {}
+    started = set()
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(stages)) as executor:
+        while len(results) < len(stages):
+            for stage in stages:
+                if stage.name in started or not all(dep in results for dep in stage.deps):
+                    continue
+                kwargs = {dep: results[dep] for dep in stage.deps}
+                running[executor.submit(_timed_call, stage, kwargs)] = stage.name
+                started.add(stage.name)
+
+            if not running:
+                raise ValueError("Pipeline has a dependency cycle")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result, elapsed_ms = future.result()
+                except Exception as e:
+                    for pending in running:
+                        pending.cancel()
+                    raise PipelineError(name, e) from e
+                results[name] = result
+                yield name, result, elapsed_ms
+
+
+def run_pipeline(stages, max_workers=None):
+    """Run the DAG to completion. Returns (results, timings_ms) keyed by stage name."""
+    results, timings = {}, {}
+    for name, result, elapsed_ms in iter_pipeline(stages, max_workers):
+        results[name] = result
+        timings[name] = elapsed_ms
+    return results, timings
@@ -1,54 +1,145 @@
 import json
-from langchain.chains import LLMChain
-from langchain_community.chat_models import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain.memory import ConversationBufferMemory
+import random
+from interview_app.llm_gateway import gateway
 
-def generate_first_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str, 
-                            subject_syllabus: str, job_description: str, API_KEY_OPEN_AI: str, 
-                            introduction_of_person: str, demo_question_list: str, langchain_id: str):
-    job_description = job_description.replace("{", "{{").replace("}", "}}")
+QUESTION_MODEL = "gpt-4o-mini"
+
+INTERVIEWER_SYSTEM_PROMPT = """
+        ***YOU ARE A TEACHER INTERVIEW AUTOBOT***
+        You interview teaching candidates one question at a time, using the
+        board, subject, syllabus, job description and candidate details below.
+        **RETURN JSON FORMAT ONLY**
+        """
+
+def interview_context_messages(selected_board: str, selected_subject: str, selected_grade: str,
+                               subject_syllabus: str, job_description: str, demo_question_list: str,
+                               resume_of_person: str):
+    """
+    The large, unchanging part of every question prompt. It comes first and
+    is byte-for-byte identical on every turn of a session, so the provider's
+    prompt cache can reuse it instead of re-reading the documents each time.
+    """
+    context = (
+        f"Board: {selected_board}\n"
+        f"Subject: {selected_subject}\n"
+        f"Grade: {selected_grade}\n\n"
+        f"Subject syllabus:\n{subject_syllabus}\n\n"
+        f"Job description:\n{job_description}\n\n"
+        f"Example questions:\n{demo_question_list}\n\n"
+        f"Candidate resume:\n{resume_of_person}"
+    )
+    return [
+        {"role": "system", "content": INTERVIEWER_SYSTEM_PROMPT},
+        {"role": "user", "content": context},
+    ]
+
+def first_question_template(curr_topic: str, introduction_of_person: str):
     json_format = """ "question": [Generated Question], "answer": [Generated Answer] """
     template = f"""
-        ***YOU ARE A TEACHER INTERVIEW AUTOBOT***
+        Start the topic: {curr_topic}
+        Candidate's introduction: {introduction_of_person}
         ...instructions...
         Generate the Question and Answer in the given JSON format below:
         {json_format}
         
         **RETURN JSON FORMAT ONLY**
         """
-    llm = ChatOpenAI(api_key=API_KEY_OPEN_AI, model="gpt-4o-mini")
-    prompt = PromptTemplate(template=template, input_variables=[])
-    memory = ConversationBufferMemory(memory_key=langchain_id, return_messages=True)
-    llm_chain = LLMChain(llm=llm, prompt=prompt, memory=memory)
-    response = llm_chain.run({"subject_syllabus": subject_syllabus})
-    res = response.replace("```json", "").replace("```", "").strip()
-    data = json.loads(res)
-    return data["question"], data["answer"]
+    return template
 
-def generate_next_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str, 
-                           subject_syllabus: str, API_KEY_OPEN_AI: str, introduction_of_person: str, 
-                           resume_of_person: str, langchain_id: str):
+def next_question_template(curr_topic: str, introduction_of_person: str):
     json_format = """ "question": [Generated Question], "answer": [Generated Answer for the Generated Question] """
     template = f"""
         *** GENERATE ONLY ONE QUESTION FOR THE INTERVIEW OF A TEACHER ***
+        Continue the topic: {curr_topic}
+        Candidate's introduction: {introduction_of_person}
         ...instructions...
         Generate the Question and Answer in the given JSON format below:
         {json_format}
         
         **RETURN JSON FORMAT ONLY**
         """
-    llm = ChatOpenAI(api_key=API_KEY_OPEN_AI, model="gpt-4o-mini")
-    prompt = PromptTemplate(template=template, input_variables=["subject", "job_description", "previous_que", "previous_ans", "introduction_of_person", "demo_question_list"])
-    from langchain.memory import ConversationBufferMemory
-    memory = ConversationBufferMemory(memory_key=langchain_id, return_messages=True)
-    llm_chain = LLMChain(llm=llm, prompt=prompt, memory=memory)
-    context = {"introduction": introduction_of_person} if introduction_of_person is not None else {"introduction": resume_of_person}
-    response = llm_chain.run(context)
-    res = response.replace("```json", "").replace("```", "").strip()
+    return template
+
+def question_messages(template: str, selected_board: str, selected_subject: str, selected_grade: str,
+                      subject_syllabus: str, job_description: str, demo_question_list: str,
+                      resume_of_person: str, history=()):
+    """Static context, then the bounded conversation memory, then this turn's instruction."""
+    return (
+        interview_context_messages(selected_board, selected_subject, selected_grade, subject_syllabus,
+                                   job_description, demo_question_list, resume_of_person)
+        + list(history)
+        + [{"role": "user", "content": template}]
+    )
+
+def parse_question(content: str):
+    res = content.replace("```json", "").replace("```", "").strip()
     data = json.loads(res)
     return data["question"], data["answer"]
 
+def generate_first_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str, 
+                            subject_syllabus: str, job_description: str, API_KEY_OPEN_AI: str, 
+                            introduction_of_person: str, demo_question_list: str, resume_of_person: str = "",
+                            history=()):
+    messages = question_messages(first_question_template(curr_topic, introduction_of_person),
+                                 selected_board, selected_subject, selected_grade, subject_syllabus,
+                                 job_description, demo_question_list, resume_of_person, history)
+    response = gateway.chat_completion("generate_first_question", API_KEY_OPEN_AI,
+                                       model=QUESTION_MODEL, messages=messages)
+    return parse_question(response.choices[0].message.content)
+
+def generate_next_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str, 
+                           subject_syllabus: str, API_KEY_OPEN_AI: str, introduction_of_person: str, 
+                           resume_of_person: str, job_description: str = "", demo_question_list: str = "",
+                           history=()):
+    messages = question_messages(next_question_template(curr_topic, introduction_of_person),
+                                 selected_board, selected_subject, selected_grade, subject_syllabus,
+                                 job_description, demo_question_list, resume_of_person, history)
+    response = gateway.chat_completion("generate_next_question", API_KEY_OPEN_AI,
+                                       model=QUESTION_MODEL, messages=messages)
+    return parse_question(response.choices[0].message.content)
+
+def stream_first_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str,
+                          subject_syllabus: str, job_description: str, API_KEY_OPEN_AI: str,
+                          introduction_of_person: str, demo_question_list: str, resume_of_person: str = "",
+                          history=()):
+    """Same prompt as generate_first_question; yields the raw JSON completion as it streams."""
+    messages = question_messages(first_question_template(curr_topic, introduction_of_person),
+                                 selected_board, selected_subject, selected_grade, subject_syllabus,
+                                 job_description, demo_question_list, resume_of_person, history)
+    yield from gateway.stream_chat_completion("generate_first_question", API_KEY_OPEN_AI,
+                                              model=QUESTION_MODEL, messages=messages)
+
+def stream_next_question(selected_board: str, selected_subject: str, selected_grade: str, curr_topic: str,
+                         subject_syllabus: str, API_KEY_OPEN_AI: str, introduction_of_person: str,
+                         resume_of_person: str, job_description: str = "", demo_question_list: str = "",
+                         history=()):
+    """Same prompt as generate_next_question; yields the raw JSON completion as it streams."""
+    messages = question_messages(next_question_template(curr_topic, introduction_of_person),
+                                 selected_board, selected_subject, selected_grade, subject_syllabus,
+                                 job_description, demo_question_list, resume_of_person, history)
+    yield from gateway.stream_chat_completion("generate_next_question", API_KEY_OPEN_AI,
+                                              model=QUESTION_MODEL, messages=messages)
+
+def summarize_turns(summary: str, turns, API_KEY_OPEN_AI: str, max_tokens: int = 300):
+    """Fold older question/answer turns into the rolling conversation summary."""
+    transcript = "\n\n".join(
+        f"Topic: {turn['topic']}\nQuestion: {turn['question']}\nCandidate Answer: {turn['answer']}"
+        for turn in turns
+    )
+    response = gateway.chat_completion(
+        "summarize_turns",
+        API_KEY_OPEN_AI,
+        model=QUESTION_MODEL,
+        max_tokens=max_tokens,
+        messages=[
+            {"role": "system", "content": "You keep a short running summary of a teacher interview: topics covered, "
+                                          "questions already asked and how the candidate answered. Reply with the "
+                                          "updated summary only, in a few sentences."},
+            {"role": "user", "content": f"Current summary:\n{summary or '(none)'}\n\nNew turns:\n{transcript}"}
+        ]
+    )
+    return response.choices[0].message.content.strip()
+
 def categorize_answer(question: str, answer: str, candi_answer: str, API_KEY_OPEN_AI:str):
     json_format = """ "category": [Category], "score": [Score], "connecting_sentence": [Connecting Sentence] """
     template = f"""
@@ -60,9 +151,9 @@ def categorize_answer(question: str, answer: str, candi_answer: str, API_KEY_OPE
         Generate the response in the JSON format below:
         {json_format}
         """
-    from openai import OpenAI
-    client = OpenAI(api_key=API_KEY_OPEN_AI)
-    response = client.chat.completions.create(
+    response = gateway.chat_completion(
+        "categorize_answer",
+        API_KEY_OPEN_AI,
         model="gpt-4o",
         messages=[
             {"role": "user", "content": "You are an interview analyser."},
@@ -72,3 +163,27 @@ def categorize_answer(question: str, answer: str, candi_answer: str, API_KEY_OPE
     res = response.choices[0].message.content.replace("```json", "").replace("```", "").strip()
     data = json.loads(res)
     return data["category"], data["score"], data["connecting_sentence"]
+
+LOCAL_CONNECTING_SENTENCES = [
+    "Thank you for sharing that.",
+    "I appreciate your answer.",
+    "Thanks, that's helpful.",
+    "Great, thank you.",
+    "Alright, let's continue.",
+]
+
+def local_connecting_sentence():
+    return random.choice(LOCAL_CONNECTING_SENTENCES)
+
+def quick_connecting_sentence(question: str, candi_answer: str, API_KEY_OPEN_AI: str):
+    response = gateway.chat_completion(
+        "quick_connecting_sentence",
+        API_KEY_OPEN_AI,
+        model="gpt-4o-mini",
+        max_tokens=40,
+        messages=[
+            {"role": "system", "content": "You are a friendly interviewer. Reply with one short, neutral sentence acknowledging the candidate's answer, without judging it."},
+            {"role": "user", "content": f"Question: {question}\nAnswer: {candi_answer}"}
+        ]
+    )
+    return response.choices[0].message.content.strip()
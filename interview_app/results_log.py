@@ -0,0 +1,256 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from interview_app.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+def _empty_question():
+    return {"topic": "", "question": "", "answer": "", "candi_answer": "", "category": "", "score": ""}
+
+
+class _SessionLog:
+    __slots__ = ("fd", "offset", "leftover", "questions", "unsynced")
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.unsynced = 0
+        self.rewind()
+
+    def rewind(self):
+        self.offset = 0
+        self.leftover = b""
+        self.questions = []
+
+
+class ResultsLog:
+    """
+    Append-only record of an interview: one JSON line per event in
+    `{session_id}_events.jsonl`.
+
+      {"event": "asked", "index", "topic", "question", "answer"}
+      {"event": "answered", "index", "candi_answer"[, "answer"]}
+      {"event": "graded", "index", "category", "score"}
+
+    Each event is a single O_APPEND write, so work per turn doesn't grow with
+    the number of questions and several worker processes can log the same
+    session. The question list is rebuilt in memory by replaying only the
+    bytes added since the last read. Writes are fsynced in batches by a
+    background thread, every `fsync_interval_ms` or once `fsync_every`
+    records are pending. `reset` replaces the file with an empty one; a
+    process still reading the old file notices (different inode, or a file
+    shorter than what it has read) and replays the new one from the start.
+    `finalize` writes the compact
+    `{session_id}_all_questions.json` once, at the end of the interview.
+    """
+
+    def __init__(self, results_dir, fsync_interval_ms=200, fsync_every=32, max_sessions=256):
+        self.results_dir = results_dir
+        self.fsync_interval = fsync_interval_ms / 1000.0
+        self.fsync_every = fsync_every
+        self.max_sessions = max_sessions
+        self._logs = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self.appends = 0
+        self.bytes_written = 0
+        self.fsyncs = 0
+        self.fsync_ms = 0.0
+        self.finalized = 0
+        threading.Thread(target=self._sync_loop, name="results-fsync", daemon=True).start()
+
+    def log_path(self, session_id):
+        return os.path.join(self.results_dir, f"{session_id}_events.jsonl")
+
+    def final_path(self, session_id):
+        return os.path.join(self.results_dir, f"{session_id}_all_questions.json")
+
+    # -- events ---------------------------------------------------------
+    def asked(self, session_id, index, topic, question, answer=""):
+        self._append(session_id, {"event": "asked", "index": index, "topic": topic,
+                                  "question": question, "answer": answer})
+
+    def answered(self, session_id, index, candi_answer, answer=None):
+        record = {"event": "answered", "index": index, "candi_answer": candi_answer}
+        if answer is not None:
+            record["answer"] = answer
+        self._append(session_id, record)
+
+    def graded(self, session_id, index, category, score):
+        self._append(session_id, {"event": "graded", "index": index, "category": category, "score": score})
+
+    @timed("results_log_append")
+    def _append(self, session_id, record):
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            log = self._open(session_id)
+            self._reopen_if_replaced(session_id, log)
+            os.write(log.fd, line)
+            log.unsynced += 1
+            self.appends += 1
+            self.bytes_written += len(line)
+            pending = log.unsynced
+        if pending >= self.fsync_every:
+            self._wake.set()
+
+    # -- state ----------------------------------------------------------
+    def _open(self, session_id):
+        log = self._logs.get(session_id)
+        if log is None:
+            fd = os.open(self.log_path(session_id), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            log = self._logs[session_id] = _SessionLog(fd)
+            while len(self._logs) > self.max_sessions:
+                _, evicted = self._logs.popitem(last=False)
+                if evicted.unsynced:
+                    os.fsync(evicted.fd)
+                os.close(evicted.fd)
+        self._logs.move_to_end(session_id)
+        return log
+
+    def _reopen_if_replaced(self, session_id, log):
+        """Switch to the current file if another process reset the log."""
+        try:
+            current = os.stat(self.log_path(session_id))
+        except FileNotFoundError:
+            return
+        if current.st_ino == os.fstat(log.fd).st_ino:
+            return
+        fd = os.open(self.log_path(session_id), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        if log.unsynced:
+            os.fsync(log.fd)
+            log.unsynced = 0
+        os.close(log.fd)
+        log.fd = fd
+        log.rewind()
+
+    def _replay(self, log):
+        size = os.fstat(log.fd).st_size
+        if size < log.offset:
+            # Truncated underneath us; what was read no longer describes the file
+            log.rewind()
+        if size <= log.offset:
+            return
+        data = log.leftover + os.pread(log.fd, size - log.offset, log.offset)
+        log.offset = size
+        # A line another process is still writing is kept for the next read
+        lines = data.split(b"\n")
+        log.leftover = lines.pop()
+        for line in lines:
+            if line:
+                self._apply(log.questions, json.loads(line))
+
+    @staticmethod
+    def _apply(questions, record):
+        index = record["index"]
+        while len(questions) <= index:
+            questions.append(_empty_question())
+        question = questions[index]
+        event = record["event"]
+        if event == "asked":
+            question.update(topic=record["topic"], question=record["question"], answer=record["answer"])
+        elif event == "answered":
+            question["candi_answer"] = record["candi_answer"]
+            if "answer" in record:
+                question["answer"] = record["answer"]
+        elif event == "graded":
+            question["category"] = record["category"]
+            question["score"] = record["score"]
+
+    def reset(self, session_id):
+        """Start the session's log over, e.g. when the interview is restarted."""
+        path = self.log_path(session_id)
+        with self._lock:
+            log = self._open(session_id)
+            # A new file rather than ftruncate, so other processes holding the
+            # old one can tell it was replaced instead of reading at a stale offset
+            tmp_path = path + ".tmp"
+            fd = os.open(tmp_path, os.O_RDWR | os.O_APPEND | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.replace(tmp_path, path)
+            os.close(log.fd)
+            log.fd = fd
+            log.unsynced = 0
+            log.rewind()
+
+    def questions(self, session_id):
+        """Current question list for a session (a copy), or None if nothing was logged."""
+        if session_id not in self._logs and not os.path.exists(self.log_path(session_id)):
+            return None
+        with self._lock:
+            log = self._open(session_id)
+            self._reopen_if_replaced(session_id, log)
+            self._replay(log)
+            return [dict(question) for question in log.questions]
+
+    def finalize(self, session_id):
+        """Sync the log and write the compact final document; returns the questions or None."""
+        questions = self.questions(session_id)
+        if questions is None:
+            return None
+        self.sync(session_id)
+        path = self.final_path(session_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(questions, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.finalized += 1
+        return questions
+
+    # -- durability -----------------------------------------------------
+    def sync(self, session_id=None):
+        """fsync pending writes (of one session, or all of them)."""
+        with self._lock:
+            logs = [self._logs[session_id]] if session_id in self._logs else (
+                [] if session_id is not None else list(self._logs.values()))
+            # dup() so a log evicted meanwhile can't close the descriptor under us
+            fds = []
+            for log in logs:
+                if log.unsynced:
+                    fds.append(os.dup(log.fd))
+                    log.unsynced = 0
+        for fd in fds:
+            started = time.perf_counter()
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            with self._lock:
+                self.fsyncs += 1
+                self.fsync_ms += (time.perf_counter() - started) * 1000
+
+    def _refresh(self):
+        """Drop replayed state of logs that were reset or truncated by another process."""
+        with self._lock:
+            for session_id, log in list(self._logs.items()):
+                self._reopen_if_replaced(session_id, log)
+                if os.fstat(log.fd).st_size < log.offset:
+                    log.rewind()
+
+    def _sync_loop(self):
+        while True:
+            self._wake.wait(self.fsync_interval)
+            self._wake.clear()
+            try:
+                self.sync()
+                self._refresh()
+            except OSError:
+                logger.exception("Results log fsync failed")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "open_sessions": len(self._logs),
+                "appends": self.appends,
+                "bytes_written": self.bytes_written,
+                "fsyncs": self.fsyncs,
+                "avg_fsync_ms": round(self.fsync_ms / self.fsyncs, 2) if self.fsyncs else 0.0,
+                "unsynced": sum(log.unsynced for log in self._logs.values()),
+                "finalized": self.finalized,
+            }
@@ -1,30 +1,128 @@
 import os
-import uuid
 import json
 import cv2
 import numpy as np
-import base64
-from datetime import timedelta
-from flask import render_template, request, jsonify, session, redirect, url_for
+import time
+from functools import partial
+from flask import render_template, request, jsonify, session, redirect, url_for, Response, stream_with_context, g
 from werkzeug.utils import secure_filename
 
 from interview_app import app
-from interview_app.utils import boards, grades, countries, parse_file, allowed_file, generate_hashed_id
+from interview_app.utils import boards, grades, countries, parse_file, allowed_file, generate_hashed_id, uploaded_size
 from interview_app.demo_questions import demo_question_gpt
-from interview_app.question_generator import generate_first_question, generate_next_question, categorize_answer
+from interview_app.question_generator import generate_first_question, generate_next_question, categorize_answer, local_connecting_sentence, quick_connecting_sentence
+from interview_app.question_generator import stream_first_question, stream_next_question, summarize_turns
+from interview_app.conversation_memory import ConversationMemory
 from interview_app.jd_parser import extract_key_points, get_subject_syllabus, interview_related_topics
-from interview_app.summary_generator import summarize_interview
-
-# Initialize other models and variables
-from faster_whisper import WhisperModel
-from keras_facenet import FaceNet
-from mtcnn import MTCNN
+from interview_app.summary_generator import summarize_interview, stream_interview_summary, summarize_topic
+from interview_app.topic_summaries import TopicSummaries
+from interview_app.json_stream import IncrementalJSONParser
+from interview_app.face_cache import EmbeddingCache
+from interview_app.face_batcher import FaceBatcher, load_face_models
+from interview_app.face_preprocess import FaceTracker, decode_frame, plan_detection
+from interview_app.config import get_section
+from interview_app.transcription_jobs import TranscriptionQueue, QueueFull
+from interview_app.streaming_transcription import StreamingTranscriber
+from interview_app.transcription_engine import WhisperEngine, ProcessWhisperEngine, load_worker_engine
+from interview_app.inference_pool import InferencePool, start_pools
+from interview_app.model_registry import ModelRegistry
+from interview_app.llm_cache import llm_cache
+from interview_app.llm_gateway import gateway
+from interview_app.pipeline import Stage, PipelineError, iter_pipeline, run_pipeline
+from interview_app.speculation import SpeculativeQuestions
+from interview_app.scoring import ScoringQueue
+from interview_app.results_log import ResultsLog
+from interview_app.video_store import VideoChunkStore, UploadFinished
+from interview_app.upload_store import ResumableUploads
+from interview_app.audio_decode import decode_bytes, format_from_mime
+from interview_app.document_extraction import document_extractor, DocumentTooLarge
+from interview_app.metrics import metrics, timed
 from scipy.spatial.distance import euclidean
 
-# Initialize Whisper model for transcription
-model = WhisperModel("small", device="cpu", compute_type="int8")
-embedder = FaceNet()
-detector = MTCNN()
+# In production (gunicorn.conf.py) Whisper and MTCNN/FaceNet run in worker processes,
+# forked here before the app starts its threads; otherwise they run in this process
+pools_config = get_section('process_pools')
+use_process_pools = pools_config.get('enabled')
+if use_process_pools is None:
+    use_process_pools = os.getenv("INTERVIEW_PROCESS_POOLS") == "1"
+
+inference_pools = {}
+if use_process_pools:
+    whisper_processes = pools_config.get('whisper', 2)
+    inference_pools['whisper'] = InferencePool(
+        'whisper', whisper_processes, load_worker_engine,
+        (get_section('faster_whisper'), get_section('vad'), whisper_processes)
+    )
+    inference_pools['face'] = InferencePool('face', pools_config.get('face', 1), load_face_models)
+# The PDF extraction processes are forked here too, never lazily once threads are running.
+# Every pool forks before any starts its executor thread; the SQLite and httpx
+# handles (session store, LLM cache, gateway) are only opened later, on first use
+start_pools(*inference_pools.values(), document_extractor)
+
+# Initialize the Whisper model pool for transcription (see faster_whisper in config.yaml)
+if use_process_pools:
+    whisper_engine = ProcessWhisperEngine(get_section('faster_whisper'), get_section('vad'), inference_pools['whisper'])
+else:
+    whisper_engine = WhisperEngine(get_section('faster_whisper'), get_section('vad'))
+
+
+def load_whisper():
+    whisper_engine.warm()
+    return whisper_engine
+
+
+def load_facenet():
+    from keras_facenet import FaceNet
+    return FaceNet()
+
+
+def load_mtcnn():
+    from mtcnn import MTCNN
+    return MTCNN()
+
+
+# Heavy models load on first use, or in background threads when preloading is on,
+# so routes that don't need them can serve immediately
+models = ModelRegistry()
+models.register('whisper', load_whisper)
+if use_process_pools:
+    models.register('face', inference_pools['face'].warm)
+else:
+    models.register('facenet', load_facenet)
+    models.register('mtcnn', load_mtcnn)
+if get_section('models').get('preload', True):
+    models.preload()
+
+# Live verification frames from concurrent requests are embedded in batches
+face_config = get_section('face_verification')
+face_batcher = FaceBatcher(
+    lambda: models.get('mtcnn'),
+    lambda: models.get('facenet'),
+    batch_size=face_config.get('batch_size', 8),
+    max_wait_ms=face_config.get('max_wait_ms', 15),
+    pool=inference_pools.get('face')
+)
+# Last face box per session, so later frames only search around it
+face_tracker = FaceTracker()
+
+# Completed answers are transcribed off the request thread
+jobs_config = get_section('transcription_jobs')
+transcription_queue = TranscriptionQueue(
+    max_workers=jobs_config.get('workers', 2),
+    max_pending=jobs_config.get('max_pending', 64)
+)
+
+# Answers are transcribed window by window while the chunks are still arriving
+streaming_config = get_section('streaming_transcription')
+streaming_transcriber = StreamingTranscriber(
+    whisper_engine,
+    max_workers=streaming_config.get('workers', 1),
+    min_window_s=streaming_config.get('min_window_s', 2.0),
+    tail_guard_s=streaming_config.get('tail_guard_s', 0.6),
+    min_silence_ms=streaming_config.get('min_silence_ms', 500),
+    # Intermediate windows use the low-latency model/beam settings
+    transcribe_options={'fast': streaming_config.get('fast', True)}
+)
 
 ALLOWED_TEXT_EXTENSIONS = {'txt', 'doc', 'docx', 'pdf'}
 ALLOWED_AUDIO_EXTENSIONS = {'mp3', 'wav', 'm4a'}
@@ -39,6 +137,134 @@ UPLOADS_DIR = os.path.join(BASE_DIR, "uploads")
 INTERVIEW_RESULTS_DIR = os.path.join(BASE_DIR, "interview_results")
 CHUNKS_DIR = os.path.join(BASE_DIR, "video_chunks")
 FINAL_VIDEO_DIR = os.path.join(BASE_DIR, "videos")
+EMBEDDINGS_DIR = os.path.join(BASE_DIR, "face_embeddings")
+
+# Answer recordings are uploaded in resumable pieces at explicit byte offsets
+audio_uploads = ResumableUploads(UPLOADS_DIR)
+
+# Question prompts carry a rolling summary plus the last few turns, not the whole interview
+memory_config = get_section('conversation_memory')
+conversation_memory = ConversationMemory(
+    partial(summarize_turns, API_KEY_OPEN_AI=OPENAI_API_KEY,
+            max_tokens=memory_config.get('summary_max_tokens', 300)),
+    max_turns=memory_config.get('max_turns', 4),
+    max_pending=memory_config.get('max_pending', 4),
+)
+
+# Recorded video is assembled per recording as chunks arrive
+video_store = VideoChunkStore(CHUNKS_DIR, FINAL_VIDEO_DIR)
+
+# Next questions are generated alongside grading, or ahead of time while recording
+speculative_questions = SpeculativeQuestions(max_workers=get_section('speculation').get('workers', 4))
+
+# Answers are graded in the background; only /end_interview waits for the scores
+scoring_config = get_section('scoring')
+
+# Interview results are appended as events and compacted once at the end
+results_config = get_section('results_log')
+results_log = ResultsLog(
+    INTERVIEW_RESULTS_DIR,
+    fsync_interval_ms=results_config.get('fsync_interval_ms', 200),
+    fsync_every=results_config.get('fsync_every', 32),
+    max_sessions=results_config.get('max_sessions', 256),
+)
+
+
+def grade_answer(question, answer, candi_answer):
+    category, score, _ = categorize_answer(
+        question=question,
+        answer=answer,
+        candi_answer=candi_answer,
+        API_KEY_OPEN_AI=OPENAI_API_KEY
+    )
+    return category, score
+
+
+scoring_queue = ScoringQueue(grade_answer, results_log.graded,
+                             max_workers=scoring_config.get('workers', 4))
+
+
+# Each topic is summarised when it closes, so the final summary only reduces those
+summary_config = get_section('summary')
+
+
+def summarize_closed_topic(session_id, topic):
+    # The topic's last answer is usually still being graded when it closes; later topics' grades don't matter
+    indexes = {i for i, q in enumerate(results_log.questions(session_id) or []) if q['topic'] == topic}
+    scoring_queue.wait(session_id, timeout=scoring_config.get('wait_timeout_s', 60), indexes=indexes)
+    questions = [q for q in results_log.questions(session_id) or [] if q['topic'] == topic]
+    return summarize_topic(topic, questions, OPENAI_API_KEY,
+                           max_tokens=summary_config.get('topic_max_tokens', 400))
+
+
+topic_summaries = TopicSummaries(summarize_closed_topic, max_workers=summary_config.get('workers', 2))
+
+
+def apply_scores(questions, scores):
+    for index, (category, score) in scores.items():
+        if index < len(questions):
+            questions[index]['category'] = category
+            questions[index]['score'] = score
+
+# Reference-face embeddings are computed once per session at upload time
+reference_embeddings = EmbeddingCache(
+    EMBEDDINGS_DIR,
+    max_entries=face_config.get('embedding_cache_entries', 256),
+    max_disk_entries=face_config.get('embedding_disk_entries', 4096),
+    max_disk_age_s=face_config.get('embedding_disk_max_age_s', 24 * 3600),
+)
+
+
+def compute_reference_embedding(image_path):
+    """
+    Detect the face in the reference photo and return its FaceNet embedding,
+    or None if the image can't be read or contains no face.
+    """
+    reference_img = cv2.imread(image_path)
+    if reference_img is None:
+        return None
+    ref_rgb = cv2.cvtColor(reference_img, cv2.COLOR_BGR2RGB)
+
+    # Same MTCNN/FaceNet path as live frames, so it runs in the face workers when those are enabled
+    ref_embedding, _ = face_batcher.embed(ref_rgb)
+    return ref_embedding
+
+http_requests = metrics.counter("interview_http_requests_total", "HTTP requests by endpoint and status.",
+                                ("endpoint", "method", "status"))
+http_seconds = metrics.histogram("interview_http_request_seconds",
+                                 "Time to the response headers (streamed bodies continue after), by endpoint.",
+                                 ("endpoint", "method"))
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None and metrics.enabled:
+        # The URL rule, not the path, so session ids don't become label values
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        http_seconds.observe(time.perf_counter() - started, (endpoint, request.method))
+        http_requests.inc((endpoint, request.method, str(response.status_code)))
+    return response
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    return jsonify({"status": "ok", "models": models.status()})
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    ready = models.is_ready()
+    return jsonify({"ready": ready, "models": models.status()}), 200 if ready else 503
 
 # ...existing route definitions with adjustments...
 @app.route('/', methods=['GET', 'POST'])
@@ -55,8 +281,14 @@ def upload_file():
             session['session_id'] = session_id
             filename = secure_filename(file.filename)
             filepath = os.path.join(UPLOADS_DIR, filename)
-            file.save(filepath)
+            with timed("file_save"):
+                file.save(filepath)
             session['reference_img'] = filepath
+
+            # Embed the reference face once; check_face only embeds live frames
+            ref_embedding = compute_reference_embedding(filepath)
+            if ref_embedding is not None:
+                reference_embeddings.put(session_id, ref_embedding)
             return redirect(url_for('verify', session_id=session_id))
     return render_template('upload.html')
 
@@ -72,17 +304,13 @@ def check_face():
     if 'reference_img' not in session:
         return jsonify({'error': 'No reference image'}), 400
     
-    reference_path = session['reference_img']
-    reference_img = cv2.imread(reference_path)
-    ref_rgb = cv2.cvtColor(reference_img, cv2.COLOR_BGR2RGB)
-
-    ref_faces = detector.detect_faces(ref_rgb)
-    if not ref_faces:
-        return jsonify({'error': 'No face detected in the reference image'}), 400
-    
-    x, y, w, h = ref_faces[0]['box']
-    ref_face = ref_rgb[y:y+h, x:x+w]
-    ref_embedding = embedder.embeddings([ref_face])[0]
+    session_id = session.get('session_id', '')
+    ref_embedding = reference_embeddings.get(session_id)
+    if ref_embedding is None:
+        ref_embedding = compute_reference_embedding(session['reference_img'])
+        if ref_embedding is None:
+            return jsonify({'error': 'No face detected in the reference image'}), 400
+        reference_embeddings.put(session_id, ref_embedding)
 
     if 'image' not in request.files:
         return jsonify({'error': 'No image uploaded'}), 400
@@ -91,19 +319,31 @@ def check_face():
     if file.filename == '':
         return jsonify({'error': 'No selected file'}), 400
     
-    nparr = np.frombuffer(file.read(), np.uint8)
-    frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-    faces = detector.detect_faces(rgb_frame)
-    if not faces:
+    with timed("frame_decode"):
+        rgb_frame = decode_frame(file.read(), reduction=face_config.get('decode_reduction', 2))
+    if rgb_frame is None:
+        return jsonify({'error': 'Could not decode the uploaded image'}), 400
+
+    detect_max_side = face_config.get('detect_max_side', 320)
+    roi_margin = face_config.get('roi_margin', 0.6)
+    last_box = face_tracker.get(session_id)
+
+    detect_image, transform = plan_detection(rgb_frame, last_box, detect_max_side, roi_margin)
+    with timed("face_batch_wait"):
+        face_embedding, box = face_batcher.embed(rgb_frame, detect_image, transform)
+    if face_embedding is None and last_box is not None:
+        # The face moved out of the tracked region; search the whole frame again
+        detect_image, transform = plan_detection(rgb_frame, None, detect_max_side, roi_margin)
+        with timed("face_batch_wait"):
+            face_embedding, box = face_batcher.embed(rgb_frame, detect_image, transform)
+
+    if face_embedding is None:
+        face_tracker.forget(session_id)
         return jsonify({'error': 'No face detected in the uploaded image'}), 400
-    
-    x, y, w, h = faces[0]['box']
-    face_crop = rgb_frame[y:y+h, x:x+w]
-    face_embedding = embedder.embeddings([face_crop])[0]
+    face_tracker.update(session_id, box)
+
     distance = euclidean(ref_embedding, face_embedding)
-    threshold = 0.2
+    threshold = face_config.get('match_threshold', 0.2)
     match = (1 - distance) > threshold
 
     return jsonify({
@@ -112,6 +352,16 @@ def check_face():
     })
 
 
+@app.route('/api/face_cache_stats', methods=['GET'])
+def face_cache_stats():
+    return jsonify(reference_embeddings.stats())
+
+
+@app.route('/api/face_batch_stats', methods=['GET'])
+def face_batch_stats():
+    return jsonify(face_batcher.stats())
+
+
 @app.route('/success_redirect', methods=['GET'])
 def success_redirect():
     return redirect(url_for('success', session_id=session['session_id']))
@@ -156,10 +406,16 @@ def submit_form():
                 filename = secure_filename(file.filename)
                 job_desc_filename = f"{session['session_id']}_job_description_{filename}"
                 filepath = os.path.join(UPLOADS_DIR, job_desc_filename)
-                file.save(filepath)
-                job_description = parse_file(filepath)
-                session['job_description'] = job_description
-                session['session_id'] = session['session_id']
+                try:
+                    # Oversized files are rejected before they are written to disk
+                    document_extractor.check_size(uploaded_size(file), filename)
+                    with timed("file_save"):
+                        file.save(filepath)
+                    job_description = parse_file(filepath)
+                    session['job_description'] = job_description
+                    session['session_id'] = session['session_id']
+                except DocumentTooLarge as e:
+                    errors.append(f"Job Description is too large: {e}")
             else:
                 errors.append("Invalid Job Description file format. Please upload a valid .txt, .doc, .docx, or .pdf file.")
 
@@ -170,9 +426,14 @@ def submit_form():
                 filename = secure_filename(file.filename)
                 resume_filename = f"{session.get('session_id', 'unknown')}_resume_{filename}"
                 filepath = os.path.join(UPLOADS_DIR, resume_filename)
-                file.save(filepath)
-                resume_file = parse_file(filepath)
-                session['candidate_resume'] = resume_file
+                try:
+                    document_extractor.check_size(uploaded_size(file), filename)
+                    with timed("file_save"):
+                        file.save(filepath)
+                    resume_file = parse_file(filepath)
+                    session['candidate_resume'] = resume_file
+                except DocumentTooLarge as e:
+                    errors.append(f"Resume is too large: {e}")
             else:
                 errors.append("Invalid Resume file format. Please upload a valid .txt, .doc, .docx, or .pdf file.")
 
@@ -194,59 +455,73 @@ def submit_form():
             }), 200
 
 
-@app.route('/start_interview', methods=['GET'])
-def start_interview():
+def setup_inputs():
+    """Session values the setup pipeline needs, or None if any are missing."""
+    inputs = {
+        "job_description": session.get('job_description', ''),
+        "selected_subject": session.get('selected_subject', ''),
+        "selected_grade": session.get('selected_grade', ''),
+        "selected_board": session.get('selected_board', ''),
+        "selected_country": session.get('selected_country', ''),
+    }
+    required = ['job_description', 'selected_subject', 'selected_grade', 'selected_board']
+    if not all(inputs[key] for key in required) or not session.get('candidate_resume', ''):
+        return None
+    return inputs
+
+
+def build_setup_stages(job_description, selected_subject, selected_grade, selected_board, selected_country):
+    """
+    The /start_interview LLM calls as a DAG. JD extraction feeds the syllabus;
+    topics and demo questions only need the syllabus and JD, so they run together.
+    """
+    def syllabus_stage(extracted_job_description):
+        return get_subject_syllabus(
+            extracted_job_description=extracted_job_description,
+            selected_country=selected_country,
+            selected_subject=selected_subject,
+            selected_grade=selected_grade,
+            selected_board=selected_board,
+            API_KEY_OPEN_AI=OPENAI_API_KEY
+        )
+
+    def topics_stage(extracted_job_description, subject_syllabus):
+        return interview_related_topics(
+            extracted_job_description=extracted_job_description,
+            subject_syllabus=subject_syllabus,
+            selected_grade=selected_grade,
+            selected_board=selected_board,
+            API_KEY_OPEN_AI=OPENAI_API_KEY
+        )
+
+    def demo_stage(extracted_job_description, subject_syllabus):
+        demo_questions = demo_question_gpt(
+            selected_subject=selected_subject,
+            selected_grade=selected_grade,
+            selected_board=selected_board,
+            syllabus=subject_syllabus,
+            extracted_jd=extracted_job_description,
+            API_KEY_OPEN_AI=OPENAI_API_KEY
+        )
+        return demo_questions['choices'][0]['message']['content']
+
+    return [
+        Stage('extracted_job_description', lambda: extract_key_points(job_description, OPENAI_API_KEY)),
+        Stage('subject_syllabus', syllabus_stage, deps=['extracted_job_description']),
+        Stage('interview_topics_list', topics_stage, deps=['extracted_job_description', 'subject_syllabus']),
+        Stage('demo_questions', demo_stage, deps=['extracted_job_description', 'subject_syllabus']),
+    ]
+
+
+def apply_setup_results(results):
     # Initialize interview session variables
     session['questions'] = []
     session['curr_topic_index'] = 0
 
-    # Extract session data
-    job_description = session.get('job_description', '')
-    selected_subject = session.get('selected_subject', '')
-    selected_grade = session.get('selected_grade', '')
-    selected_board = session.get('selected_board', '')
-    candidate_resume = session.get('candidate_resume', '')
-    session_id = session.get('session_id', '')
-    selected_country = session.get('selected_country', '')
-
-    if not all([job_description, selected_subject, selected_grade, selected_board, candidate_resume]):
-        return jsonify({"error": "Missing required session data."}), 400
-
-    # Extract key points from job description
-    extracted_job_description = extract_key_points(job_description, OPENAI_API_KEY)
-    session['extracted_job_description'] = extracted_job_description
-
-    # Get subject syllabus
-    subject_syllabus = get_subject_syllabus(
-        extracted_job_description=extracted_job_description,
-        selected_country=selected_country,
-        selected_subject=selected_subject,
-        selected_grade=selected_grade,
-        selected_board=selected_board,
-        API_KEY_OPEN_AI=OPENAI_API_KEY
-    )
-    session['subject_syllabus'] = subject_syllabus
-
-    # Determine interview-related topics
-    interview_topics = interview_related_topics(
-        extracted_job_description=extracted_job_description,
-        subject_syllabus=subject_syllabus,
-        selected_grade=selected_grade,
-        selected_board=selected_board,
-        API_KEY_OPEN_AI=OPENAI_API_KEY
-    )
-    session['interview_topics_list'] = interview_topics
-
-    # Generate demo questions
-    demo_questions = demo_question_gpt(
-        selected_subject=selected_subject,
-        selected_grade=selected_grade,
-        selected_board=selected_board,
-        syllabus=subject_syllabus,
-        extracted_jd=extracted_job_description,
-        API_KEY_OPEN_AI=OPENAI_API_KEY
-    )
-    session['demo_questions'] = demo_questions['choices'][0]['message']['content']
+    session['extracted_job_description'] = results['extracted_job_description']
+    session['subject_syllabus'] = results['subject_syllabus']
+    session['interview_topics_list'] = results['interview_topics_list']
+    session['demo_questions'] = results['demo_questions']
 
     # Store interview topics and their limits
     session['interview_topics'] = list(session['interview_topics_list'].keys())
@@ -267,329 +542,583 @@ def start_interview():
     session['interview_started'] = True
     session['interview_finished'] = False
 
-    # Save initial questions to JSON
-    save_questions_to_json()
-    
+    # Record the initial question
+    results_log.reset(session['session_id'])
+    scoring_queue.discard(session['session_id'])
+    conversation_memory.discard(session['session_id'])
+    topic_summaries.discard(session['session_id'])
+    log_question(len(session['questions']) - 1)
+
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def persist_session():
+    """
+    Save session changes made inside a streamed response. Flask saves the
+    session before the body is sent, so later changes must be written explicitly.
+    """
+    session.modified = True
+    app.session_interface.save_session(app, session, Response())
+
+
+@app.route('/start_interview', methods=['GET'])
+def start_interview():
+    inputs = setup_inputs()
+    if inputs is None:
+        return jsonify({"error": "Missing required session data."}), 400
+
+    started = time.perf_counter()
+    try:
+        results, timings = run_pipeline(build_setup_stages(**inputs))
+    except PipelineError as e:
+        return jsonify({"error": str(e), "stage": e.stage}), 500
+    timings['total'] = round((time.perf_counter() - started) * 1000, 1)
+
+    apply_setup_results(results)
 
     return jsonify({
-        "question": session["questions"][-1]
+        "question": session["questions"][-1],
+        "timings": timings
     }), 200
 
+
+@app.route('/start_interview_stream', methods=['GET'])
+def start_interview_stream():
+    """Same as /start_interview, but reports each stage over SSE as it completes."""
+    inputs = setup_inputs()
+    if inputs is None:
+        return jsonify({"error": "Missing required session data."}), 400
+    stages = build_setup_stages(**inputs)
+
+    def events():
+        started = time.perf_counter()
+        results, timings = {}, {}
+        try:
+            for name, result, elapsed_ms in iter_pipeline(stages):
+                results[name] = result
+                timings[name] = elapsed_ms
+                yield sse_event('stage', {"stage": name, "ms": elapsed_ms})
+        except PipelineError as e:
+            yield sse_event('failed', {"error": str(e), "stage": e.stage})
+            return
+        timings['total'] = round((time.perf_counter() - started) * 1000, 1)
+
+        apply_setup_results(results)
+        persist_session()
+        yield sse_event('question', {"question": session["questions"][-1], "timings": timings})
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+def video_session_id():
+    return secure_filename(session.get('session_id', 'candidate')) or 'candidate'
+
+
+def video_recording_id(data=None):
+    """The client's id for this recording; each one is assembled (and finished) separately."""
+    recording_id = (data or request.values).get('recording_id')
+    return secure_filename(str(recording_id)) if recording_id else 'recording'
+
+
 # Endpoint to upload each video chunk.
+# Accepts either a raw body (Content-Type: application/octet-stream, chunk_number
+# in the query string) or the original multipart form with a `video_chunk` file.
 @app.route('/upload_video_chunk', methods=['POST'])
 def upload_video_chunk():
-    # Check if the POST request has the file part
-    if 'video_chunk' not in request.files:
-        return jsonify({'error': 'No video_chunk part in the request'}), 400
+    chunk_number = request.values.get("chunk_number", "0")
+    try:
+        chunk_index = int(chunk_number)
+    except ValueError:
+        return jsonify({'error': 'Invalid chunk number'}), 400
 
-    file = request.files['video_chunk']
-    if file.filename == '':
-        return jsonify({'error': 'No selected file'}), 400
+    if request.mimetype == 'application/octet-stream':
+        # Read straight from the socket, never buffered whole
+        source = request.stream
+    else:
+        # Check if the POST request has the file part
+        if 'video_chunk' not in request.files:
+            return jsonify({'error': 'No video_chunk part in the request'}), 400
 
-    # Optionally retrieve the chunk number to use in naming.
-    chunk_number = request.form.get("chunk_number", "0")
-    # Sanitize the chunk number (use secure_filename to avoid unwanted characters)
-    safe_chunk_number = secure_filename(chunk_number)
-    # Use a filename pattern – for example: chunk_1.webm, chunk_2.webm, etc.
-    filename = f"chunk_{safe_chunk_number}.mp4"
-    save_path = os.path.join(CHUNKS_DIR, filename)
+        file = request.files['video_chunk']
+        if file.filename == '':
+            return jsonify({'error': 'No selected file'}), 400
+        source = file.stream
 
     try:
-        with open(save_path, "wb") as f:
-            f.write(file.read())
-        app.logger.info(f"Saved video chunk {filename}")
-        return jsonify({'success': True, 'message': f"Chunk {safe_chunk_number} saved."})
+        with timed("video_chunk_write"):
+            result = video_store.add_chunk(video_session_id(), video_recording_id(), chunk_index, source)
+        app.logger.info(f"Video chunk {chunk_index} {result}")
+        return jsonify({'success': True, 'status': result, 'message': f"Chunk {chunk_index} saved."})
+    except UploadFinished:
+        return jsonify({'error': 'Video upload already finished'}), 409
     except Exception as e:
         app.logger.error(f"Error saving video chunk: {e}")
         return jsonify({'error': 'Failed to save chunk'}), 500
+
+
+@app.route('/video_upload_status', methods=['GET'])
+def video_upload_status():
+    status = video_store.status(video_session_id(), video_recording_id())
+    if status is None:
+        return jsonify({'error': 'No video chunks found'}), 404
+    return jsonify(status)
     
 
-# Endpoint to signal the end of video upload and combine the chunks.
+# Endpoint to signal the end of video upload. Chunks are already assembled
+# in order as they arrive, so this only moves the file into place (up to the first gap).
 @app.route('/finish_video_upload', methods=['POST'])
 def finish_video_upload():
+    data = request.get_json(silent=True) or {}
+    total_chunks = data.get('total_chunks')
+    recording_id = video_recording_id(data)
     try:
-        # Get a list of all chunk files
-        files = os.listdir(CHUNKS_DIR)
-        if not files:
+        # Name for the final video file
+        final_filename = f"{session.get('session_id', 'candidate')}_{recording_id}_rec.mp4"
+        final_filepath, missing = video_store.finish(
+            video_session_id(), recording_id, secure_filename(final_filename),
+            total_chunks=int(total_chunks) if total_chunks else None
+        )
+        if final_filepath is None:
             return jsonify({'error': 'No video chunks found'}), 400
 
-        # Filter for files that match our naming pattern (chunk_*.webm)
-        chunk_files = [f for f in files if f.startswith('chunk_') and f.endswith('.mp4')]
-        
-        # Sort the chunks in order by their number.
-        # This assumes filenames are of the form "chunk_{number}.webm"
-        def get_chunk_number(filename):
-            try:
-                base = filename.replace('chunk_', '').replace('.mp4', '')
-                return int(base)
-            except ValueError:
-                return 0
+        if missing:
+            app.logger.warning(f"Final video {final_filepath} is missing chunks {missing}")
+        app.logger.info(f"Final video saved as {final_filepath}")
+        return jsonify({'success': True, 'message': 'Final video created successfully.', 'missing_chunks': missing})
+    except UploadFinished:
+        return jsonify({'error': 'Video upload already finished'}), 409
+    except Exception as e:
+        app.logger.error(f"Error finishing video upload: {e}")
+        return jsonify({'error': 'Failed to create final video'}), 500
+ 
 
-        chunk_files.sort(key=get_chunk_number)
-        app.logger.info(f"Combining chunks: {chunk_files}")
+def plan_next_turn():
+    """
+    Work out from the session what the next turn asks, without changing it.
+    Returns a dict with `kind` ('first', 'next' or 'finished') and the topic.
+    """
+    topic_index = session.get('curr_topic_index', 0)
+    topics = session.get('interview_topics', [])
+    limits = session.get('interview_topics_limits', [])
 
-        # Name for the final video file
-        final_filename = f"{session.get('session_id', 'candidate')}_rec.mp4"
-        final_filepath = os.path.join(FINAL_VIDEO_DIR, final_filename)
+    # After the introduction, ask the first question of the first topic
+    if session['questions'][-1]['topic'] == "Introduction":
+        return {"kind": "first", "topic": topics[topic_index], "topic_limit": limits[topic_index],
+                "topic_index": topic_index}
 
-        # Combine the chunks into the final video file
-        with open(final_filepath, 'wb') as outfile:
-            for chunk in chunk_files:
-                chunk_path = os.path.join(CHUNKS_DIR, chunk)
-                with open(chunk_path, 'rb') as infile:
-                    outfile.write(infile.read())
+    current_topic = session.get('current_topic', 'general')
+    current_topic_limit = session.get('current_topic_limit')
+    questions_count = sum(1 for q in session['questions'] if q['topic'] == current_topic)
 
-        app.logger.info(f"Final video saved as {final_filepath}")
+    if questions_count < current_topic_limit:
+        return {"kind": "next", "topic": current_topic, "topic_limit": current_topic_limit,
+                "topic_index": topic_index}
+    if topic_index + 1 < len(topics):
+        return {"kind": "first", "topic": topics[topic_index + 1], "topic_limit": limits[topic_index + 1],
+                "topic_index": topic_index + 1}
+    return {"kind": "finished"}
 
-        # Optionally, remove the temporary chunk files after combining.
-        for chunk in chunk_files:
-            chunk_path = os.path.join(CHUNKS_DIR, chunk)
-            os.remove(chunk_path)
 
-        return jsonify({'success': True, 'message': 'Final video created successfully.'})
-    except Exception as e:
-        app.logger.error(f"Error finishing video upload: {e}")
-        return jsonify({'error': 'Failed to create final video'}), 500
- 
+def speculation_key(turn, plan, candidate_answer):
+    # The follow-up is written from the answer, so a prefetch only counts for the same answer
+    return (turn, plan['kind'], plan.get('topic'), candidate_answer)
 
-@app.route('/next_question', methods=["POST"])
-def next_question():
-    print("Processing next question")
-    if not session.get('interview_started', False):
-        return jsonify({"error": "Interview has not been started."}), 400
 
-    data = request.json
-    candidate_answer = data.get('candidate_answer', '')
+def question_generator_for(plan, stream=False):
+    """
+    Bind the session values the plan's question needs, so it can run off the
+    request thread. With `stream=True` the bound call yields the raw completion.
+    """
+    if plan['kind'] == "finished":
+        return None
+    if plan['kind'] == "first":
+        generate = stream_first_question if stream else generate_first_question
+    else:
+        generate = stream_next_question if stream else generate_next_question
+    # Both kinds get the same static context so the prompt prefix stays identical across turns
+    return partial(
+        generate,
+        selected_subject=session['selected_subject'],
+        selected_grade=session['selected_grade'],
+        selected_board=session['selected_board'],
+        subject_syllabus=session['subject_syllabus'],
+        job_description=session['extracted_job_description'],
+        demo_question_list=session.get('demo_questions', ''),
+        resume_of_person=session['candidate_resume'],
+        curr_topic=plan['topic'],
+        API_KEY_OPEN_AI=OPENAI_API_KEY,
+        introduction_of_person=session.get('introduction', ''),
+        history=conversation_memory.messages(session['session_id'])
+    )
 
-    if not candidate_answer:
-        return jsonify({"error": "No candidate answer provided."}), 400
 
+def answer_prefetcher():
+    """
+    For an answer being transcribed, a callable that starts generating the
+    next question from the transcript as soon as it is ready, while the
+    client is still collecting it; None if no question follows.
+    """
+    if not session.get('interview_started', False) or session.get('interview_finished', False):
+        return None
+    if not get_section('speculation').get('prefetch', True):
+        return None
+
+    plan = plan_next_turn()
+    generate = question_generator_for(plan)
+    if generate is None:
+        return None
+    session_id = session['session_id']
+    turn = len(session['questions'])
+    question = session['questions'][-1].get('question', '')
+
+    def prefetch(candidate_answer):
+        # The answer isn't recorded yet, so it is added to the history here
+        history = conversation_memory.messages(session_id, pending=(question, candidate_answer))
+        speculative_questions.start(session_id, speculation_key(turn, plan, candidate_answer),
+                                    partial(generate, history=history))
+
+    return prefetch
+
+
+def record_answer(candidate_answer):
+    """
+    Store the candidate's answer on the last question and queue its grading.
+    Returns a future for a model-written connecting sentence, or None.
+    """
     # Get the last question object
     last_question_object = session['questions'][-1]
 
     prev_question = last_question_object.get('question', '')
     prev_answer = last_question_object.get('answer', '')
 
-    # Categorize the candidate's answer
-    category, score, connecting_sentence = categorize_answer(
+    # Grade the candidate's answer in the background; category and score are
+    # only needed at /end_interview. The candidate just needs a connecting sentence.
+    scoring_queue.submit(
+        session['session_id'],
+        len(session['questions']) - 1,
         question=prev_question,
         answer=prev_answer,
-        candi_answer=candidate_answer,
-        API_KEY_OPEN_AI=OPENAI_API_KEY
+        candi_answer=candidate_answer
     )
+    pending_sentence = None
+    if scoring_config.get('connecting_sentence', 'local') == 'model':
+        pending_sentence = speculative_questions.submit(
+            quick_connecting_sentence, prev_question, candidate_answer, OPENAI_API_KEY
+        )
 
-    # Update the last question with the candidate's answer and evaluation
+    # Update the last question with the candidate's answer
     
     if last_question_object['topic'] == "Introduction":
         last_question_object['answer'] = candidate_answer
     
     last_question_object['candi_answer'] = candidate_answer
-    last_question_object['category'] = category
-    last_question_object['score'] = 0.1 if score==0.0 else score
+    conversation_memory.add_turn(session['session_id'], last_question_object['topic'], prev_question, candidate_answer)
+    results_log.answered(
+        session['session_id'],
+        len(session['questions']) - 1,
+        candidate_answer,
+        answer=candidate_answer if last_question_object['topic'] == "Introduction" else None
+    )
+    return pending_sentence
 
-    # Check if the last question was the introductory question
-    if last_question_object['topic'] == "Introduction":
-        # Proceed to generate the first regular question based on resume and job description
-        current_topic = session.get('interview_topics', [])[session.get('curr_topic_index', 0)]
-        current_topic_limit = session.get('interview_topics_limits', [])[session.get('curr_topic_index', 0)]
-
-        session['current_topic'] = current_topic
-        session['current_topic_limit'] = current_topic_limit
-
-        # Generate the first question for the current topic
-        first_question, first_answer = generate_first_question(
-            selected_subject=session['selected_subject'],
-            selected_grade=session['selected_grade'],
-            selected_board=session['selected_board'],
-            subject_syllabus=session['subject_syllabus'],
-            job_description=session['extracted_job_description'],
-            demo_question_list=session.get('demo_questions', ''),
-            curr_topic=current_topic,
-            API_KEY_OPEN_AI=OPENAI_API_KEY,
-            langchain_id=session['session_id'],
-            introduction_of_person=session.get('introduction', '')
-        )
 
-        # Append the first question to the session
-        session['questions'].append({
-            "topic": current_topic,
-            "question": first_question,
-            "answer": first_answer,
-            "candi_answer": "",
-            "category": "",
-            "score": "",
-        })
+def close_topic(plan):
+    """Start summarizing the topic just answered if the plan moves on from it."""
+    if not summary_config.get('map_reduce', True):
+        return
+    topic = session['questions'][-1]['topic']
+    if plan['kind'] == "finished" or plan['topic'] != topic:
+        topic_summaries.submit(session['session_id'], topic)
+
+
+def resolve_connecting_sentence(pending_sentence):
+    connecting_sentence = None
+    if pending_sentence is not None:
+        try:
+            connecting_sentence = pending_sentence.result()
+        except Exception:
+            pass
+    return connecting_sentence or local_connecting_sentence()
+
+
+def finish_interview():
+    # No more topics, interview is finished
+    session['interview_finished'] = True
+
+    # Save the video file path
+    session['video_filename'] = f"{session.get('session_id', 'unknown')}_interview_video.avi"
 
-        # Save the new question to JSON
-        save_questions_to_json()
 
+def advance_to(plan):
+    # Move to the planned topic (a no-op within the current topic)
+    session['curr_topic_index'] = plan['topic_index']
+    session['current_topic'] = plan['topic']
+    session['current_topic_limit'] = plan['topic_limit']
+
+
+def append_question(topic, question, answer):
+    session['questions'].append({
+        "topic": topic,
+        "question": question,
+        "answer": answer,
+        "candi_answer": "",
+        "category": "",
+        "score": "",
+    })
+
+    # Record the new question
+    log_question(len(session['questions']) - 1)
+
+
+def read_candidate_answer():
+    """Validate a /next_question request; returns (candidate_answer, error_response)."""
+    if not session.get('interview_started', False):
+        return None, (jsonify({"error": "Interview has not been started."}), 400)
+
+    data = request.json
+    candidate_answer = data.get('candidate_answer', '')
+
+    if not candidate_answer:
+        return None, (jsonify({"error": "No candidate answer provided."}), 400)
+    return candidate_answer, None
+
+
+@app.route('/next_question', methods=["POST"])
+def next_question():
+    app.logger.debug("Processing next question")
+    candidate_answer, error = read_candidate_answer()
+    if error:
+        return error
+
+    # The next question doesn't depend on the grade, so it is generated while grading runs.
+    # A question prefetched from this exact answer is reused; otherwise it is generated here,
+    # on the request thread, so turns never queue behind the shared prefetch pool.
+    plan = plan_next_turn()
+    pending_question = speculative_questions.take(
+        session['session_id'], speculation_key(len(session['questions']), plan, candidate_answer)
+    )
+
+    pending_sentence = record_answer(candidate_answer)
+    close_topic(plan)
+    # Bound after the answer is recorded, so the question is written from it
+    generate = question_generator_for(plan)
+
+    if plan['kind'] == "finished":
+        finish_interview()
         return jsonify({
-            "question": session['questions'][-1],
-            "interview_finished": False,
-            "connecting_sentence": connecting_sentence
+            "interview_finished": True
         }), 200
 
-    # Proceed with the existing flow for regular questions
-    # Check if we need to move to the next topic
-    current_topic = session.get('current_topic', 'general')
-    current_topic_limit = session.get('current_topic_limit')
-    questions_count = sum(1 for q in session['questions'] if q['topic'] == current_topic)
+    advance_to(plan)
 
-    if questions_count >= current_topic_limit:
-        # Save current topic's questions to JSON
-        save_questions_to_json()
-
-        # Check if there are more topics
-        if session['curr_topic_index'] + 1 < len(session['interview_topics']):
-            # Move to next topic
-            session['curr_topic_index'] += 1
-            next_topic = session['interview_topics'][session['curr_topic_index']]
-            next_topic_limit = session['interview_topics_limits'][session['curr_topic_index']]
-
-            session['current_topic'] = next_topic
-            session['current_topic_limit'] = next_topic_limit
-
-            # Generate the first question for the new topic
-            next_question, next_answer = generate_first_question(
-                selected_subject=session['selected_subject'],
-                selected_grade=session['selected_grade'],
-                selected_board=session['selected_board'],
-                subject_syllabus=session['subject_syllabus'],
-                job_description=session['extracted_job_description'],
-                demo_question_list=session['demo_questions'],
-                curr_topic=next_topic,
-                API_KEY_OPEN_AI=OPENAI_API_KEY,
-                langchain_id=session['session_id'],
-                introduction_of_person=session.get('introduction', '')
-            )
-
-            # Append the first question to the session
-            session['questions'].append({
-                "topic": next_topic,
-                "question": next_question,
-                "answer": next_answer,
-                "candi_answer": "",
-                "category": "",
-                "score": "",
-            })
-
-            # Save the new topic's questions to JSON
-            save_questions_to_json()
-
-            return jsonify({
-                "question": session['questions'][-1],
-                "interview_finished": False,
-                "connecting_sentence": connecting_sentence
-            }), 200
+    question = answer = None
+    if pending_question is not None:
+        try:
+            question, answer = pending_question.result()
+        except Exception:
+            # A failed speculative run shouldn't fail the turn; generate it again below
+            pass
+    if question is None:
+        question, answer = generate()
 
-        else:
-            # No more topics, interview is finished
-            # Save final questions to JSON
-            save_questions_to_json()
+    connecting_sentence = resolve_connecting_sentence(pending_sentence)
+    append_question(plan['topic'], question, answer)
 
-            session['interview_finished'] = True
+    return jsonify({
+        "question": session['questions'][-1],
+        "interview_finished": False,
+        "connecting_sentence": connecting_sentence
+    }), 200
 
-            # Save the video file path
-            session['video_filename'] = f"{session.get('session_id', 'unknown')}_interview_video.avi"
-            
-            return jsonify({
-                "interview_finished": True
-            }), 200
 
-    else:
-        # Generate the next question within the current topic
-        next_question, next_answer = generate_next_question(
-            subject_syllabus=session['subject_syllabus'],
-            selected_grade=session['selected_grade'],
-            selected_board=session['selected_board'],
-            selected_subject=session['selected_subject'],
-            curr_topic=session['current_topic'],
-            resume_of_person=session['candidate_resume'],
-            introduction_of_person=session.get('introduction', ''),
-            langchain_id=session['session_id'],
-            API_KEY_OPEN_AI=OPENAI_API_KEY
-        )
+def stream_question_events(stream):
+    """
+    Relay a streamed question completion as SSE events: `delta` for every new
+    piece of the question text and `question` as soon as the field is closed,
+    before the ideal answer has finished generating. Returns (question, answer).
+    The upstream stream is closed when this generator is, e.g. on disconnect.
+    """
+    parser = IncrementalJSONParser()
+    raw = []
+    try:
+        for piece in stream:
+            raw.append(piece)
+            for kind, path, value in parser.feed(piece):
+                if path != ('question',):
+                    continue
+                if kind == 'delta':
+                    yield sse_event('delta', {"field": "question", "text": value})
+                else:
+                    yield sse_event('question', {"question": value})
+    finally:
+        stream.close()
 
-        session['questions'].append({
-            "topic": session['current_topic'],
-            "question": next_question,
-            "answer": next_answer,
-            "candi_answer": "",
-            "category": "",
-            "score": "",
-        })
+    data = parser.result
+    if data is None:
+        data = json.loads("".join(raw).replace("```json", "").replace("```", "").strip())
+    return data["question"], data["answer"]
 
-        # Save the new question to JSON
-        save_questions_to_json()
 
-        return jsonify({
+@app.route('/next_question_stream', methods=["POST"])
+def next_question_stream():
+    """SSE variant of /next_question: the question text is streamed as it is generated."""
+    candidate_answer, error = read_candidate_answer()
+    if error:
+        return error
+
+    plan = plan_next_turn()
+    pending_question = speculative_questions.take(
+        session['session_id'], speculation_key(len(session['questions']), plan, candidate_answer)
+    )
+
+    pending_sentence = record_answer(candidate_answer)
+    close_topic(plan)
+    generate = question_generator_for(plan)
+    stream_question = question_generator_for(plan, stream=True)
+
+    if plan['kind'] == "finished":
+        finish_interview()
+        return Response(sse_event('done', {"interview_finished": True}), mimetype="text/event-stream")
+
+    advance_to(plan)
+
+    def events():
+        connecting_sentence = resolve_connecting_sentence(pending_sentence)
+        yield sse_event('connecting', {"connecting_sentence": connecting_sentence})
+
+        question = answer = None
+        if pending_question is not None:
+            try:
+                question, answer = pending_question.result()
+                yield sse_event('question', {"question": question})
+            except Exception:
+                question = None
+        if question is None:
+            try:
+                question, answer = yield from stream_question_events(stream_question())
+            except Exception:
+                # Fall back to a regular call if the stream broke off or was malformed
+                question, answer = generate()
+
+        append_question(plan['topic'], question, answer)
+        persist_session()
+        yield sse_event('done', {
             "question": session['questions'][-1],
             "interview_finished": False,
             "connecting_sentence": connecting_sentence
-        }), 200
+        })
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @app.route("/get_questions", methods=["GET"])
 def get_questions():
     if not session.get('interview_started', False):
         return jsonify({"error": "Interview has not been started."}), 400
 
+    # Scores are filled in by the background grader; answers still being graded
+    # are left blank (and counted in `grading`) rather than held up for
+    scores = scoring_queue.wait(session['session_id'], timeout=scoring_config.get('questions_wait_s', 0))
+    apply_scores(session['questions'], scores)
+
     ret_json = {
-        "questions": session["questions"]
+        "questions": session["questions"],
+        "grading": scoring_queue.pending(session['session_id'])
     }
 
     return ret_json
 
-# Function to save questions to a JSON file
-def save_questions_to_json():
-    if 'session_id' not in session:
-        print("No session_id found. Cannot save questions.")
-        return
-
-    session_id = session['session_id']
-    current_topic = session.get('current_topic', 'general')
-    filename = f"{session_id}_all_questions.json"
-    file_path = os.path.join(INTERVIEW_RESULTS_DIR, filename)
-
-    # Extract questions related to the current topic
-    topic_questions = [q for q in session['questions']]
-
-    # Save the topic's questions
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(topic_questions, f, ensure_ascii=False, indent=4)
-
-    print(f"Saved interview questions to {file_path}")
+def log_question(index):
+    """Append the question at `index` to the session's results log."""
+    question = session['questions'][index]
+    results_log.asked(session['session_id'], index, question['topic'], question['question'], question['answer'])
 
 
 # Route to handle audio upload and transcription
 @app.route("/upload_audio_chunk", methods=["POST"])
 def upload_audio_chunk():
-    file_id = request.form.get("file_id")
-    try:
-        chunk_number = int(request.form.get("chunk_number", 0))
-    except ValueError:
-        return jsonify({"error": "Invalid chunk number"}), 400
-
+    """
+    Write a piece of an answer recording at its byte `offset`. The body is
+    either raw (Content-Type: application/octet-stream, file_id/offset in the
+    query string) or the original multipart form. `restart=1` starts the
+    file_id's recording over. Old clients that only send `chunk_number` are
+    treated as appending to the bytes received so far.
+    """
+    file_id = request.values.get("file_id")
     if not file_id:
         return jsonify({"error": "Missing file_id"}), 400
+    file_id = secure_filename(file_id)
 
-    if "audio_chunk" not in request.files:
-        return jsonify({"error": "No audio chunk provided"}), 400
-
-    audio_chunk = request.files["audio_chunk"]
-
-    # Use a safe filename based on file_id.
-    filename = secure_filename(file_id) + ".wav"
-    file_path = os.path.join(UPLOADS_DIR, filename)
+    try:
+        chunk_number = int(request.values.get("chunk_number", 0))
+        offset = request.values.get("offset")
+        if offset is not None:
+            offset = int(offset)
+    except ValueError:
+        return jsonify({"error": "Invalid chunk number or offset"}), 400
+
+    length = None
+    # The recorder's MIME type names the container, so decoding never has to probe it
+    mime_type = request.values.get("mime")
+    if request.mimetype == 'application/octet-stream':
+        # Streamed to disk as it is read
+        source = request.stream
+        length = request.content_length
+    else:
+        if "audio_chunk" not in request.files:
+            return jsonify({"error": "No audio chunk provided"}), 400
+        source = request.files["audio_chunk"].stream
+        mime_type = mime_type or request.files["audio_chunk"].mimetype
+        # Form parts are spooled already; their size lets a retried piece be recognised
+        source.seek(0, os.SEEK_END)
+        length = source.tell()
+        source.seek(0)
+
+    restart = request.values.get("restart") in ("1", "true")
+    if offset is None:
+        offset = 0 if chunk_number <= 1 else (audio_uploads.offset(file_id) or 0)
+    if offset < 0:
+        return jsonify({"error": "Invalid offset"}), 400
 
-    # For the first chunk, write a new file; for subsequent chunks, append.
-    mode = "wb" if chunk_number == 1 else "ab"
     try:
-        with open(file_path, mode) as f:
-            f.write(audio_chunk.read())
+        with timed("audio_chunk_write"):
+            result = audio_uploads.write(file_id, offset, source, length=length, restart=restart)
     except Exception as e:
         return jsonify({"error": f"Error writing chunk: {str(e)}"}), 500
 
-    return jsonify({"success": True, "chunk_number": chunk_number})
+    # Start transcribing finished speech before the candidate stops recording.
+    # Only bytes that just became contiguous are fed, so retries aren't transcribed twice.
+    if result["offset"] > result["before"]:
+        streaming_transcriber.feed(
+            file_id,
+            audio_uploads.read(file_id, result["before"], result["offset"]),
+            offset=result["before"],
+            format_hint=format_from_mime(mime_type)
+        )
+
+    return jsonify({
+        "success": True,
+        "chunk_number": chunk_number,
+        "offset": result["offset"],
+        "duplicate": result["duplicate"],
+    })
+
+@app.route("/audio_upload_offset/<file_id>", methods=["GET"])
+def audio_upload_offset(file_id):
+    """Where a client should resume an interrupted upload."""
+    offset = audio_uploads.offset(secure_filename(file_id))
+    if offset is None:
+        return jsonify({"error": "Unknown file_id"}), 404
+    return jsonify({"file_id": file_id, "offset": offset})
+
+@app.route("/partial_transcription/<file_id>", methods=["GET"])
+def partial_transcription(file_id):
+    transcription = streaming_transcriber.partial(file_id)
+    if transcription is None:
+        return jsonify({"error": "Unknown file_id"}), 404
+    return jsonify({"file_id": file_id, "transcription": transcription})
 
 @app.route("/finish_audio_upload", methods=["POST"])
 def finish_audio_upload():
@@ -598,58 +1127,261 @@ def finish_audio_upload():
     if not file_id:
         return jsonify({"error": "Missing file_id"}), 400
 
-    filename = secure_filename(file_id) + ".wav"
-    file_path = os.path.join(UPLOADS_DIR, filename)
+    file_id = secure_filename(file_id)
+    file_path = audio_uploads.path(file_id)
+
+    # The client says how many bytes it sent; anything missing is resent first
+    size = data.get("size")
+    if size is not None:
+        try:
+            size = int(size)
+        except (TypeError, ValueError):
+            return jsonify({"error": "Invalid size"}), 400
+        if size < 0:
+            return jsonify({"error": "Invalid size"}), 400
+    received, complete = audio_uploads.complete(file_id, size=size)
+    if not complete and received is not None:
+        return jsonify({"error": "Upload incomplete", "offset": received}), 409
+
     if not os.path.exists(file_path):
         return jsonify({"error": "File not found"}), 404
 
-    # Transcribe the complete audio file.
-    try:
-        transcription = transcribe_audio(file_path)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-    finally:
-        # Optionally, remove the temporary file after processing.
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    # Latency-sensitive callers can ask for the fast model/beam settings
+    fast = bool(data.get("fast", False))
+    format_hint = format_from_mime(data.get("mime"))
 
-    return jsonify({"transcription": transcription})
+    if received is None:
+        received = os.path.getsize(file_path)
+    prefetch = answer_prefetcher()
 
-def transcribe_audio(file_path):
+    def transcribe():
+        try:
+            if streaming_transcriber.fed(file_id) == received:
+                # Most of the answer is already transcribed; only the tail is left
+                return streaming_transcriber.finish(file_id)
+            # Some chunks were handled by another worker (or never fed): decode the whole upload
+            streaming_transcriber.discard(file_id)
+            return transcribe_audio(file_path, fast=fast, format_hint=format_hint)
+        finally:
+            # Remove the temporary file after processing.
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def task():
+        transcription = transcribe()
+        if prefetch is not None and transcription:
+            # Start on the next question while the client picks the transcript up and submits it
+            prefetch(transcription)
+        return transcription
+
+    # Queue the complete audio file; clients poll or stream the job status.
+    try:
+        job = transcription_queue.submit(file_id, task)
+    except QueueFull as e:
+        return jsonify({"error": str(e)}), 503
+
+    return jsonify({"job_id": job.id, "status": job.status}), 202
+
+@app.route("/transcription_status/<job_id>", methods=["GET"])
+def transcription_status(job_id):
+    job = transcription_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    return jsonify(job.to_dict())
+
+@app.route("/transcription_stream/<job_id>", methods=["GET"])
+def transcription_stream(job_id):
+    job = transcription_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+
+    def events():
+        last_status = None
+        while True:
+            finished = job.finished.wait(timeout=1.0)
+            if job.status != last_status or finished:
+                last_status = job.status
+                yield sse_event('status', job.to_dict())
+            if finished:
+                return
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route("/llm_cache_stats", methods=["GET"])
+def llm_cache_stats():
+    if llm_cache is None:
+        return jsonify({"enabled": False})
+    return jsonify(dict(llm_cache.stats(), enabled=True))
+
+@app.route("/topic_summary_stats", methods=["GET"])
+def topic_summary_stats():
+    return jsonify(topic_summaries.stats())
+
+
+@app.route("/conversation_memory_stats", methods=["GET"])
+def conversation_memory_stats():
+    return jsonify(conversation_memory.stats())
+
+@app.route("/document_stats", methods=["GET"])
+def document_stats():
+    return jsonify(document_extractor.stats())
+
+@app.route("/results_log_stats", methods=["GET"])
+def results_log_stats():
+    return jsonify(results_log.stats())
+
+@app.route("/session_stats", methods=["GET"])
+def session_stats():
+    return jsonify(app.session_interface.stats())
+
+@app.route("/llm_stats", methods=["GET"])
+def llm_stats():
+    return jsonify(gateway.stats())
+
+@app.route("/scoring_stats", methods=["GET"])
+def scoring_stats():
+    return jsonify(scoring_queue.stats())
+
+@app.route("/speculation_stats", methods=["GET"])
+def speculation_stats():
+    return jsonify(speculative_questions.stats())
+
+@app.route("/process_pool_stats", methods=["GET"])
+def process_pool_stats():
+    return jsonify({name: pool.stats() for name, pool in inference_pools.items()})
+
+
+@app.route("/transcription_metrics", methods=["GET"])
+def transcription_metrics():
+    stats = transcription_queue.metrics()
+    stats["model_pools"] = whisper_engine.stats()
+    stats["uploads"] = audio_uploads.stats()
+    stats["vad"] = whisper_engine.vad_stats()
+    return jsonify(stats)
+
+def transcribe_audio(file_path, fast=False, format_hint=None):
     """
     Transcribe the audio file using faster-whisper.
+    The recording is read once and decoded in memory to 16 kHz float32.
     Returns a string containing the transcription.
     """
-    segments, info = model.transcribe(file_path)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    with timed("audio_decode"):
+        try:
+            audio = decode_bytes(data, format_hint)
+        except Exception:
+            if format_hint is None:
+                raise
+            # The MIME type was wrong; let FFmpeg probe the container instead
+            audio = decode_bytes(data)
+    segments, info = models.get('whisper').transcribe(audio, fast=fast)
     transcription = " ".join([segment.text for segment in segments])
     return transcription
 
 
+def load_final_results():
+    """Wait for outstanding grades and write the final results document; returns (questions, error_response)."""
+    session_id = session.get('session_id')
+    if not session_id:
+        return None, (jsonify({"error": "No interview in this session."}), 400)
+
+    # Only wait for answers that are still being graded
+    with timed("scoring_wait"):
+        scoring_queue.wait(session_id, timeout=scoring_config.get('wait_timeout_s', 60))
+
+    # Served from the in-memory replay of the results log
+    with timed("results_finalize"):
+        questions = results_log.finalize(session_id)
+    if questions is None:
+        return None, (jsonify({"error": f"No results recorded for session '{session_id}'."}), 404)
+    # Face verification is long over; the reference embedding isn't needed any more
+    reference_embeddings.discard(session_id)
+    return questions, None
+
+
+def final_topic_summaries(questions):
+    """Per-topic summaries for the reduce step, or None to summarize the full transcript."""
+    if not summary_config.get('map_reduce', True):
+        return None
+    topics = list(dict.fromkeys(q['topic'] for q in questions))
+    with timed("topic_summaries_wait"):
+        return topic_summaries.collect(session['session_id'], topics,
+                                       timeout=summary_config.get('wait_timeout_s', 30))
+
+
 @app.route('/end_interview', methods=['POST'])
 def end_interview():
-    save_questions_to_json()
     try:
         data = request.get_json()
-        session_id = session['session_id']
-        
-        filename = os.path.join(INTERVIEW_RESULTS_DIR, f"{session_id}_all_questions.json")
-        
-        # Read the JSON file
-        try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                questions = json.load(file)
-        except FileNotFoundError:
-            return jsonify({"error": f"File '{filename}' not found."}), 404
-        except json.JSONDecodeError:
-            return jsonify({"error": f"File '{filename}' is not a valid JSON file."}), 400
+        questions, error = load_final_results()
+        if error:
+            return error
             
         # Prepare the prompt for GPT
         summary = summarize_interview(questions=questions, 
                                             resume_text=session.get('candidate_resume', ''), 
                                             introduction=session.get('introduction', ''), 
-                                            OPENAI_API_KEY=OPENAI_API_KEY)
+                                            OPENAI_API_KEY=OPENAI_API_KEY,
+                                            topic_summaries=final_topic_summaries(questions))
         
         return {'summary' : summary}
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+
+# Completed summary values up to this depth (e.g. topic_scores.<topic>.score)
+# are sent as `field` events so the report can be filled in while it streams.
+SUMMARY_FIELD_DEPTH = 3
+
+
+@app.route('/end_interview_stream', methods=['POST'])
+def end_interview_stream():
+    """SSE variant of /end_interview: summary fields are sent as soon as each one is complete."""
+    if 'session_id' not in session:
+        return jsonify({"error": "Interview has not been started."}), 400
+    try:
+        questions, error = load_final_results()
+        if not error:
+            summaries = final_topic_summaries(questions)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    if error:
+        return error
+
+    resume_text = session.get('candidate_resume', '')
+    introduction = session.get('introduction', '')
+
+    def events():
+        parser = IncrementalJSONParser()
+        raw = []
+        upstream = stream_interview_summary(questions=questions,
+                                            resume_text=resume_text,
+                                            introduction=introduction,
+                                            OPENAI_API_KEY=OPENAI_API_KEY,
+                                            topic_summaries=summaries)
+        try:
+            for piece in upstream:
+                raw.append(piece)
+                for kind, path, value in parser.feed(piece):
+                    if not path or len(path) > SUMMARY_FIELD_DEPTH:
+                        continue
+                    if kind == 'value':
+                        yield sse_event('field', {"path": list(path), "value": value})
+                    else:
+                        yield sse_event('delta', {"path": list(path), "text": value})
+            summary = parser.result
+            if summary is None:
+                summary = json.loads("".join(raw).replace("```json", "").replace("```", "").strip())
+        except Exception as e:
+            yield sse_event('failed', {"error": str(e)})
+            return
+        finally:
+            # Frees the gateway slot right away if the client went away mid-summary
+            upstream.close()
+        yield sse_event('summary', {"summary": summary})
+
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class ScoringQueue:
+    """
+    Grades answers off the request path.
+
+    `submit` queues a grading call for question `index` of a session and
+    returns immediately. When the grade arrives it is kept in memory and
+    passed to `on_scored(session_id, index, category, score)`, which records
+    it in the results log. `wait` blocks until a session has no
+    outstanding jobs, which is all /end_interview needs to do, or only
+    until the given questions are graded. `discard`
+    forgets a session's grades and drops those still being computed.
+    """
+
+    def __init__(self, grade, on_scored, max_workers=4, max_sessions=1024):
+        self.grade = grade
+        self.on_scored = on_scored
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scoring")
+        self.max_sessions = max_sessions
+        self._jobs = {}
+        self._scores = OrderedDict()
+        # Bumped by discard(); grades from an older generation are dropped
+        self._generations = OrderedDict()
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.total_ms = 0.0
+
+    def submit(self, session_id, index, question, answer, candi_answer):
+        with self._lock:
+            generation = self._generations.get(session_id, 0)
+        future = self._executor.submit(self._run, session_id, generation, index, question, answer, candi_answer)
+        with self._lock:
+            self._jobs.setdefault(session_id, {})[future] = index
+        future.add_done_callback(lambda done: self._forget(session_id, done))
+        return future
+
+    def _forget(self, session_id, future):
+        with self._lock:
+            jobs = self._jobs.get(session_id)
+            if jobs is not None:
+                jobs.pop(future, None)
+                if not jobs:
+                    del self._jobs[session_id]
+
+    def _run(self, session_id, generation, index, question, answer, candi_answer):
+        started = time.perf_counter()
+        try:
+            category, score = self.grade(question=question, answer=answer, candi_answer=candi_answer)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        score = 0.1 if score == 0.0 else score
+        with self._lock:
+            if self._generations.get(session_id, 0) != generation:
+                # The interview was restarted while this answer was being graded
+                return category, score
+            self._scores.setdefault(session_id, {})[index] = (category, score)
+            self._scores.move_to_end(session_id)
+            while len(self._scores) > self.max_sessions:
+                self._scores.popitem(last=False)
+            self.completed += 1
+            self.total_ms += (time.perf_counter() - started) * 1000
+        self.on_scored(session_id, index, category, score)
+        return category, score
+
+    def pending(self, session_id):
+        with self._lock:
+            return len(self._jobs.get(session_id, ()))
+
+    def wait(self, session_id, timeout=None, indexes=None):
+        """
+        Wait for the session's outstanding jobs, or just those grading
+        `indexes`; returns {index: (category, score)}.
+        """
+        with self._lock:
+            jobs = [job for job, index in self._jobs.get(session_id, {}).items()
+                    if indexes is None or index in indexes]
+        if jobs:
+            wait(jobs, timeout=timeout)
+        return self.scores(session_id)
+
+    def scores(self, session_id):
+        with self._lock:
+            return dict(self._scores.get(session_id, {}))
+
+    def discard(self, session_id):
+        with self._lock:
+            self._scores.pop(session_id, None)
+            self._generations[session_id] = self._generations.get(session_id, 0) + 1
+            self._generations.move_to_end(session_id)
+            while len(self._generations) > self.max_sessions:
+                self._generations.popitem(last=False)
+            jobs = list(self._jobs.get(session_id, ()))
+        for job in jobs:
+            job.cancel()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "outstanding": sum(len(jobs) for jobs in self._jobs.values()),
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_ms": round(self.total_ms / self.completed, 1) if self.completed else 0.0,
+            }
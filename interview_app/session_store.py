@@ -0,0 +1,371 @@
+import hashlib
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from interview_app.metrics import timed
+
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class CompactSession(CallbackDict, SessionMixin):
+    """Server-side session; remembers what was loaded so unchanged state isn't written back."""
+
+    def __init__(self, initial=None, sid=None, new=False, state_digest=None, saved_at=None, blobs=None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.state_digest = state_digest
+        self.saved_at = saved_at
+        # key -> (value, digest) for values that came from the blob store
+        self.blobs = blobs or {}
+
+
+class MemorySessionBackend:
+    """Sessions and blobs in process memory. Only suitable for a single worker process."""
+
+    def __init__(self):
+        self._sessions = {}
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+    def load(self, sid):
+        with self._lock:
+            return self._sessions.get(sid)
+
+    def save(self, sid, payload, saved_at, expires_at, blob_digests):
+        """Store the session and touch its blobs; returns the digests that no longer exist."""
+        missing = []
+        with self._lock:
+            self._sessions[sid] = (payload, saved_at, expires_at)
+            for digest in blob_digests:
+                if digest in self._blobs:
+                    self._blobs[digest] = (self._blobs[digest][0], saved_at)
+                else:
+                    missing.append(digest)
+        return missing
+
+    def delete(self, sid):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def has_blob(self, digest):
+        with self._lock:
+            return digest in self._blobs
+
+    def put_blob(self, digest, data, now):
+        with self._lock:
+            self._blobs[digest] = (data, now)
+
+    def get_blob(self, digest):
+        with self._lock:
+            entry = self._blobs.get(digest)
+            return entry[0] if entry else None
+
+    def cleanup(self, now, lifetime):
+        with self._lock:
+            for sid in [sid for sid, entry in self._sessions.items() if entry[2] < now]:
+                del self._sessions[sid]
+            for digest in [d for d, entry in self._blobs.items() if entry[1] < now - lifetime]:
+                del self._blobs[digest]
+
+
+class SQLiteSessionBackend:
+    """
+    Sessions and blobs in one SQLite file (WAL mode), shared by all worker
+    processes on the host. The file is opened on first use, so building the
+    app creates nothing and forked workers never share a connection.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        # Called with self._lock held
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " sid TEXT PRIMARY KEY, payload BLOB, saved_at REAL, expires_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " digest TEXT PRIMARY KEY, data BLOB, touched_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS blobs_touched ON blobs (touched_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def load(self, sid):
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, saved_at, expires_at FROM sessions WHERE sid = ?", (sid,)
+            ).fetchone()
+        return (bytes(row[0]), row[1], row[2]) if row else None
+
+    def save(self, sid, payload, saved_at, expires_at, blob_digests):
+        """Store the session and touch its blobs; returns the digests that no longer exist."""
+        missing = []
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (sid, payload, saved_at, expires_at) VALUES (?, ?, ?, ?)",
+                (sid, payload, saved_at, expires_at),
+            )
+            for digest in blob_digests:
+                cursor = conn.execute("UPDATE blobs SET touched_at = ? WHERE digest = ?", (saved_at, digest))
+                if cursor.rowcount == 0:
+                    missing.append(digest)
+            conn.commit()
+        return missing
+
+    def delete(self, sid):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+            conn.commit()
+
+    def has_blob(self, digest):
+        with self._lock:
+            conn = self._connection()
+            return conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone() is not None
+
+    def put_blob(self, digest, data, now):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO blobs (digest, data, touched_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(digest) DO UPDATE SET touched_at = excluded.touched_at",
+                (digest, data, now),
+            )
+            conn.commit()
+
+    def get_blob(self, digest):
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT data FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def cleanup(self, now, lifetime):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM sessions WHERE expires_at < ?", (now,))
+            # A blob is only referenced by sessions saved after it was last touched
+            conn.execute("DELETE FROM blobs WHERE touched_at < ?", (now - lifetime,))
+            conn.commit()
+
+
+class CompactSessionInterface(SessionInterface):
+    """
+    Server-side sessions that store little and write rarely.
+
+    Large, write-once values (resume, JD, syllabus, demo questions) are kept
+    once in a content-addressed blob store and referenced from the session
+    by digest; blobs are immutable, so each process also caches them in
+    memory. The remaining state is pickled and only written back when its
+    hash changes, or when the expiry needs to be pushed forward, so chunk
+    uploads and polling requests don't rewrite the session at all.
+
+    Values under `blob_keys` are shared between sessions through the cache,
+    so they must be replaced rather than mutated in place.
+    """
+
+    def __init__(self, backend, blob_keys=(), blob_min_bytes=1024, refresh_fraction=0.1,
+                 blob_cache_entries=256, cleanup_interval_s=300):
+        self.backend = backend
+        self.blob_keys = frozenset(blob_keys)
+        self.blob_min_bytes = blob_min_bytes
+        self.refresh_fraction = refresh_fraction
+        self.blob_cache_entries = blob_cache_entries
+        self.cleanup_interval_s = cleanup_interval_s
+        self._blob_cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_cleanup = 0.0
+        self.loads = 0
+        self.writes = 0
+        self.skipped_writes = 0
+        self.blob_writes = 0
+
+    @classmethod
+    def from_config(cls, settings):
+        if settings.get('backend', 'sqlite') == 'memory':
+            backend = MemorySessionBackend()
+        else:
+            backend = SQLiteSessionBackend(settings.get('path') or os.path.join(os.getcwd(), "cache", "sessions.sqlite3"))
+        return cls(
+            backend,
+            blob_keys=settings.get('blob_keys') or (),
+            blob_min_bytes=int(settings.get('blob_min_bytes', 1024)),
+            refresh_fraction=float(settings.get('refresh_fraction', 0.1)),
+            blob_cache_entries=int(settings.get('blob_cache_entries', 256)),
+        )
+
+    # -- blobs ----------------------------------------------------------
+    def _cache_blob(self, digest, value):
+        with self._lock:
+            self._blob_cache[digest] = value
+            self._blob_cache.move_to_end(digest)
+            while len(self._blob_cache) > self.blob_cache_entries:
+                self._blob_cache.popitem(last=False)
+
+    def _load_blob(self, digest):
+        with self._lock:
+            if digest in self._blob_cache:
+                self._blob_cache.move_to_end(digest)
+                return True, self._blob_cache[digest]
+        data = self.backend.get_blob(digest)
+        if data is None:
+            return False, None
+        value = pickle.loads(data)
+        self._cache_blob(digest, value)
+        return True, value
+
+    def _store_blob(self, value, now):
+        data = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+        if len(data) < self.blob_min_bytes:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        # Always upsert: a blob still in this process's cache may have been
+        # cleaned up in the store after the sessions using it expired
+        self.backend.put_blob(digest, data, now)
+        with self._lock:
+            self.blob_writes += 1
+        self._cache_blob(digest, value)
+        return digest
+
+    # -- SessionInterface -----------------------------------------------
+    def _new_session(self, app):
+        session = CompactSession(sid=secrets.token_urlsafe(32), new=True)
+        session.permanent = app.config.get('SESSION_PERMANENT', True)
+        session.modified = False
+        return session
+
+    @timed("session_load")
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid:
+            return self._new_session(app)
+
+        record = self.backend.load(sid)
+        if record is None or record[2] < time.time():
+            return self._new_session(app)
+        payload, saved_at, _expires_at = record
+        try:
+            state, refs = pickle.loads(payload)
+        except Exception:
+            return self._new_session(app)
+
+        blobs = {}
+        for key, digest in refs.items():
+            found, value = self._load_blob(digest)
+            if not found:
+                # Blob was collected underneath a live session; drop the key rather than fail
+                continue
+            state[key] = value
+            blobs[key] = (value, digest)
+
+        with self._lock:
+            self.loads += 1
+        return CompactSession(state, sid=sid, state_digest=hashlib.sha256(payload).hexdigest(),
+                              saved_at=saved_at, blobs=blobs)
+
+    def _split(self, session, now):
+        state, refs = {}, {}
+        for key, value in session.items():
+            if key in self.blob_keys:
+                loaded = session.blobs.get(key)
+                if loaded is not None and loaded[0] is value:
+                    refs[key] = loaded[1]
+                    continue
+                digest = self._store_blob(value, now)
+                if digest is not None:
+                    refs[key] = digest
+                    session.blobs[key] = (value, digest)
+                    continue
+            state[key] = value
+        return state, refs
+
+    @timed("session_save")
+    def save_session(self, app, session, response):
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        name = self.get_cookie_name(app)
+
+        if not session:
+            if not session.new:
+                self.backend.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        now = time.time()
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        state, refs = self._split(session, now)
+        payload = pickle.dumps((state, refs), protocol=PICKLE_PROTOCOL)
+        state_digest = hashlib.sha256(payload).hexdigest()
+
+        refresh_due = session.saved_at is None or now - session.saved_at > lifetime * self.refresh_fraction
+        if state_digest == session.state_digest and not refresh_due:
+            with self._lock:
+                self.skipped_writes += 1
+            return
+
+        missing = self.backend.save(session.sid, payload, now, now + lifetime, list(refs.values()))
+        for key, digest in refs.items():
+            if digest in missing:
+                # Cleaned up underneath this session; write it back from the value in hand
+                self.backend.put_blob(digest, pickle.dumps(session[key], protocol=PICKLE_PROTOCOL), now)
+                with self._lock:
+                    self.blob_writes += 1
+        with self._lock:
+            self.writes += 1
+        session.state_digest = state_digest
+        session.saved_at = now
+        session.new = False
+        self._maybe_cleanup(now, lifetime)
+
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+    def _maybe_cleanup(self, now, lifetime):
+        with self._lock:
+            if now - self._last_cleanup < self.cleanup_interval_s:
+                return
+            self._last_cleanup = now
+        self.backend.cleanup(now, lifetime)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "writes": self.writes,
+                "skipped_writes": self.skipped_writes,
+                "blob_writes": self.blob_writes,
+                "cached_blobs": len(self._blob_cache),
+            }
@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SpeculativeQuestions:
+    """
+    Generates next questions ahead of time (prefetch) on a shared thread pool.
+
+    `start` kicks off generation for a session under a key describing the
+    turn it was planned for (position, topic and the answer it follows). `take` hands the result
+    over only if the key still matches; a stale speculation is cancelled and
+    the caller generates the question normally.
+    """
+
+    def __init__(self, max_workers=4, max_entries=512):
+        self.max_entries = max_entries
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculate")
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self.started = 0
+        self.used = 0
+        self.discarded = 0
+
+    def submit(self, func, *args, **kwargs):
+        return self._executor.submit(func, *args, **kwargs)
+
+    def start(self, session_id, key, func):
+        with self._lock:
+            current = self._pending.get(session_id)
+            if current is not None and current[0] == key:
+                return current[1]
+            future = self._executor.submit(func)
+            self._pending[session_id] = (key, future)
+            self._pending.move_to_end(session_id)
+            while len(self._pending) > self.max_entries:
+                self._pending.popitem(last=False)[1][1].cancel()
+            self.started += 1
+            return future
+
+    def take(self, session_id, key):
+        with self._lock:
+            entry = self._pending.pop(session_id, None)
+            if entry is None:
+                return None
+            if entry[0] != key:
+                entry[1].cancel()
+                self.discarded += 1
+                return None
+            self.used += 1
+            return entry[1]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "started": self.started,
+                "used": self.used,
+                "discarded": self.discarded,
+                "pending": len(self._pending),
+            }
@@ -0,0 +1,108 @@
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+class TrimResult:
+    __slots__ = ("audio", "segments", "input_samples", "sampling_rate")
+
+    def __init__(self, audio, segments, input_samples, sampling_rate=SAMPLE_RATE):
+        self.audio = audio
+        # (start, end) sample ranges of the input that were kept
+        self.segments = segments
+        self.input_samples = input_samples
+        self.sampling_rate = sampling_rate
+
+    @property
+    def input_seconds(self):
+        return self.input_samples / self.sampling_rate
+
+    @property
+    def speech_seconds(self):
+        return self.audio.size / self.sampling_rate
+
+    @property
+    def compression_ratio(self):
+        return self.input_samples / self.audio.size if self.audio.size else float("inf")
+
+    def to_dict(self):
+        return {
+            "input_s": round(self.input_seconds, 2),
+            "speech_s": round(self.speech_seconds, 2),
+            "segments": len(self.segments),
+            "compression_ratio": round(self.compression_ratio, 2) if self.audio.size else None,
+        }
+
+
+def energy_speech_segments(audio, sampling_rate=SAMPLE_RATE, frame_ms=30, floor_db=-50.0, dynamic_range_db=35.0):
+    """
+    Frames louder than an adaptive threshold, as (start, end) sample ranges.
+    The threshold sits `dynamic_range_db` below the loud end of the recording
+    (its 95th percentile frame) but never under `floor_db`, so it follows the
+    microphone gain instead of assuming a fixed level.
+    """
+    frame = max(1, int(sampling_rate * frame_ms / 1000))
+    count = audio.size // frame
+    if count == 0:
+        return []
+    frames = audio[:count * frame].reshape(count, frame).astype(np.float32, copy=False)
+    rms_db = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    threshold = max(floor_db, float(np.percentile(rms_db, 95)) - dynamic_range_db)
+    voiced = rms_db > threshold
+
+    # Rising/falling edges of the voiced mask give the segment boundaries
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    return [(int(start) * frame, int(end) * frame) for start, end in zip(edges[::2], edges[1::2])]
+
+
+def silero_speech_segments(audio, sampling_rate=SAMPLE_RATE, min_silence_ms=500):
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    options = VadOptions(min_silence_duration_ms=min_silence_ms)
+    return [(s["start"], s["end"]) for s in get_speech_timestamps(audio, options, sampling_rate=sampling_rate)]
+
+
+def merge_segments(segments, total, sampling_rate=SAMPLE_RATE, min_speech_ms=200, min_silence_ms=500, pad_ms=200):
+    """Bridge pauses shorter than `min_silence_ms`, drop blips shorter than `min_speech_ms`, then pad."""
+    pad = int(sampling_rate * pad_ms / 1000)
+    min_gap = int(sampling_rate * min_silence_ms / 1000)
+    min_speech = int(sampling_rate * min_speech_ms / 1000)
+
+    merged = []
+    for start, end in segments:
+        if merged and start - merged[-1][1] < min_gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    padded = []
+    for start, end in merged:
+        if end - start < min_speech:
+            continue
+        start, end = max(0, start - pad), min(total, end + pad)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end)
+        else:
+            padded.append((start, end))
+    return padded
+
+
+def trim_silence(audio, sampling_rate=SAMPLE_RATE, backend="energy", min_speech_ms=200,
+                 min_silence_ms=500, pad_ms=200, **energy_options):
+    """
+    Drop leading/trailing silence and long pauses from a mono float32 array.
+    Returns a TrimResult with the concatenated speech and what was kept.
+    """
+    if backend == "silero":
+        segments = silero_speech_segments(audio, sampling_rate, min_silence_ms=min_silence_ms)
+    else:
+        segments = energy_speech_segments(audio, sampling_rate, **energy_options)
+    segments = merge_segments(segments, audio.size, sampling_rate, min_speech_ms=min_speech_ms,
+                              min_silence_ms=min_silence_ms, pad_ms=pad_ms)
+    if not segments:
+        trimmed = np.zeros(0, dtype=np.float32)
+    elif len(segments) == 1:
+        trimmed = audio[segments[0][0]:segments[0][1]]
+    else:
+        trimmed = np.concatenate([audio[start:end] for start, end in segments])
+    return TrimResult(trimmed, segments, audio.size, sampling_rate)
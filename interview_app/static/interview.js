@@ -6,21 +6,18 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // *** Variables for recording the local stream (video with audio) ***
     let videoMediaRecorder;
-    // A counter for keeping track of chunk numbers
-    let videoChunkCount = 0;
+    // The recording in progress: its id (each recording is assembled separately on
+    // the server), a counter for its chunk numbers and its uploads still in flight
+    let videoRecording = null;
 
-    // Function to send a video chunk (as a Blob) to the Flask server
-    async function sendVideoChunk(chunkBlob, chunkNumber) {
+    // Function to send a video chunk (as a Blob) to the Flask server.
+    // The raw blob is sent as the request body so the server can stream it to disk.
+    async function sendVideoChunk(chunkBlob, chunkNumber, recordingId) {
         try {
-            const formData = new FormData();
-            formData.append("video_chunk", chunkBlob, `chunk_${chunkNumber}.mp4`);
-            // Optionally send a chunk index so that server can track order
-            formData.append("chunk_number", chunkNumber);
-
-            // Send the chunk to your Flask endpoint (adjust the URL as needed)
-            await fetch("/upload_video_chunk", {
+            await fetch(`/upload_video_chunk?chunk_number=${chunkNumber}&recording_id=${recordingId}`, {
                 method: "POST",
-                body: formData        
+                headers: { "Content-Type": "application/octet-stream" },
+                body: chunkBlob
             });
         } catch (error) {
             console.error("Error sending video chunk:", error);
@@ -28,11 +25,15 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
     // Function to signal the end of video upload to the server,
-    // so that the server can combine and store the chunks.
-    async function signalVideoUploadFinished() {
+    // so that the server can move the assembled video into place.
+    // The upload is only finished after the recording's last chunk has been sent.
+    async function signalVideoUploadFinished(recording) {
         try {
+            await Promise.allSettled(recording.uploads);
             await fetch("/finish_video_upload", {
-                method: "POST"
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ recording_id: recording.id, total_chunks: recording.chunkCount })
             });
             console.log("Signaled server to finish video upload.");
         } catch (error) {
@@ -57,14 +58,16 @@ document.addEventListener("DOMContentLoaded", () => {
             videoMediaRecorder = new MediaRecorder(localStream, {
                 mimeType: 'video/webm; codecs=vp9',
             });
-            videoChunkCount = 0; // Reset the counter
+            // A new recording numbers its chunks from 1 again
+            const recording = { id: crypto.randomUUID(), chunkCount: 0, uploads: [] };
+            videoRecording = recording;
 
             // Set up the ondataavailable event to send video chunks as soon as they are available.
             videoMediaRecorder.ondataavailable = (e) => {
                 if (e.data && e.data.size > 0) {
-                    videoChunkCount++;
+                    recording.chunkCount++;
                     // Instead of saving the chunk locally, send it to the server.
-                    sendVideoChunk(e.data, videoChunkCount);
+                    recording.uploads.push(sendVideoChunk(e.data, recording.chunkCount, recording.id));
                 }
             };
 
@@ -93,8 +96,11 @@ document.addEventListener("DOMContentLoaded", () => {
 
     // Function to stop the local video stream and end the video upload on the server
     function stopLocalStream() {
-        // First, stop the MediaRecorder for the local stream if it is recording
+        // First, stop the MediaRecorder for the local stream if it is recording.
+        // The final chunk is delivered on stop, so finishing waits for it.
+        let recorderStopped = Promise.resolve();
         if (videoMediaRecorder && videoMediaRecorder.state !== "inactive") {
+            recorderStopped = new Promise(resolve => { videoMediaRecorder.onstop = resolve; });
             videoMediaRecorder.stop();
         }
 
@@ -112,7 +118,12 @@ document.addEventListener("DOMContentLoaded", () => {
             videoInterval = null;
             console.log('Video frame capturing interval cleared');
         }
-        signalVideoUploadFinished();
+        // Finish this recording with its own chunk count, even if another one starts meanwhile
+        const recording = videoRecording;
+        videoRecording = null;
+        if (recording) {
+            recorderStopped.then(() => signalVideoUploadFinished(recording));
+        }
     }
 
     // ===================== Interview and Audio Recording Code =====================
@@ -128,45 +139,74 @@ document.addEventListener("DOMContentLoaded", () => {
     let audioContext;
     let microphone;
 
-    // Helper function to upload the audio Blob in 1 MB chunks
-    async function uploadAudioBlobInChunks(blob, fileId, chunkSize = 512 * 1024) {
-        const totalSize = blob.size;
-        let offset = 0;
-        let chunkNumber = 1;
-        while (offset < totalSize) {
-            const chunk = blob.slice(offset, offset + chunkSize);
-            const formData = new FormData();
-            formData.append("file_id", fileId);
-            formData.append("chunk_number", chunkNumber);
-            formData.append("audio_chunk", chunk, `chunk_${chunkNumber}.wav`);
+    // Upload state for the answer currently being recorded
+    let audioFileId = null;
+    let audioMimeType = "";
+    let audioBytesQueued = 0;
+    let audioUploadChain = Promise.resolve();
+
+    // Send bytes of the recording that belong at `offset`; the server writes them in place
+    async function sendAudioBytes(blob, fileId, offset) {
+        const params = new URLSearchParams({ file_id: fileId, offset: offset, mime: audioMimeType });
+        const response = await fetch(`/upload_audio_chunk?${params}`, {
+            method: "POST",
+            headers: { "Content-Type": "application/octet-stream" },
+            body: blob
+        });
+        const result = await response.json();
+        if (!result.success) {
+            throw new Error("Chunk upload failed: " + result.error);
+        }
+        return result.offset;
+    }
 
-            try {
-                // const formDataBlob = new Blob([...formData]);
-                // console.log(`Size of FormData (approx): ${formDataBlob.size / 1024 ** 2} MB`);
+    // Ask the server how many bytes of the recording it already has
+    async function fetchAudioOffset(fileId) {
+        const response = await fetch(`/audio_upload_offset/${encodeURIComponent(fileId)}`);
+        if (!response.ok) return 0;
+        return (await response.json()).offset;
+    }
 
-                const response = await fetch("/upload_audio_chunk", {
-                    method: "POST",
-                    body: formData
-                });
-                const result = await response.json();
-                if (!result.success) {
-                    throw new Error("Chunk upload failed: " + result.error);
-                }
+    // Upload one recorded chunk; the server starts transcribing it right away.
+    // After a failure only the bytes the server is missing are sent again.
+    async function uploadAudioChunk(chunk, fileId, offset, attempts = 5) {
+        let skip = 0;
+        for (let attempt = 1; ; attempt++) {
+            try {
+                await sendAudioBytes(chunk.slice(skip), fileId, offset + skip);
+                return;
             } catch (error) {
                 console.error("Error uploading chunk:", error);
-                throw error;
+                if (attempt >= attempts) throw error;
+                await new Promise(resolve => setTimeout(resolve, 250 * 2 ** attempt));
+                try {
+                    const serverOffset = await fetchAudioOffset(fileId);
+                    if (serverOffset >= offset + chunk.size) return;
+                    skip = Math.max(0, serverOffset - offset);
+                } catch (offsetError) {
+                    console.warn("Could not fetch upload offset:", offsetError);
+                }
             }
-            offset += chunkSize;
-            chunkNumber++;
         }
-        // After all chunks have been uploaded, signal the server that the upload is complete.
+    }
+
+    // Signal the server that the answer is complete and wait for its transcription.
+    // `recording` is the whole answer, used to fill in anything the server is missing.
+    async function finishAudioUpload(fileId, recording) {
         try {
-            const finishResponse = await fetch("/finish_audio_upload", {
-                method: "POST",
-                headers: { "Content-Type": "application/json" },
-                body: JSON.stringify({ file_id: fileId })
-            });
-            const finishResult = await finishResponse.json();
+            let finishResponse;
+            for (let attempt = 1; ; attempt++) {
+                finishResponse = await fetch("/finish_audio_upload", {
+                    method: "POST",
+                    headers: { "Content-Type": "application/json" },
+                    body: JSON.stringify({ file_id: fileId, size: recording.size, mime: audioMimeType })
+                });
+                if (finishResponse.status !== 409 || attempt >= 3) break;
+                const missing = await finishResponse.json();
+                await uploadAudioChunk(recording.slice(missing.offset), fileId, missing.offset);
+            }
+            const finishJob = await finishResponse.json();
+            const finishResult = finishJob.error ? finishJob : await waitForTranscription(finishJob.job_id);
             if (finishResult.error) {
                 console.error("Error finishing upload:", finishResult.error);
                 document.getElementById("transcription").innerText = "Error finishing upload: " + finishResult.error;
@@ -187,6 +227,22 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     }
 
+    // Poll the transcription job until the server has finished it (or given up on it)
+    async function waitForTranscription(jobId, intervalMs = 500, maxPolls = 240) {
+        for (let poll = 0; poll < maxPolls; poll++) {
+            const response = await fetch(`/transcription_status/${jobId}`);
+            const job = await response.json();
+            if (job.status === "failed") {
+                return { ...job, error: job.error || "Transcription failed." };
+            }
+            if (job.error || job.status === "done") {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+        return { job_id: jobId, error: "Timed out waiting for the transcription." };
+    }
+
     // Handle form submission with loading spinner
     document.getElementById('interview-form').addEventListener('submit', function (event) {
         event.preventDefault();
@@ -239,36 +295,59 @@ document.addEventListener("DOMContentLoaded", () => {
     function initiateInterview() {
         startLocalStream();
 
-        fetch('/start_interview', {
-            method: 'GET',
-            headers: { 'Content-Type': 'application/json' }
-        })
-            .then(response => response.json())
-            .then(data => {
-                if (data.error) {
-                    alert(`Error: ${data.error}`);
-                    document.getElementById('loading-spinner').style.display = 'none';
-                    document.getElementById('start-button').disabled = false;
-                    return;
-                }
+        const progress = document.getElementById('setup-progress');
+        const stageLabels = {
+            extracted_job_description: "Job description analysed",
+            subject_syllabus: "Syllabus prepared",
+            interview_topics_list: "Interview topics selected",
+            demo_questions: "Sample questions generated"
+        };
 
-                // Hide the start section and show the interview questions section
-                document.getElementById('start-interview-section').style.display = 'none';
-                document.getElementById('interview-questions-section').style.display = 'block';
-                document.getElementById('loading-spinner').style.display = 'none';
+        function setupFailed(message) {
+            alert(`Error: ${message}`);
+            progress.innerText = "";
+            document.getElementById('loading-spinner').style.display = 'none';
+            document.getElementById('start-button').disabled = false;
+        }
 
-                // First, speak the introduction from Chitti.
-                speakQuestion("Hello, and thank you for joining me today. My name is Chitti, and I'm part of the hiring team for this teaching position. We're excited to learn more about your expertise and teaching philosophy.", function() {
-                    // After the introduction is finished, display and speak the first question.
-                    displayQuestion(data.question.topic, data.question.question);
-                });
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('An error occurred while starting the interview.');
-                document.getElementById('loading-spinner').style.display = 'none';
-                document.getElementById('start-button').disabled = false;
+        // Setup stages are streamed as they complete
+        const setupEvents = new EventSource('/start_interview_stream');
+
+        setupEvents.addEventListener('stage', event => {
+            const data = JSON.parse(event.data);
+            progress.innerText = `${stageLabels[data.stage] || data.stage} (${(data.ms / 1000).toFixed(1)}s)`;
+        });
+
+        setupEvents.addEventListener('failed', event => {
+            setupEvents.close();
+            setupFailed(JSON.parse(event.data).error);
+        });
+
+        setupEvents.addEventListener('question', event => {
+            setupEvents.close();
+            const data = JSON.parse(event.data);
+            console.log('Setup timings (ms):', data.timings);
+
+            // Hide the start section and show the interview questions section
+            document.getElementById('start-interview-section').style.display = 'none';
+            document.getElementById('interview-questions-section').style.display = 'block';
+            document.getElementById('loading-spinner').style.display = 'none';
+            progress.innerText = "";
+
+            // First, speak the introduction from Chitti.
+            speakQuestion("Hello, and thank you for joining me today. My name is Chitti, and I'm part of the hiring team for this teaching position. We're excited to learn more about your expertise and teaching philosophy.", function() {
+                // After the introduction is finished, display and speak the first question.
+                displayQuestion(data.question.topic, data.question.question);
             });
+        });
+
+        // Connection errors (including a 400 for missing session data)
+        setupEvents.onerror = () => {
+            if (setupEvents.readyState !== EventSource.CLOSED) {
+                setupEvents.close();
+                setupFailed('An error occurred while starting the interview.');
+            }
+        };
     }
 
     // Display Question with TTS
@@ -350,8 +429,24 @@ document.addEventListener("DOMContentLoaded", () => {
             audioContext = new (window.AudioContext || window.webkitAudioContext)();
             microphone = audioContext.createMediaStreamSource(stream);
 
+            audioFileId = crypto.randomUUID();
+            // Usually "audio/webm;codecs=opus"; lets the server skip format probing
+            audioMimeType = mediaRecorder.mimeType || "";
+            audioBytesQueued = 0;
+            audioUploadChain = Promise.resolve();
+
             mediaRecorder.ondataavailable = event => {
                 audioChunks.push(event.data);
+                if (event.data && event.data.size > 0) {
+                    // Upload in order while recording so transcription can start early
+                    const fileId = audioFileId;
+                    const offset = audioBytesQueued;
+                    audioBytesQueued += event.data.size;
+                    // A chunk that still fails is filled in from the full recording when finishing
+                    audioUploadChain = audioUploadChain
+                        .then(() => uploadAudioChunk(event.data, fileId, offset))
+                        .catch(error => console.warn('Chunk upload gave up; resending on finish:', error));
+                }
             };
 
             mediaRecorder.onstart = () => {
@@ -366,16 +461,17 @@ document.addEventListener("DOMContentLoaded", () => {
                 document.getElementById("transcription").innerText = "Processing transcription...";
                 console.log('MediaRecorder onstop');
 
-                const blob = new Blob(audioChunks, { type: "audio/wav" });
+                const blob = new Blob(audioChunks, { type: audioMimeType || "audio/webm" });
                 const url = URL.createObjectURL(blob);
                 document.getElementById("player").src = url;
 
                 audioChunks = [];
 
-                // Generate a unique file ID and upload the audio in chunks
-                const fileId = crypto.randomUUID();
+                // Wait for the last chunks to reach the server, then finish the upload
+                const fileId = audioFileId;
                 try {
-                    await uploadAudioBlobInChunks(blob, fileId);
+                    await audioUploadChain;
+                    await finishAudioUpload(fileId, blob);
                 } catch (error) {
                     console.error('Error in chunked audio upload:', error);
                     document.getElementById("transcription").innerText = "Error uploading audio.";
@@ -395,7 +491,7 @@ document.addEventListener("DOMContentLoaded", () => {
                 }
             };
 
-            mediaRecorder.start();
+            mediaRecorder.start(1000); // Emit a chunk every second
         } catch (error) {
             console.error('Error accessing microphone:', error);
             alert('Could not access your microphone. Please check permissions.');
@@ -457,34 +553,46 @@ document.addEventListener("DOMContentLoaded", () => {
         console.log('Submitting answer:', curr_transcription);
 
         try {
-            const response = await fetch('/next_question', {
+            const response = await fetch('/next_question_stream', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(forNextQuestion)
             });
 
-            const data = await response.json();
+            if (!response.ok) {
+                throw new Error(`Failed to fetch next question: ${response.statusText}`);
+            }
+
+            // The connecting sentence arrives first and is spoken while the question streams in.
+            let connectingSpoken = Promise.resolve();
+            let streamedQuestion = "";
+            let data = null;
+            await readEventStream(response, (event, payload) => {
+                if (event === 'connecting' && payload.connecting_sentence) {
+                    console.log('Connecting sentence:', payload.connecting_sentence);
+                    connectingSpoken = new Promise(resolve => speakQuestion(payload.connecting_sentence, resolve));
+                } else if (event === 'delta') {
+                    streamedQuestion += payload.text;
+                    document.getElementById('question-display').innerText = `Question: ${streamedQuestion}`;
+                } else if (event === 'question') {
+                    document.getElementById('question-display').innerText = `Question: ${payload.question}`;
+                } else if (event === 'done') {
+                    data = payload;
+                }
+            });
 
             console.log('Next question data:', data);
+            if (!data) {
+                throw new Error('Next question stream ended early.');
+            }
 
-            // If a connecting sentence is provided, speak it first and then display the next question.
-            if (data.connecting_sentence) {
-                console.log('Connecting sentence:', data.connecting_sentence);
-                speakQuestion(data.connecting_sentence, () => {
-                    if (data.interview_finished) {
-                        endInterview();
-                    } else if (data.question) {
-                        displayQuestion(data.question.topic, data.question.question);
-                    }
+            await connectingSpoken;
+            if (data.interview_finished) {
+                speakQuestion("Thank you for taking the time to interview. We appreciate your interest in Vibgyor Group of Schools and will be in touch regarding the next steps soon.", ()=> {
+                    endInterview();
                 });
-            } else {
-                if (data.interview_finished) {
-                    speakQuestion("Thank you for taking the time to interview. We appreciate your interest in Vibgyor Group of Schools and will be in touch regarding the next steps soon.", ()=> {
-                        endInterview();
-                    });
-                } else if (data.question) {
-                    displayQuestion(data.question.topic, data.question.question);
-                }
+            } else if (data.question) {
+                displayQuestion(data.question.topic, data.question.question);
             }
 
             curr_transcription = "";
@@ -545,8 +653,8 @@ document.addEventListener("DOMContentLoaded", () => {
                 }))
             };
 
-            // Send payload to end_interview endpoint
-            const endInterviewResponse = await fetch('/end_interview', {
+            // Stream the summary, re-rendering it as each field is completed
+            const endInterviewResponse = await fetch('/end_interview_stream', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify(payload)
@@ -556,10 +664,25 @@ document.addEventListener("DOMContentLoaded", () => {
                 throw new Error(`Failed to end interview: ${endInterviewResponse.statusText}`);
             }
 
-            const endData = await endInterviewResponse.json();
+            const partialSummary = {};
+            let summary = null;
+            await readEventStream(endInterviewResponse, (event, data) => {
+                if (event === 'field') {
+                    setPath(partialSummary, data.path, data.value);
+                    displaySummary(partialSummary, topicAverages);
+                } else if (event === 'summary') {
+                    summary = data.summary;
+                } else if (event === 'failed') {
+                    throw new Error(data.error);
+                }
+            });
+
+            if (!summary) {
+                throw new Error('Summary stream ended early.');
+            }
 
             // Display the summary
-            displaySummary(endData.summary, topicAverages);
+            displaySummary(summary, topicAverages);
             console.log('Interview summary displayed');
 
         } catch (error) {
@@ -568,6 +691,40 @@ document.addEventListener("DOMContentLoaded", () => {
         }
     }
 
+    // Read a text/event-stream response body, calling onEvent(event, data) per message
+    async function readEventStream(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            let boundary;
+            while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+                const message = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+                let event = "message";
+                const dataLines = [];
+                message.split("\n").forEach(line => {
+                    if (line.startsWith("event:")) event = line.slice(6).trim();
+                    else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+                });
+                if (dataLines.length) onEvent(event, JSON.parse(dataLines.join("\n")));
+            }
+        }
+    }
+
+    // Set obj[path[0]][path[1]]... = value, creating intermediate objects
+    function setPath(obj, path, value) {
+        let target = obj;
+        path.slice(0, -1).forEach(key => {
+            if (typeof target[key] !== 'object' || target[key] === null) target[key] = {};
+            target = target[key];
+        });
+        target[path[path.length - 1]] = value;
+    }
+
     // Helper function to display questions and answers
     function displayQuestions(questions) {
         const questionsList = document.getElementById('questions-list');
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from interview_app.audio_decode import SAMPLE_RATE, IncrementalDecoder, ResyncFailed
+
+
+class StreamingSession:
+    def __init__(self, file_id, format_hint=None):
+        self.file_id = file_id
+        self.buffer = bytearray()
+        # Only packets added since the last pass are decoded
+        self.decoder = IncrementalDecoder(format_hint)
+        # Audio before this sample index has already been transcribed (and dropped from the decoder)
+        self.committed_samples = 0
+        self.partials = []
+        self.scheduled = False
+        self.lock = threading.Lock()
+        self.updated_at = time.time()
+
+    @property
+    def text(self):
+        return " ".join(self.partials)
+
+
+class StreamingTranscriber:
+    """
+    Transcribes an answer incrementally while its chunks are still arriving.
+
+    Each `feed` appends the new container bytes for a file_id and schedules a
+    background pass. A pass decodes the newly received packets in memory
+    (the container format is given up front, not probed), runs VAD over
+    the audio not yet transcribed and sends every speech window that has
+    clearly ended (followed by at least `tail_guard_s` of audio) to Whisper.
+    Transcribed audio is released, so a pass costs the new bytes and the
+    open window, not the whole recording. `finish` only has to transcribe
+    whatever is left after the last window.
+
+    Pieces must arrive in order from offset 0. A piece that doesn't continue
+    the bytes seen so far (e.g. earlier ones went to another worker process)
+    drops the stream; `fed` lets the caller check that the whole upload went
+    through it before relying on `finish`.
+    """
+
+    def __init__(self, model, max_workers=1, min_window_s=2.0, tail_guard_s=0.6,
+                 min_silence_ms=500, max_sessions=256, transcribe_options=None):
+        self.model = model
+        self.min_window = int(min_window_s * SAMPLE_RATE)
+        self.tail_guard = int(tail_guard_s * SAMPLE_RATE)
+        self.vad_options = VadOptions(min_silence_duration_ms=min_silence_ms)
+        self.max_sessions = max_sessions
+        self.transcribe_options = transcribe_options or {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stream-transcribe")
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _session(self, file_id, create=False, format_hint=None):
+        with self._lock:
+            stream = self._sessions.get(file_id)
+            if stream is None and create:
+                stream = StreamingSession(file_id, format_hint)
+                self._sessions[file_id] = stream
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            return stream
+
+    def has(self, file_id):
+        with self._lock:
+            return file_id in self._sessions
+
+    def fed(self, file_id):
+        """Number of bytes fed for file_id, or None if it isn't being streamed."""
+        with self._lock:
+            stream = self._sessions.get(file_id)
+            return len(stream.buffer) if stream is not None else None
+
+    def feed(self, file_id, data, offset=0, format_hint=None):
+        if offset == 0:
+            self.discard(file_id)
+        stream = self._session(file_id, create=offset == 0, format_hint=format_hint)
+        if stream is None:
+            return
+        with self._lock:
+            if offset != len(stream.buffer):
+                # A gap or overlap; finish() can't be trusted for this file any more
+                self._sessions.pop(file_id, None)
+                return
+            stream.buffer.extend(data)
+            stream.updated_at = time.time()
+            if stream.scheduled:
+                return
+            stream.scheduled = True
+        self._executor.submit(self._advance_scheduled, stream)
+
+    def _advance_scheduled(self, stream):
+        with self._lock:
+            stream.scheduled = False
+        try:
+            self._advance(stream, final=False)
+        except Exception:
+            # A truncated container may not decode yet; the next chunk or finish() retries
+            pass
+
+    def _decode(self, stream, final):
+        decoder = stream.decoder
+        with self._lock:
+            start = decoder.resume_offset
+            data = bytes(stream.buffer[start:])
+        try:
+            decoder.decode(data, final=final, start=start)
+        except ResyncFailed:
+            with self._lock:
+                data = bytes(stream.buffer)
+            decoder.decode(data, final=final)
+        return decoder.audio()
+
+    def _advance(self, stream, final):
+        with stream.lock:
+            pending = self._decode(stream, final)
+            if final:
+                window_end = len(pending)
+            else:
+                speech = get_speech_timestamps(pending, self.vad_options, sampling_rate=SAMPLE_RATE)
+                closed = [segment for segment in speech if segment['end'] <= len(pending) - self.tail_guard]
+                if not closed:
+                    return
+                # Cut in the silence right after the last finished speech segment
+                window_end = min(len(pending), closed[-1]['end'] + self.tail_guard // 2)
+                if window_end < self.min_window:
+                    return
+
+            if window_end > 0:
+                segments, _ = self.model.transcribe(pending[:window_end], **self.transcribe_options)
+                text = " ".join(segment.text.strip() for segment in segments).strip()
+                if text:
+                    stream.partials.append(text)
+            stream.committed_samples += window_end
+            stream.decoder.drop(window_end)
+
+    def partial(self, file_id):
+        stream = self._session(file_id)
+        return stream.text if stream is not None else None
+
+    def finish(self, file_id):
+        """Transcribe the remaining tail and return the full transcription."""
+        stream = self._session(file_id)
+        if stream is None:
+            raise KeyError(file_id)
+        try:
+            self._advance(stream, final=True)
+            return stream.text
+        finally:
+            self.discard(file_id)
+
+    def discard(self, file_id):
+        with self._lock:
+            self._sessions.pop(file_id, None)
@@ -1,17 +1,79 @@
 import json
-from openai import OpenAI
+from interview_app.llm_gateway import gateway
 
-def summarize_interview(questions, resume_text: str, introduction: str, OPENAI_API_KEY: str):
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    prompt = "Generate a summary of the following interview:\n\n"
+# Per-topic summaries are short and written while the interview runs, so a smaller model is enough
+TOPIC_SUMMARY_MODEL = "gpt-4o-mini"
+
+
+def _question_lines(q, with_topic=True):
+    topic = f"Topic: {q.get('topic')}\n" if with_topic else ""
+    return f"{topic}Question: {q.get('question')}\nIdeal Answer: {q.get('answer')}\nCandidate Answer: {q.get('candi_answer')}\nScore: {q.get('score')}\n\n"
+
+
+def _topics_in_order(questions):
+    grouped = {}
     for q in questions:
-        prompt += f"Topic: {q.get('topic')}\nQuestion: {q.get('question')}\nIdeal Answer: {q.get('answer')}\nCandidate Answer: {q.get('candi_answer')}\nScore: {q.get('score')}\n\n"
-    response = client.chat.completions.create(
-        model="gpt-4o",
+        grouped.setdefault(q.get('topic'), []).append(q)
+    return grouped
+
+
+def summary_messages(questions, topic_summaries=None):
+    """
+    Prompt for the final summary. With `topic_summaries` ({topic: summary})
+    only those summaries and the scores are sent (the reduce step); a topic
+    without a summary falls back to its full questions and answers.
+    """
+    prompt = "Generate a summary of the following interview:\n\n"
+    if topic_summaries is None:
+        for q in questions:
+            prompt += _question_lines(q)
+    else:
+        for topic, topic_questions in _topics_in_order(questions).items():
+            summary = topic_summaries.get(topic)
+            if summary is None:
+                for q in topic_questions:
+                    prompt += _question_lines(q)
+                continue
+            scores = ", ".join(str(q.get('score')) for q in topic_questions)
+            prompt += f"Topic: {topic}\nQuestions Asked: {len(topic_questions)}\nScores: {scores}\nTopic Summary: {summary}\n\n"
+    return [
+        {"role": "system", "content": "You are an interview evaluator. Follow strict JSON output."},
+        {"role": "user", "content": prompt}
+    ]
+
+def summarize_topic(topic: str, questions, OPENAI_API_KEY: str, max_tokens: int = 400):
+    """Map step: a short plain-text evaluation of one finished topic."""
+    transcript = "".join(_question_lines(q, with_topic=False) for q in questions)
+    response = gateway.chat_completion(
+        "summarize_topic",
+        OPENAI_API_KEY,
+        model=TOPIC_SUMMARY_MODEL,
+        max_tokens=max_tokens,
         messages=[
-            {"role": "system", "content": "You are an interview evaluator. Follow strict JSON output."},
-            {"role": "user", "content": prompt}
+            {"role": "system", "content": "You are an interview evaluator. Summarise how the candidate did on one "
+                                          "interview topic: what they knew, what they missed, and how well they "
+                                          "explained it. Mention notable strengths and weaknesses. Plain text, a "
+                                          "short paragraph."},
+            {"role": "user", "content": f"Topic: {topic}\n\n{transcript}"}
         ]
     )
+    return response.choices[0].message.content.strip()
+
+def summarize_interview(questions, resume_text: str, introduction: str, OPENAI_API_KEY: str, topic_summaries=None):
+    response = gateway.chat_completion(
+        "summarize_interview",
+        OPENAI_API_KEY,
+        model="gpt-4o",
+        messages=summary_messages(questions, topic_summaries)
+    )
     res = response.choices[0].message.content.replace("```json", "").replace("```", "").strip()
     return json.loads(res)
+
+def stream_interview_summary(questions, resume_text: str, introduction: str, OPENAI_API_KEY: str, topic_summaries=None):
+    """Same prompt as summarize_interview; yields the raw JSON completion as it streams."""
+    yield from gateway.stream_chat_completion(
+        "summarize_interview",
+        OPENAI_API_KEY,
+        model="gpt-4o",
+        messages=summary_messages(questions, topic_summaries)
+    )
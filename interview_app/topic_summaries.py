@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+
+class TopicSummaries:
+    """
+    Per-topic interview summaries, written while the interview is running.
+
+    `submit` is called when a topic closes and runs `summarize(session_id,
+    topic)` on a background thread. At the end `collect` starts any topic
+    that wasn't submitted (normally only the last one) or whose run failed,
+    waits for all of them and returns {topic: summary}, so /end_interview
+    only has to reduce a handful of short summaries.
+    """
+
+    def __init__(self, summarize, max_workers=2, max_sessions=1024):
+        self.summarize = summarize
+        self.max_sessions = max_sessions
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="topic-summary")
+        self._futures = OrderedDict()
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.total_ms = 0.0
+
+    def submit(self, session_id, topic):
+        """Start summarizing a topic unless it already is (or has been, successfully)."""
+        with self._lock:
+            topics = self._futures.get(session_id)
+            if topics is None:
+                topics = self._futures[session_id] = {}
+                while len(self._futures) > self.max_sessions:
+                    self._futures.popitem(last=False)
+            self._futures.move_to_end(session_id)
+            future = topics.get(topic)
+            if future is not None and not (future.done() and future.exception() is not None):
+                return future
+            future = topics[topic] = self._executor.submit(self._run, session_id, topic)
+            return future
+
+    def _run(self, session_id, topic):
+        started = time.perf_counter()
+        try:
+            summary = self.summarize(session_id, topic)
+        except Exception:
+            logger.exception("Topic summary failed for %s/%s", session_id, topic)
+            with self._lock:
+                self.failed += 1
+            raise
+        with self._lock:
+            self.completed += 1
+            self.total_ms += (time.perf_counter() - started) * 1000
+        return summary
+
+    def collect(self, session_id, topics, timeout=None):
+        """Summaries of `topics` that are ready within `timeout`, as {topic: summary}."""
+        futures = {topic: self.submit(session_id, topic) for topic in topics}
+        wait(list(futures.values()), timeout=timeout)
+        summaries = {}
+        for topic, future in futures.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                summaries[topic] = future.result()
+        return summaries
+
+    def discard(self, session_id):
+        with self._lock:
+            self._futures.pop(session_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sessions": len(self._futures),
+                "outstanding": sum(1 for topics in self._futures.values() for f in topics.values() if not f.done()),
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_ms": round(self.total_ms / self.completed, 1) if self.completed else 0.0,
+            }
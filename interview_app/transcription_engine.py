@@ -0,0 +1,198 @@
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+from faster_whisper import WhisperModel
+
+from interview_app.speech_trim import trim_silence
+from interview_app.metrics import timed
+from interview_app.inference_pool import worker_model
+
+
+class WhisperEngine:
+    """
+    Pool of faster-whisper models built from the `faster_whisper` section of
+    config.yaml.
+
+    Each model size gets `pool_size` instances, every one pinned to its own
+    `cpu_threads`/`num_workers`, so concurrent transcriptions run on separate
+    instances instead of queueing behind a single model. Callers may ask for
+    a different model size or beam size per call, or pass `fast=True` to use
+    the configured `fast_model`/`fast_beam_size` on latency-sensitive paths.
+
+    Arrays are trimmed to their speech first (see `vad` in config.yaml), so
+    Whisper's work follows how long the candidate spoke rather than how long
+    the recording ran.
+    """
+
+    def __init__(self, settings, vad_settings=None):
+        self.model_size = settings.get('model') or 'small'
+        self.device = settings.get('device') or 'cpu'
+        self.device_index = settings.get('device_index', 0)
+        self.compute_type = settings.get('compute_type') or 'int8'
+        self.download_root = settings.get('model_cache_dir')
+        self.beam_size = settings.get('beam_size', 5)
+        self.language = settings.get('language')
+        self.task = 'translate' if settings.get('translate') else 'transcribe'
+        self.fast_model = settings.get('fast_model') or self.model_size
+        self.fast_beam_size = settings.get('fast_beam_size', 1)
+
+        self.pool_size = max(1, int(settings.get('pool_size', 1)))
+        self.num_workers = max(1, int(settings.get('num_workers', 1)))
+        # Split the cores between instances unless told otherwise
+        default_threads = max(1, (os.cpu_count() or 1) // self.pool_size)
+        self.cpu_threads = int(settings.get('cpu_threads') or default_threads)
+
+        vad_settings = vad_settings or {}
+        self.vad_backend = vad_settings.get('backend', 'energy')
+        self.vad_options = {
+            key: vad_settings[key]
+            for key in ("min_speech_ms", "min_silence_ms", "pad_ms", "frame_ms", "floor_db", "dynamic_range_db")
+            if vad_settings.get(key) is not None
+        }
+        if self.vad_backend == 'silero':
+            self.vad_options.pop("frame_ms", None)
+            self.vad_options.pop("floor_db", None)
+            self.vad_options.pop("dynamic_range_db", None)
+        self.trimmed_calls = 0
+        self.input_seconds = 0.0
+        self.speech_seconds = 0.0
+
+        self._pools = {}
+        # Guards the counters and the pool dict; models load under their own lock
+        # so stats() and VAD bookkeeping never wait on a model load
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def _load(self, model_size):
+        return WhisperModel(
+            model_size,
+            device=self.device,
+            device_index=self.device_index,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+            download_root=self.download_root,
+        )
+
+    def _pool(self, model_size):
+        pool = self._pools.get(model_size)
+        if pool is not None:
+            return pool
+        with self._load_lock:
+            pool = self._pools.get(model_size)
+            if pool is None:
+                pool = queue.Queue()
+                for _ in range(self.pool_size):
+                    pool.put(self._load(model_size))
+                with self._lock:
+                    self._pools[model_size] = pool
+            return pool
+
+    def warm(self, model_size=None):
+        """Load the pool for `model_size` ahead of time (the default and fast models if omitted)."""
+        if model_size is not None:
+            self._pool(model_size)
+            return
+        self._pool(self.model_size)
+        self._pool(self.fast_model)
+
+    @contextmanager
+    def acquire(self, model_size=None):
+        pool = self._pool(model_size or self.model_size)
+        model = pool.get()
+        try:
+            yield model
+        finally:
+            pool.put(model)
+
+    def transcribe(self, audio, model=None, beam_size=None, fast=False, **options):
+        """
+        Transcribe a file path, file object or 16 kHz float32 array.
+        Returns (segments, info) with the segments already materialised;
+        an array with no speech in it returns ([], None).
+        """
+        if fast:
+            model = model or self.fast_model
+            beam_size = beam_size or self.fast_beam_size
+        options.setdefault('beam_size', beam_size or self.beam_size)
+        options.setdefault('language', self.language)
+        options.setdefault('task', self.task)
+
+        if isinstance(audio, np.ndarray) and self.vad_backend in ('energy', 'silero'):
+            with timed("vad_trim"):
+                trimmed = trim_silence(audio, backend=self.vad_backend, **self.vad_options)
+            with self._lock:
+                self.trimmed_calls += 1
+                self.input_seconds += trimmed.input_seconds
+                self.speech_seconds += trimmed.speech_seconds
+            if trimmed.audio.size == 0:
+                # Nothing but silence; don't wake a model for it
+                return [], None
+            audio = trimmed.audio
+        elif self.vad_backend != 'off':
+            # Paths and file objects are trimmed by faster-whisper's own VAD
+            options.setdefault('vad_filter', True)
+
+        return self._transcribe(audio, model, options)
+
+    def _transcribe(self, audio, model_size, options):
+        with self.acquire(model_size) as whisper_model, timed("whisper_transcribe"):
+            segments, info = whisper_model.transcribe(audio, **options)
+            # Segments are generated lazily, so decode them while holding the instance
+            segments = list(segments)
+        return segments, info
+
+    def vad_stats(self):
+        with self._lock:
+            return {
+                "backend": self.vad_backend,
+                "calls": self.trimmed_calls,
+                "input_s": round(self.input_seconds, 1),
+                "speech_s": round(self.speech_seconds, 1),
+                "compression_ratio": round(self.input_seconds / self.speech_seconds, 2) if self.speech_seconds else None,
+            }
+
+    def stats(self):
+        with self._lock:
+            return {
+                size: {"instances": self.pool_size, "idle": pool.qsize()}
+                for size, pool in self._pools.items()
+            }
+
+
+def load_worker_engine(settings, vad_settings=None, processes=1):
+    """Whisper for one inference worker process: a single instance per model size."""
+    # The cores are split between the processes instead of between pooled instances
+    cpu_threads = settings.get('cpu_threads') or max(1, (os.cpu_count() or 1) // max(1, processes))
+    engine = WhisperEngine(dict(settings, pool_size=1, cpu_threads=cpu_threads), vad_settings)
+    engine.warm()
+    return engine
+
+
+def transcribe_in_worker(audio, model_size, options):
+    return worker_model('whisper')._transcribe(audio, model_size, options)
+
+
+class ProcessWhisperEngine(WhisperEngine):
+    """
+    WhisperEngine whose models live in an InferencePool of worker processes.
+
+    Option handling and VAD trimming still run here, so only the speech is
+    sent to a worker, and callers keep the same `transcribe` API.
+    """
+
+    def __init__(self, settings, vad_settings, pool):
+        super().__init__(settings, vad_settings)
+        self.pool = pool
+
+    def warm(self, model_size=None):
+        self.pool.warm()
+
+    def _transcribe(self, audio, model_size, options):
+        return self.pool.call(transcribe_in_worker, audio, model_size, options)
+
+    def stats(self):
+        return {"process_pool": self.pool.stats()}
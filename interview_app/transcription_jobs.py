@@ -0,0 +1,140 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    pass
+
+
+class TranscriptionJob:
+    def __init__(self, file_id):
+        self.id = uuid.uuid4().hex
+        self.file_id = file_id
+        self.status = QUEUED
+        self.transcription = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.finished = threading.Event()
+
+    @property
+    def wait_ms(self):
+        if self.started_at is None:
+            return None
+        return round((self.started_at - self.created_at) * 1000, 1)
+
+    @property
+    def run_ms(self):
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return round((self.finished_at - self.started_at) * 1000, 1)
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "file_id": self.file_id,
+            "status": self.status,
+            "transcription": self.transcription,
+            "error": self.error,
+            "queue_wait_ms": self.wait_ms,
+            "run_ms": self.run_ms,
+        }
+
+
+class TranscriptionQueue:
+    """
+    Runs transcription tasks on a bounded pool of worker threads.
+
+    `submit` takes a zero-argument callable that returns the transcription
+    text and returns a job immediately; callers poll `get`/`wait` for the
+    result. At most `max_pending` jobs may be queued or running at once and
+    the last `max_history` finished jobs are kept for status lookups.
+    """
+
+    def __init__(self, max_workers=2, max_pending=64, max_history=512):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transcribe")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+        self._total_run_ms = 0.0
+        self._total_wait_ms = 0.0
+        self._max_run_ms = 0.0
+
+    def _pending(self):
+        return sum(1 for job in self._jobs.values() if job.status in (QUEUED, RUNNING))
+
+    def submit(self, file_id, task):
+        job = TranscriptionJob(file_id)
+        with self._lock:
+            if self._pending() >= self.max_pending:
+                raise QueueFull("Transcription queue is full, please retry shortly.")
+            self._jobs[job.id] = job
+            self._trim_history()
+        self._executor.submit(self._run, job, task)
+        return job
+
+    def _run(self, job, task):
+        job.started_at = time.time()
+        job.status = RUNNING
+        try:
+            job.transcription = task()
+            job.status = DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if job.status == DONE:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._total_run_ms += job.run_ms
+                self._total_wait_ms += job.wait_ms
+                self._max_run_ms = max(self._max_run_ms, job.run_ms)
+            job.finished.set()
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished.is_set()]
+        excess = len(finished) - self.max_history
+        for job_id in finished[:max(0, excess)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id, timeout=None):
+        job = self.get(job_id)
+        if job is not None:
+            job.finished.wait(timeout)
+        return job
+
+    def metrics(self):
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == QUEUED)
+            running = sum(1 for job in self._jobs.values() if job.status == RUNNING)
+            finished = self._completed + self._failed
+            return {
+                "workers": self.max_workers,
+                "queue_depth": queued,
+                "running": running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_run_ms": round(self._total_run_ms / finished, 1) if finished else 0.0,
+                "max_run_ms": round(self._max_run_ms, 1),
+                "avg_queue_wait_ms": round(self._total_wait_ms / finished, 1) if finished else 0.0,
+            }
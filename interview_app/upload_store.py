@@ -0,0 +1,155 @@
+import fcntl
+import json
+import os
+import threading
+
+COPY_BUFFER_SIZE = 256 * 1024
+
+
+def _merge(extents, start, end):
+    """Add [start, end) to a sorted list of disjoint [start, end) extents."""
+    merged = []
+    for extent_start, extent_end in extents:
+        if extent_end < start or extent_start > end:
+            merged.append((extent_start, extent_end))
+        else:
+            start, end = min(start, extent_start), max(end, extent_end)
+    merged.append((start, end))
+    return sorted(merged)
+
+
+def _covered(extents, start, end):
+    return any(extent_start <= start and end <= extent_end for extent_start, extent_end in extents)
+
+
+class ResumableUploads:
+    """
+    Byte-offset uploads keyed by file_id.
+
+    Every piece says where it belongs (`offset`) and is written there with
+    pwrite, so retries and out-of-order pieces can't corrupt the file. The
+    extents received so far live in a small sidecar file next to the upload
+    (guarded by flock, so any worker process can accept the next piece). The
+    contiguous prefix from byte 0 is the resume point a client asks for after
+    a failure, and a piece that is entirely inside received extents is
+    acknowledged without being written again, even at offset 0. A new
+    recording gets a new file_id; only a piece written with `restart` starts
+    an existing one over (the file is truncated and earlier extents are
+    dropped).
+    """
+
+    def __init__(self, upload_dir, suffix=".wav"):
+        self.upload_dir = upload_dir
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self.pieces = 0
+        self.duplicates = 0
+        self.bytes_written = 0
+
+    def path(self, file_id):
+        return os.path.join(self.upload_dir, file_id + self.suffix)
+
+    def _state_path(self, file_id):
+        return self.path(file_id) + ".upload"
+
+    def _load(self, fd):
+        raw = os.pread(fd, 1 << 20, 0)
+        return [tuple(extent) for extent in json.loads(raw)] if raw.strip() else []
+
+    def _store(self, fd, extents):
+        data = json.dumps(extents).encode("ascii")
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, data, 0)
+
+    @staticmethod
+    def _contiguous(extents):
+        return extents[0][1] if extents and extents[0][0] == 0 else 0
+
+    def offset(self, file_id):
+        """Bytes received contiguously from the start, or None for an unknown upload."""
+        state_path = self._state_path(file_id)
+        if not os.path.exists(state_path):
+            return None
+        fd = os.open(state_path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            return self._contiguous(self._load(fd))
+        finally:
+            os.close(fd)
+
+    def write(self, file_id, offset, source, length=None, restart=False):
+        """
+        Write the body read from `source` at `offset`; with `restart`, start
+        the recording over first.
+
+        Returns a dict with the contiguous `offset` before and after the write,
+        whether the upload was `created` (or restarted) and whether the piece
+        was a `duplicate`.
+        """
+        state_fd = os.open(self._state_path(file_id), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(state_fd, fcntl.LOCK_EX)
+            extents = self._load(state_fd)
+            created = restart or not extents
+            if restart and extents:
+                # Keeping the old extents would splice the old recording's tail onto the new bytes
+                open(self.path(file_id), 'wb').close()
+                extents = []
+                self._store(state_fd, extents)
+            before = self._contiguous(extents)
+
+            # Only an explicit restart truncates, so a retried first piece can't wipe the pieces after it
+            if length is not None and (length == 0 or _covered(extents, offset, offset + length)):
+                with self._lock:
+                    self.pieces += 1
+                    self.duplicates += 1
+                return {"created": False, "duplicate": True, "before": before, "offset": before}
+
+            fd = os.open(self.path(file_id), os.O_WRONLY | os.O_CREAT, 0o644)
+            written = 0
+            try:
+                while True:
+                    block = source.read(COPY_BUFFER_SIZE)
+                    if not block:
+                        break
+                    view = memoryview(block)
+                    while view:
+                        count = os.pwrite(fd, view, offset + written)
+                        view = view[count:]
+                        written += count
+            finally:
+                os.close(fd)
+
+            if written:
+                extents = _merge(extents, offset, offset + written)
+                self._store(state_fd, extents)
+            with self._lock:
+                self.pieces += 1
+                self.bytes_written += written
+            return {"created": created, "duplicate": False, "before": before,
+                    "offset": self._contiguous(extents)}
+        finally:
+            os.close(state_fd)
+
+    def read(self, file_id, start, end):
+        with open(self.path(file_id), 'rb') as f:
+            return os.pread(f.fileno(), end - start, start)
+
+    def complete(self, file_id, size=None):
+        """
+        Close the upload. Returns the contiguous size; if `size` is given and
+        not fully received the upload stays open and the offset is returned
+        so the client can resend from there.
+        """
+        received = self.offset(file_id)
+        if received is None or (size is not None and received < size):
+            return received, False
+        try:
+            os.remove(self._state_path(file_id))
+        except FileNotFoundError:
+            pass
+        return received, True
+
+    def stats(self):
+        with self._lock:
+            return {"pieces": self.pieces, "duplicates": self.duplicates, "bytes_written": self.bytes_written}
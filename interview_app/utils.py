@@ -1,8 +1,10 @@
-from PyPDF2 import PdfReader
-from docx import Document
+import os
 import time 
 import hashlib
 
+from interview_app.document_extraction import document_extractor
+from interview_app.metrics import timed
+
 # Define boards, grades, and subjects
 boards = [
     'Central Board of Secondary Education (CBSE)',
@@ -19,19 +21,22 @@ countries = [
 def allowed_file(filename, allowed_extensions):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
+@timed("parse_file")
 def parse_file(filepath):
+    # Cached by content hash; PDF pages are extracted in parallel (see document_extraction.py)
     extension = filepath.rsplit('.', 1)[1].lower()
-    if extension == 'txt':
-        with open(filepath, 'r') as file:
-            return file.read()
-    elif extension in ['doc', 'docx']:
-        doc = Document(filepath)
-        return "\n".join([paragraph.text for paragraph in doc.paragraphs])
-    elif extension == 'pdf':
-        pdf_reader = PdfReader(filepath)
-        return "\n".join([page.extract_text() for page in pdf_reader.pages])
-    else:
+    if extension not in ('txt', 'doc', 'docx', 'pdf'):
         return "Unsupported file format."
+    return document_extractor.extract(filepath)
+
+def uploaded_size(file):
+    """Size of an uploaded file, measured on its stream before it is saved."""
+    stream = file.stream
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(position)
+    return size
 
 def generate_hashed_id():
     data = str(time.time()).encode('utf-8')
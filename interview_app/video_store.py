@@ -0,0 +1,265 @@
+import fcntl
+import os
+import shutil
+import threading
+import time
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadFinished(Exception):
+    """A chunk arrived for a recording that has already been finished."""
+
+
+class _Locked:
+    """Process-local lock plus an flock on the recording's state file, for multi-worker setups."""
+
+    def __init__(self, thread_lock, state_path):
+        self.thread_lock = thread_lock
+        self.state_path = state_path
+        self.fd = None
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        self.fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+        finally:
+            self.thread_lock.release()
+
+    def _fields(self):
+        return os.pread(self.fd, 64, 0).decode("ascii").split()
+
+    def read(self):
+        """Returns (next_index, part_bytes); raises UploadFinished once the recording was finished."""
+        raw = self._fields()
+        if raw[2:] == ["finished"]:
+            raise UploadFinished()
+        return (int(raw[0]), int(raw[1])) if len(raw) >= 2 else (None, 0)
+
+    def write(self, next_index, part_bytes, finished=False):
+        data = f"{next_index} {part_bytes}{' finished' if finished else ''}".ljust(40).encode("ascii")
+        os.pwrite(self.fd, data, 0)
+
+
+def _copy_stream(source, fd):
+    """Stream a file-like body into `fd` without holding it in memory; returns bytes written."""
+    written = 0
+    while True:
+        block = source.read(COPY_BUFFER_SIZE)
+        if not block:
+            return written
+        view = memoryview(block)
+        while view:
+            count = os.write(fd, view)
+            view = view[count:]
+            written += count
+
+
+def _append_file(out_fd, path):
+    """Append the file at `path` to `out_fd` in the kernel (sendfile), falling back to a copy."""
+    with open(path, 'rb') as infile:
+        size = os.fstat(infile.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, infile.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            infile.seek(offset)
+            offset += _copy_stream(infile, out_fd)
+    return offset
+
+
+class VideoChunkStore:
+    """
+    Per-recording assembly of recorded video chunks.
+
+    Each recording (a session may make several, told apart by the client's
+    recording id) gets its own directory `<chunks_dir>/<session>/<recording>`
+    with a `video.part` file. A chunk that arrives in order is streamed
+    straight onto the end of it. A chunk that arrives early is parked as
+    `<n>.chunk` and appended with sendfile once the gap before it is
+    filled, so there is no final concatenation pass. `finish` renames the
+    part file into `final_dir`; parked chunks still behind a gap are left
+    out, since a video can't be played past a missing piece. It leaves the
+    state file behind marked finished, so a chunk arriving late raises
+    UploadFinished instead of starting the recording over. Recordings not
+    touched for `stale_after_s` (finished or abandoned) are removed when
+    another one finishes.
+    """
+
+    def __init__(self, chunks_dir, final_dir, first_index=1, stale_after_s=6 * 3600):
+        self.chunks_dir = chunks_dir
+        self.final_dir = final_dir
+        self.first_index = first_index
+        self.stale_after_s = stale_after_s
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _recording_dir(self, session_id, recording_id):
+        return os.path.join(self.chunks_dir, session_id, recording_id)
+
+    def _lock(self, session_id, recording_id):
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault((session_id, recording_id), threading.Lock())
+        directory = self._recording_dir(session_id, recording_id)
+        os.makedirs(directory, exist_ok=True)
+        return _Locked(thread_lock, os.path.join(directory, "state"))
+
+    def _pending(self, directory):
+        indexes = []
+        for name in os.listdir(directory):
+            if name.endswith(".chunk"):
+                indexes.append(int(name[:-len(".chunk")]))
+        return sorted(indexes)
+
+    def _drain(self, directory, state, part_fd):
+        """Append parked chunks that are now in order; returns the new (next_index, part_bytes)."""
+        next_index, part_bytes = state
+        while True:
+            path = os.path.join(directory, f"{next_index}.chunk")
+            if not os.path.exists(path):
+                return next_index, part_bytes
+            part_bytes += _append_file(part_fd, path)
+            os.remove(path)
+            next_index += 1
+
+    def _open_part(self, directory):
+        return os.open(os.path.join(directory, "video.part"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def add_chunk(self, session_id, recording_id, index, source):
+        """
+        Store chunk `index` of a recording, read from the file-like `source`.
+        Returns "appended", "parked" or "duplicate".
+        """
+        directory = self._recording_dir(session_id, recording_id)
+        with self._lock(session_id, recording_id) as locked:
+            next_index, part_bytes = locked.read()
+            if next_index is None:
+                next_index = self.first_index
+            if index < next_index or os.path.exists(os.path.join(directory, f"{index}.chunk")):
+                return "duplicate"
+            if index == next_index:
+                part_fd = self._open_part(directory)
+                try:
+                    part_bytes += _copy_stream(source, part_fd)
+                    state = self._drain(directory, (next_index + 1, part_bytes), part_fd)
+                finally:
+                    os.close(part_fd)
+                locked.write(*state)
+                return "appended"
+
+        # Early chunk: park it without holding the recording lock while the body streams in
+        tmp_path = os.path.join(directory, f"{index}.chunk.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _copy_stream(source, fd)
+        finally:
+            os.close(fd)
+        with self._lock(session_id, recording_id) as locked:
+            try:
+                next_index, part_bytes = locked.read()
+            except UploadFinished:
+                # finish() may already have removed it
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            if next_index is None:
+                next_index = self.first_index
+            if index < next_index:
+                os.remove(tmp_path)
+                return "duplicate"
+            os.replace(tmp_path, os.path.join(directory, f"{index}.chunk"))
+            # The gap may have been filled while this chunk was streaming
+            if index == next_index:
+                part_fd = self._open_part(directory)
+                try:
+                    locked.write(*self._drain(directory, (next_index, part_bytes), part_fd))
+                finally:
+                    os.close(part_fd)
+                return "appended"
+        return "parked"
+
+    def status(self, session_id, recording_id):
+        directory = self._recording_dir(session_id, recording_id)
+        if not os.path.isdir(directory):
+            return None
+        with self._lock(session_id, recording_id) as locked:
+            try:
+                next_index, part_bytes = locked.read()
+            except UploadFinished:
+                return {"finished": True}
+            pending = self._pending(directory)
+        next_index = self.first_index if next_index is None else next_index
+        missing = [i for i in range(next_index, pending[-1]) if i not in pending] if pending else []
+        return {"next_chunk": next_index, "bytes": part_bytes, "pending": pending, "missing": missing,
+                "finished": False}
+
+    def finish(self, session_id, recording_id, final_filename, total_chunks=None):
+        """
+        Move the part file (every chunk up to the first gap) to `final_dir`.
+        Returns (final_path, missing_indexes), where missing_indexes are the
+        chunks left out from the first gap on, or (None, []) if nothing was
+        uploaded; raises UploadFinished if it was already finished. Runs
+        entirely under the recording lock, so a chunk arriving meanwhile
+        either makes it into the video or is refused afterwards.
+        """
+        directory = self._recording_dir(session_id, recording_id)
+        if not os.path.isdir(directory):
+            return None, []
+        with self._lock(session_id, recording_id) as locked:
+            next_index, part_bytes = locked.read()
+            next_index = self.first_index if next_index is None else next_index
+            # Chunks in order were appended on arrival, so anything still parked is behind a gap
+            last = max([next_index - 1] + self._pending(directory) + ([total_chunks] if total_chunks else []))
+            missing = list(range(next_index, last + 1))
+
+            part_path = os.path.join(directory, "video.part")
+            if not os.path.exists(part_path):
+                open(part_path, 'wb').close()
+            final_path = os.path.join(self.final_dir, final_filename)
+            try:
+                os.replace(part_path, final_path)
+            except OSError:
+                # Different filesystems; fall back to a copy
+                shutil.move(part_path, final_path)
+
+            # Everything but the state file goes; it stays to refuse late chunks
+            for name in os.listdir(directory):
+                if name != "state":
+                    os.remove(os.path.join(directory, name))
+            locked.write(next_index, part_bytes, finished=True)
+        with self._locks_guard:
+            self._locks.pop((session_id, recording_id), None)
+        self.cleanup()
+        return final_path, missing
+
+    def cleanup(self, now=None):
+        """Remove recordings whose state hasn't changed for `stale_after_s`; returns how many."""
+        cutoff = (time.time() if now is None else now) - self.stale_after_s
+        removed = 0
+        for session_id in os.listdir(self.chunks_dir) if os.path.isdir(self.chunks_dir) else []:
+            session_dir = os.path.join(self.chunks_dir, session_id)
+            for recording_id in os.listdir(session_dir) if os.path.isdir(session_dir) else []:
+                directory = os.path.join(session_dir, recording_id)
+                try:
+                    stale = os.path.getmtime(os.path.join(directory, "state")) < cutoff
+                except OSError:
+                    stale = False
+                if stale:
+                    shutil.rmtree(directory, ignore_errors=True)
+                    removed += 1
+            try:
+                os.rmdir(session_dir)
+            except OSError:
+                # Still holds live recordings
+                pass
+        return removed
@@ -0,0 +1,13 @@
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importing the interview_app package builds the whole app (Flask, models,
+# process pools). The tests only need single modules from it, so the package
+# is registered bare and its submodules are imported as usual.
+if "interview_app" not in sys.modules:
+    package = types.ModuleType("interview_app")
+    package.__path__ = [os.path.join(ROOT, "interview_app")]
+    sys.modules["interview_app"] = package
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from interview_app.conversation_memory import ConversationMemory
+
+
+def add_turns(memory, count, session_id="s"):
+    for i in range(count):
+        memory.add_turn(session_id, "Algebra", f"Q{i}", f"A{i}")
+
+
+def contents(memory, session_id="s", pending=None):
+    return [message["content"] for message in memory.messages(session_id, pending=pending)]
+
+
+def wait_for_folds(memory, count):
+    # Folds run in the background; wait until `count` of them have landed (or failed)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        stats = memory.stats()
+        if stats["folds"] + stats["failed_folds"] >= count:
+            return
+        time.sleep(0.005)
+    raise AssertionError("folds did not finish")
+
+
+def test_recent_turns_are_sent_verbatim():
+    memory = ConversationMemory(lambda summary, turns: "unused", max_turns=4)
+    add_turns(memory, 2)
+    assert contents(memory) == ["Q0", "A0", "Q1", "A1"]
+    assert memory.stats()["folds"] == 0
+
+
+def test_older_turns_are_folded_into_the_summary():
+    folded = []
+
+    def summarize(summary, turns):
+        folded.append([turn["question"] for turn in turns])
+        return "Candidate covered " + ", ".join(turn["question"] for turn in turns)
+
+    memory = ConversationMemory(summarize, max_turns=2)
+    add_turns(memory, 3)
+    wait_for_folds(memory, 1)
+
+    assert folded == [["Q0"]]
+    assert contents(memory) == ["Summary of the interview so far:\nCandidate covered Q0", "Q1", "A1", "Q2", "A2"]
+
+
+def test_turns_wait_for_a_slow_fold_within_the_cap():
+    release = threading.Event()
+
+    def summarize(summary, turns):
+        release.wait(5)
+        return "summary"
+
+    memory = ConversationMemory(summarize, max_turns=2, max_pending=1)
+    add_turns(memory, 6)
+    # Only max_turns + max_pending turns are sent while the fold is still running
+    assert contents(memory) == ["Q3", "A3", "Q4", "A4", "Q5", "A5"]
+
+    release.set()
+    wait_for_folds(memory, 2)
+    assert contents(memory)[0] == "Summary of the interview so far:\nsummary"
+    assert contents(memory)[1:] == ["Q4", "A4", "Q5", "A5"]
+
+
+def test_failed_fold_keeps_the_turns():
+    def summarize(summary, turns):
+        raise RuntimeError("LLM down")
+
+    memory = ConversationMemory(summarize, max_turns=1, max_pending=4)
+    add_turns(memory, 2)
+    wait_for_folds(memory, 1)
+    assert memory.stats()["failed_folds"] == 1
+    assert contents(memory) == ["Q0", "A0", "Q1", "A1"]
+
+
+def test_pending_turn_is_sent_last():
+    memory = ConversationMemory(lambda summary, turns: "", max_turns=4)
+    add_turns(memory, 1)
+    assert contents(memory, pending=("Q1", "draft")) == ["Q0", "A0", "Q1", "draft"]
+    assert contents(memory, session_id="new", pending=("Q0", "hello")) == ["Q0", "hello"]
+
+
+def test_discard_forgets_the_session():
+    memory = ConversationMemory(lambda summary, turns: "", max_turns=4)
+    add_turns(memory, 2)
+    memory.discard("s")
+    assert memory.messages("s") == []
@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("docx")
+pytest.importorskip("PyPDF2")
+
+from interview_app.document_extraction import DocumentExtractor, DocumentTooLarge  # noqa: E402
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return DocumentExtractor(str(tmp_path / "cache"), max_workers=1, max_bytes=100, processes=False)
+
+
+def test_check_size(extractor):
+    extractor.check_size(100, "resume.pdf")
+    with pytest.raises(DocumentTooLarge):
+        extractor.check_size(101, "resume.pdf")
+
+
+def test_text_files_are_cached_by_content(extractor, tmp_path):
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("Teaches algebra.", encoding="utf-8")
+    second.write_text("Teaches algebra.", encoding="utf-8")
+
+    assert extractor.extract(str(first)) == "Teaches algebra."
+    assert extractor.extract(str(second)) == "Teaches algebra."
+    assert (extractor.stats()["misses"], extractor.stats()["hits"]) == (1, 1)
+
+
+def test_large_file_is_rejected(extractor, tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_text("x" * 101, encoding="utf-8")
+    with pytest.raises(DocumentTooLarge):
+        extractor.extract(str(path))
+
+
+def test_cache_dir_is_created_on_first_write(tmp_path):
+    cache_dir = tmp_path / "cache" / "documents"
+    extractor = DocumentExtractor(str(cache_dir), max_workers=1, processes=False)
+    assert not cache_dir.exists()
+
+    path = tmp_path / "jd.txt"
+    path.write_text("Maths teacher wanted.", encoding="utf-8")
+    assert extractor.extract(str(path)) == "Maths teacher wanted."
+    assert len(list(cache_dir.iterdir())) == 1
@@ -0,0 +1,64 @@
+import os
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("werkzeug")
+
+from interview_app.face_cache import EmbeddingCache  # noqa: E402
+
+
+def embedding(value):
+    return np.full(4, value, dtype=np.float32)
+
+
+def test_memory_then_disk(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), max_entries=1)
+    cache.put("a", embedding(1))
+    cache.put("b", embedding(2))
+
+    assert np.array_equal(cache.get("b"), embedding(2))
+    # Evicted from memory, reloaded from disk
+    assert np.array_equal(cache.get("a"), embedding(1))
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_disk_entries_are_bounded(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), max_entries=1, max_disk_entries=2)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, embedding(index))
+        # Distinct mtimes, oldest first
+        os.utime(cache._path(key), (time.time() - 10 + index, time.time() - 10 + index))
+    cache.put("d", embedding(3))
+
+    assert sorted(os.listdir(tmp_path)) == ["c.npy", "d.npy"]
+    assert cache.get("a") is None
+    assert cache.stats()["disk_evictions"] == 2
+
+
+def test_old_files_are_removed(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), max_disk_age_s=60)
+    cache.put("old", embedding(1))
+    os.utime(cache._path("old"), (time.time() - 120, time.time() - 120))
+    cache.put("new", embedding(2))
+    assert os.listdir(tmp_path) == ["new.npy"]
+
+
+def test_discard(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    cache.put("a", embedding(1))
+    cache.discard("a")
+    assert cache.get("a") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_directory_is_created_on_first_put(tmp_path):
+    cache_dir = tmp_path / "embeddings"
+    cache = EmbeddingCache(str(cache_dir))
+    assert not cache_dir.exists()
+    assert cache.get("a") is None
+    cache.put("a", embedding(1))
+    assert cache_dir.exists()
@@ -0,0 +1,65 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from interview_app.face_preprocess import FaceTracker, decode_frame, map_box, plan_detection  # noqa: E402
+
+
+def png(width, height):
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[:, :, 2] = 255  # red in BGR
+    ok, data = cv2.imencode(".png", image)
+    assert ok
+    return data.tobytes()
+
+
+def test_decode_frame_reduces_and_converts_to_rgb():
+    frame = decode_frame(png(640, 480), reduction=2)
+    assert frame.shape == (240, 320, 3)
+    assert tuple(frame[0, 0]) == (255, 0, 0)
+
+
+def test_decode_frame_rejects_garbage():
+    assert decode_frame(b"not an image") is None
+
+
+def test_full_frame_is_downscaled_to_max_side():
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    region, transform = plan_detection(image, max_side=320)
+    assert region.shape[:2] == (240, 320)
+    assert transform == (0, 0, 0.5)
+
+
+def test_region_around_last_box():
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    region, transform = plan_detection(image, last_box=(300, 200, 100, 100), max_side=1000, roi_margin=0.5)
+    assert transform == (250, 150, 1.0)
+    assert region.shape[:2] == (200, 200)
+
+
+def test_region_is_clipped_to_the_image():
+    image = np.zeros((480, 640, 3), dtype=np.uint8)
+    region, (x0, y0, _) = plan_detection(image, last_box=(600, 440, 100, 100), max_side=1000, roi_margin=0.5)
+    assert (x0, y0) == (550, 390)
+    assert region.shape[:2] == (90, 90)
+
+
+def test_map_box_round_trip():
+    image = np.zeros((960, 1280, 3), dtype=np.uint8)
+    _, transform = plan_detection(image, last_box=(400, 300, 200, 200), max_side=200, roi_margin=0.5)
+    x0, y0, scale = transform
+    found = (int((400 - x0) * scale), int((300 - y0) * scale), int(200 * scale), int(200 * scale))
+    assert map_box(found, transform) == (400, 300, 200, 200)
+
+
+def test_tracker_is_bounded():
+    tracker = FaceTracker(max_entries=2)
+    tracker.update("a", (1, 1, 1, 1))
+    tracker.update("b", (2, 2, 2, 2))
+    tracker.get("a")
+    tracker.update("c", (3, 3, 3, 3))
+    assert tracker.get("b") is None
+    assert tracker.get("a") == (1, 1, 1, 1)
+    tracker.forget("a")
+    assert tracker.get("a") is None
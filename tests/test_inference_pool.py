@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from interview_app.inference_pool import InferencePool, start_pools, worker_model
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="workers are forked")
+
+
+def _load(tag):
+    return tag
+
+
+def _model(name):
+    return worker_model(name), os.getpid()
+
+
+def test_every_pool_forks_before_any_thread_starts():
+    first = InferencePool("first", 2, _load, ("a",))
+    second = InferencePool("second", 1, _load, ("b",))
+    forked = []
+    second_fork = second.fork
+
+    def fork_second():
+        # The first pool's workers are up, but its manager thread isn't running yet
+        forked.append((len(first._executor._processes), first._executor._executor_manager_thread))
+        second_fork()
+
+    second.fork = fork_second
+    try:
+        start_pools(first, second)
+        assert forked == [(2, None)]
+        first.warm(timeout=30)
+        second.warm(timeout=30)
+        assert len(first.pids) == 2 and len(second.pids) == 1
+        assert first.call(_model, "first")[0] == "a"
+        assert second.call(_model, "second") == ("b", second.pids[0])
+    finally:
+        for pool in (first, second):
+            if pool._executor is not None:
+                pool._executor.shutdown()
@@ -0,0 +1,56 @@
+import json
+
+from interview_app.json_stream import IncrementalJSONParser
+
+
+def feed_pieces(parser, pieces):
+    events = []
+    for piece in pieces:
+        events.extend(parser.feed(piece))
+    return events
+
+
+def test_question_text_streams_before_the_field_closes():
+    parser = IncrementalJSONParser()
+    events = feed_pieces(parser, ['```json\n{"quest', 'ion": "What is ', 'a fraction', '?", "answer": "A part"}\n```'])
+
+    deltas = [text for kind, path, text in events if kind == "delta" and path == ("question",)]
+    assert deltas == ["What is ", "a fraction", "?"]
+    assert ("value", ("question",), "What is a fraction?") in events
+    assert parser.result == {"question": "What is a fraction?", "answer": "A part"}
+
+
+def test_question_is_complete_before_the_answer_arrives():
+    parser = IncrementalJSONParser()
+    events = parser.feed('{"question": "Why?", "answer": "Beca')
+    assert ("value", ("question",), "Why?") in events
+    assert not parser.done
+
+
+def test_split_at_every_character_matches_json_loads():
+    document = {
+        "topics": ["Algebra", "Geometry"],
+        "limits": [2, 3.5],
+        "nested": {"ok": True, "missing": None, "quote": "say \"hi\"\n\ttab"},
+        "unicode": "café \U0001F600",
+    }
+    text = json.dumps(document)
+    parser = IncrementalJSONParser()
+    events = feed_pieces(parser, list(text))
+    assert parser.result == document
+    assert events[-1] == ("value", (), document)
+    assert ("value", ("topics", 1), "Geometry") in events
+    assert ("value", ("nested", "ok"), True) in events
+
+
+def test_escapes_split_across_pieces():
+    parser = IncrementalJSONParser()
+    feed_pieces(parser, ['{"a": "\\u00', 'e9 \\ud83d', '\\ude00 \\', 'n"}'])
+    assert parser.result == {"a": "é \U0001F600 \n"}
+
+
+def test_text_after_the_document_is_ignored():
+    parser = IncrementalJSONParser()
+    parser.feed('{"a": 1} trailing {"b": 2}')
+    assert parser.done
+    assert parser.result == {"a": 1}
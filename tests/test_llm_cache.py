@@ -0,0 +1,32 @@
+import os
+
+from interview_app.llm_cache import LLMCache, make_key
+
+
+def test_nothing_is_created_until_first_use(tmp_path):
+    path = tmp_path / "cache" / "llm.sqlite3"
+    cache = LLMCache(str(path))
+    assert not os.path.exists(path.parent)
+
+    assert cache.get("missing") == (False, None)
+    assert path.exists()
+
+
+def test_values_round_trip(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"))
+    key = make_key("topics", "gpt-4o", {"jd": "Teach  maths"})
+    cache.set(key, "topics", ["algebra", "geometry"])
+    assert cache.get(key) == (True, ["algebra", "geometry"])
+    assert cache.stats()["hits"] == 1
+
+
+def test_inputs_are_normalized_before_hashing():
+    assert make_key("topics", "gpt-4o", {"jd": "Teach  maths "}) == make_key("topics", "gpt-4o", {" jd": "Teach maths"})
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.sqlite3"), max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, "ns", key)
+    assert cache.get("a") == (False, None)
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from interview_app.llm_gateway import LLMGateway  # noqa: E402
+
+
+class FakeStream:
+    def __init__(self, pieces):
+        self.chunks = iter([
+            SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+            for piece in pieces
+        ])
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+
+def gateway_with(stream):
+    gateway = LLMGateway(max_concurrency=1, max_retries=0)
+    completions = SimpleNamespace(create=lambda **kwargs: stream)
+    gateway.client = lambda api_key: SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return gateway
+
+
+def slot_free(gateway):
+    if gateway._slots.acquire(blocking=False):
+        gateway._slots.release()
+        return True
+    return False
+
+
+def test_stream_yields_deltas_and_releases_slot():
+    stream = FakeStream(["Hel", "lo"])
+    gateway = gateway_with(stream)
+    assert list(gateway.stream_chat_completion("test", "key", model="m", messages=[])) == ["Hel", "lo"]
+    assert stream.closed
+    assert slot_free(gateway)
+    assert gateway.stats()["test"]["calls"] == 1
+
+
+def test_abandoned_stream_releases_slot():
+    stream = FakeStream(["a", "b", "c"])
+    gateway = gateway_with(stream)
+    deltas = gateway.stream_chat_completion("test", "key", model="m", messages=[])
+    assert next(deltas) == "a"
+    assert not slot_free(gateway)
+
+    # What the SSE routes do when the client disconnects
+    deltas.close()
+
+    assert stream.closed
+    assert slot_free(gateway)
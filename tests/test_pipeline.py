@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from interview_app.pipeline import Stage, PipelineError, iter_pipeline, run_pipeline
+
+
+def test_dependencies_receive_their_inputs():
+    results, timings = run_pipeline([
+        Stage("jd", lambda: "jd text"),
+        Stage("resume", lambda: "resume text"),
+        Stage("topics", lambda jd, resume: f"{jd}+{resume}", deps=("jd", "resume")),
+    ])
+    assert results == {"jd": "jd text", "resume": "resume text", "topics": "jd text+resume text"}
+    assert set(timings) == {"jd", "resume", "topics"}
+
+
+def test_independent_stages_run_concurrently():
+    # Each stage waits for the other, so this only finishes if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+    results, _ = run_pipeline([
+        Stage("a", lambda: barrier.wait() is not None),
+        Stage("b", lambda: barrier.wait() is not None),
+    ])
+    assert results == {"a": True, "b": True}
+
+
+def test_stages_are_yielded_in_completion_order():
+    release = threading.Event()
+
+    def slow():
+        release.wait(timeout=5)
+        return "slow"
+
+    names = []
+    for name, _, _ in iter_pipeline([Stage("slow", slow), Stage("fast", lambda: "fast")]):
+        # "slow" can only finish once "fast" has been yielded
+        names.append(name)
+        release.set()
+    assert names == ["fast", "slow"]
+
+
+def test_failure_names_the_stage():
+    def broken(a):
+        raise RuntimeError("boom")
+
+    with pytest.raises(PipelineError) as raised:
+        run_pipeline([Stage("a", lambda: 1), Stage("b", broken, deps=("a",))])
+    assert raised.value.stage == "b"
+    assert isinstance(raised.value.error, RuntimeError)
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        run_pipeline([Stage("a", lambda missing: None, deps=("missing",))])
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        run_pipeline([
+            Stage("a", lambda b: None, deps=("b",)),
+            Stage("b", lambda a: None, deps=("a",)),
+        ])
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from interview_app.results_log import ResultsLog
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    return str(tmp_path)
+
+
+def test_replay(results_dir):
+    log = ResultsLog(results_dir)
+    log.asked("s", 0, "Introduction", "Who are you?")
+    log.answered("s", 0, "A teacher.", answer="A teacher.")
+    log.asked("s", 1, "Algebra", "What is x?", answer="A variable.")
+    log.graded("s", 1, "Good", 8)
+
+    questions = log.questions("s")
+
+    assert [q["question"] for q in questions] == ["Who are you?", "What is x?"]
+    assert questions[0]["candi_answer"] == "A teacher."
+    assert questions[0]["answer"] == "A teacher."
+    assert (questions[1]["category"], questions[1]["score"]) == ("Good", 8)
+
+
+def test_questions_of_unknown_session(results_dir):
+    assert ResultsLog(results_dir).questions("missing") is None
+
+
+def test_other_process_sees_appends(results_dir):
+    writer, reader = ResultsLog(results_dir), ResultsLog(results_dir)
+    writer.asked("s", 0, "t", "q0")
+    assert len(reader.questions("s")) == 1
+    writer.asked("s", 1, "t", "q1")
+    assert [q["question"] for q in reader.questions("s")] == ["q0", "q1"]
+
+
+def test_partial_line_is_kept_for_the_next_read(results_dir):
+    log = ResultsLog(results_dir)
+    log.asked("s", 0, "t", "q0")
+    with open(log.log_path("s"), 'ab') as f:
+        f.write(b'{"event":"asked","index":1,')
+    assert len(log.questions("s")) == 1
+    with open(log.log_path("s"), 'ab') as f:
+        f.write(b'"topic":"t","question":"q1","answer":""}\n')
+    assert [q["question"] for q in log.questions("s")] == ["q0", "q1"]
+
+
+def test_reset_is_seen_by_other_process(results_dir):
+    first, second = ResultsLog(results_dir), ResultsLog(results_dir)
+    for index in range(3):
+        first.asked("s", index, "t", f"old {index}")
+    assert len(second.questions("s")) == 3
+
+    first.reset("s")
+    # More bytes than before, so the file doesn't look shorter to the other process
+    for index in range(4):
+        first.asked("s", index, "t", f"new question {index}")
+
+    assert [q["question"] for q in second.questions("s")] == [f"new question {index}" for index in range(4)]
+
+
+def test_writes_after_another_process_reset_land_in_the_new_log(results_dir):
+    first, second = ResultsLog(results_dir), ResultsLog(results_dir)
+    first.asked("s", 0, "t", "old")
+    second.questions("s")
+
+    first.reset("s")
+    first.asked("s", 0, "t", "new")
+    second.graded("s", 0, "Good", 7)
+
+    question = first.questions("s")[0]
+    assert (question["question"], question["score"]) == ("new", 7)
+
+
+def test_truncated_log_is_replayed_from_the_start(results_dir):
+    log = ResultsLog(results_dir)
+    log.asked("s", 0, "t", "a long question that will be removed")
+    log.questions("s")
+
+    with open(log.log_path("s"), 'r+b') as f:
+        f.truncate(0)
+        f.write(b'{"event":"asked","index":0,"topic":"t","question":"q","answer":""}\n')
+
+    assert [q["question"] for q in log.questions("s")] == ["q"]
+
+
+def test_finalize(results_dir):
+    log = ResultsLog(results_dir)
+    log.asked("s", 0, "t", "q0")
+    questions = log.finalize("s")
+    assert questions[0]["question"] == "q0"
+    assert os.path.exists(log.final_path("s"))
+    assert log.finalize("missing") is None
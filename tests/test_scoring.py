@@ -0,0 +1,61 @@
+import threading
+
+from interview_app.scoring import ScoringQueue
+
+
+def test_grades_are_kept_and_reported():
+    scored = []
+    queue = ScoringQueue(lambda **kwargs: ("Good", 0.0), lambda *args: scored.append(args), max_workers=1)
+    queue.submit("s", 0, question="q", answer="a", candi_answer="c")
+    assert queue.wait("s", timeout=5) == {0: ("Good", 0.1)}
+    assert scored == [("s", 0, "Good", 0.1)]
+    assert queue.pending("s") == 0
+
+
+def test_discard_drops_grades_still_being_computed():
+    started, release = threading.Event(), threading.Event()
+
+    def grade(**kwargs):
+        started.set()
+        release.wait(5)
+        return "Good", 8
+
+    scored = []
+    queue = ScoringQueue(grade, lambda *args: scored.append(args), max_workers=1)
+    running = queue.submit("s", 0, question="q", answer="a", candi_answer="old")
+    queued = queue.submit("s", 1, question="q", answer="a", candi_answer="old")
+    started.wait(5)
+
+    queue.discard("s")
+    release.set()
+    running.result(timeout=5)
+
+    assert queued.cancelled()
+    assert queue.scores("s") == {}
+    assert scored == []
+
+
+def test_grades_after_discard_are_kept():
+    queue = ScoringQueue(lambda **kwargs: ("Good", 5), lambda *args: None, max_workers=1)
+    queue.discard("s")
+    queue.submit("s", 0, question="q", answer="a", candi_answer="new")
+    assert queue.wait("s", timeout=5) == {0: ("Good", 5)}
+
+
+def test_wait_for_some_indexes_ignores_other_grades():
+    release = threading.Event()
+
+    def grade(candi_answer, **kwargs):
+        if candi_answer == "slow":
+            release.wait(5)
+        return "Good", 7
+
+    queue = ScoringQueue(grade, lambda *args: None, max_workers=2)
+    slow = queue.submit("s", 2, question="q", answer="a", candi_answer="slow")
+    queue.submit("s", 0, question="q", answer="a", candi_answer="fast")
+
+    # Returns once index 0 is graded, while index 2 is still running
+    assert queue.wait("s", timeout=5, indexes={0}) == {0: ("Good", 7)}
+    assert not slow.done()
+    release.set()
+    assert queue.wait("s", timeout=5) == {0: ("Good", 7), 2: ("Good", 7)}
@@ -0,0 +1,136 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from interview_app.session_store import (  # noqa: E402
+    CompactSessionInterface,
+    MemorySessionBackend,
+    SQLiteSessionBackend,
+)
+
+RESUME = "Ten years of teaching mathematics. " * 100
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemorySessionBackend()
+    return SQLiteSessionBackend(str(tmp_path / "sessions.sqlite3"))
+
+
+@pytest.fixture
+def app():
+    return flask.Flask(__name__)
+
+
+def make_interface(backend):
+    return CompactSessionInterface(backend, blob_keys=("candidate_resume",), blob_min_bytes=64)
+
+
+def save(interface, app, session):
+    response = flask.Response()
+    interface.save_session(app, session, response)
+    return response
+
+
+def reopen(interface, app, sid):
+    return interface.open_session(app, SimpleNamespace(cookies={app.config["SESSION_COOKIE_NAME"]: sid}))
+
+
+def test_large_values_are_stored_once_by_reference(backend, app):
+    interface = make_interface(backend)
+    first = interface._new_session(app)
+    first.update(candidate_resume=RESUME, step=1)
+    save(interface, app, first)
+    second = interface._new_session(app)
+    second.update(candidate_resume=RESUME, step=2)
+    save(interface, app, second)
+
+    digest = first.blobs["candidate_resume"][1]
+    assert second.blobs["candidate_resume"][1] == digest
+    assert backend.get_blob(digest) is not None
+
+    loaded = reopen(make_interface(backend), app, first.sid)
+    assert loaded["candidate_resume"] == RESUME
+    assert loaded["step"] == 1
+
+
+def test_unchanged_session_is_not_rewritten(backend, app):
+    interface = make_interface(backend)
+    session = interface._new_session(app)
+    session.update(candidate_resume=RESUME, step=1)
+    save(interface, app, session)
+
+    loaded = reopen(interface, app, session.sid)
+    save(interface, app, loaded)
+
+    stats = interface.stats()
+    assert (stats["writes"], stats["skipped_writes"]) == (1, 1)
+
+
+def test_cached_blob_is_stored_again_after_cleanup(backend, app):
+    interface = make_interface(backend)
+    old = interface._new_session(app)
+    old["candidate_resume"] = RESUME
+    save(interface, app, old)
+    digest = old.blobs["candidate_resume"][1]
+
+    # Every session using the blob expired and cleanup removed it, but this process still caches it
+    backend.cleanup(time.time() + 10 * app.permanent_session_lifetime.total_seconds(), 0)
+    assert backend.get_blob(digest) is None
+
+    new = interface._new_session(app)
+    new["candidate_resume"] = RESUME
+    save(interface, app, new)
+
+    assert backend.get_blob(digest) is not None
+    assert reopen(make_interface(backend), app, new.sid)["candidate_resume"] == RESUME
+
+
+def test_blob_removed_under_a_live_session_is_written_back_on_save(backend, app):
+    interface = make_interface(backend)
+    session = interface._new_session(app)
+    session.update(candidate_resume=RESUME, step=1)
+    save(interface, app, session)
+    digest = session.blobs["candidate_resume"][1]
+
+    loaded = reopen(interface, app, session.sid)
+    with backend._lock:
+        if isinstance(backend, MemorySessionBackend):
+            del backend._blobs[digest]
+        else:
+            conn = backend._connection()
+            conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            conn.commit()
+
+    loaded["step"] = 2
+    save(interface, app, loaded)
+
+    reloaded = reopen(make_interface(backend), app, session.sid)
+    assert reloaded["candidate_resume"] == RESUME
+    assert reloaded["step"] == 2
+
+
+def test_empty_session_is_deleted(backend, app):
+    interface = make_interface(backend)
+    session = interface._new_session(app)
+    session["step"] = 1
+    save(interface, app, session)
+
+    loaded = reopen(interface, app, session.sid)
+    loaded.clear()
+    save(interface, app, loaded)
+
+    assert backend.load(session.sid) is None
+
+
+def test_sqlite_file_is_created_on_first_use(tmp_path, app):
+    path = tmp_path / "cache" / "sessions.sqlite3"
+    backend = SQLiteSessionBackend(str(path))
+    assert not path.parent.exists()
+
+    assert backend.load("missing") is None
+    assert path.exists()
@@ -0,0 +1,18 @@
+from interview_app.speculation import SpeculativeQuestions
+
+
+def test_prefetch_is_handed_over_for_the_same_answer():
+    speculation = SpeculativeQuestions(max_workers=1)
+    speculation.start("s1", (3, "next", "Algebra", "I would use a number line"), lambda: ("Q", "A"))
+    future = speculation.take("s1", (3, "next", "Algebra", "I would use a number line"))
+    assert future.result() == ("Q", "A")
+    assert speculation.stats()["used"] == 1
+
+
+def test_prefetch_for_another_answer_is_discarded():
+    speculation = SpeculativeQuestions(max_workers=1)
+    speculation.start("s1", (3, "next", "Algebra", "first transcript"), lambda: ("Q", "A"))
+    assert speculation.take("s1", (3, "next", "Algebra", "edited answer")) is None
+    assert speculation.stats()["discarded"] == 1
+    # The stale entry is gone either way
+    assert speculation.take("s1", (3, "next", "Algebra", "first transcript")) is None
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from interview_app.speech_trim import SAMPLE_RATE, merge_segments, trim_silence  # noqa: E402
+
+
+def tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds, level=1e-4):
+    return (level * np.random.default_rng(0).standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def test_leading_and_trailing_silence_is_dropped():
+    audio = np.concatenate([silence(2), tone(1), silence(3)])
+    result = trim_silence(audio, pad_ms=100)
+
+    assert len(result.segments) == 1
+    assert 1.0 <= result.speech_seconds <= 1.3
+    assert result.input_seconds == pytest.approx(6.0)
+    assert result.compression_ratio > 4
+
+
+def test_long_pause_is_cut_short_pause_is_kept():
+    audio = np.concatenate([tone(1), silence(0.3), tone(1), silence(2), tone(1)])
+    result = trim_silence(audio, min_silence_ms=500, pad_ms=0)
+
+    # The 0.3 s pause is bridged, the 2 s one separates two segments
+    assert len(result.segments) == 2
+    assert result.speech_seconds == pytest.approx(3.3, abs=0.1)
+
+
+def test_quiet_recording_follows_the_microphone_gain():
+    # Speech recorded 30 dB lower is still found against an even quieter background
+    audio = np.concatenate([silence(1, level=1e-5), tone(1, amplitude=0.01), silence(1, level=1e-5)])
+    result = trim_silence(audio, pad_ms=0)
+    assert result.speech_seconds == pytest.approx(1.0, abs=0.05)
+
+
+def test_only_silence_gives_no_audio():
+    result = trim_silence(silence(2), floor_db=-50.0)
+    assert result.audio.size == 0
+    assert result.to_dict()["compression_ratio"] is None
+
+
+def test_merge_drops_blips_and_pads_within_bounds():
+    rate = SAMPLE_RATE
+    segments = [(0, rate // 100), (rate, 2 * rate), (int(2.1 * rate), 3 * rate)]
+    merged = merge_segments(segments, total=3 * rate, min_speech_ms=200, min_silence_ms=500, pad_ms=200)
+    # The 10 ms blip is dropped, the 0.1 s gap bridged, and padding stops at the end of the input
+    assert merged == [(int(0.8 * rate), 3 * rate)]
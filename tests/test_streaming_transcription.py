@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+pytest.importorskip("faster_whisper")
+av = pytest.importorskip("av")
+np = pytest.importorskip("numpy")
+
+from interview_app.audio_decode import IncrementalDecoder, decode_bytes  # noqa: E402
+from interview_app.streaming_transcription import StreamingTranscriber  # noqa: E402
+
+
+def _recording(format_name, seconds=4, rate=48000):
+    buffer = io.BytesIO()
+    container = av.open(buffer, mode="w", format=format_name)
+    stream = container.add_stream("libopus", rate=rate)
+    stream.layout = "mono"
+    t = np.arange(rate * seconds) / rate
+    signal = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    for i in range(0, len(signal), 960):
+        frame = av.AudioFrame.from_ndarray(signal[i:i + 960].reshape(1, -1), format="flt", layout="mono")
+        frame.sample_rate = rate
+        frame.pts = i
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def transcriber():
+    # Pieces below aren't valid audio; the background passes just fail to decode them
+    return StreamingTranscriber(model=None)
+
+
+def test_pieces_in_order_are_counted(transcriber):
+    transcriber.feed("a", b"abc", offset=0)
+    transcriber.feed("a", b"de", offset=3)
+    assert transcriber.fed("a") == 5
+
+
+def test_offset_zero_starts_over(transcriber):
+    transcriber.feed("a", b"abc", offset=0)
+    transcriber.feed("a", b"xy", offset=0)
+    assert transcriber.fed("a") == 2
+
+
+def test_gap_drops_the_stream(transcriber):
+    transcriber.feed("a", b"abc", offset=0)
+    transcriber.feed("a", b"gh", offset=6)
+    assert transcriber.fed("a") is None
+    transcriber.feed("a", b"ij", offset=8)
+    assert transcriber.fed("a") is None
+
+
+def test_stream_started_elsewhere_is_not_tracked(transcriber):
+    # The first pieces went to another worker process
+    transcriber.feed("a", b"de", offset=3)
+    assert transcriber.fed("a") is None
+    assert not transcriber.has("a")
+
+
+@pytest.mark.parametrize("format_name", ["webm", "ogg"])
+def test_growing_recording_resumes_past_byte_zero(format_name):
+    data = _recording(format_name)
+    decoder = IncrementalDecoder(format_name)
+    received = bytearray()
+    offsets = []
+    decoded = []
+    for i in range(0, len(data), 4000):
+        received += data[i:i + 4000]
+        final = i + 4000 >= len(data)
+        start = decoder.resume_offset
+        offsets.append(start)
+        try:
+            decoder.decode(bytes(received[start:]), final=final, start=start)
+        except EOFError:
+            # Too little of the header has arrived to open the container
+            continue
+        audio = decoder.audio()
+        decoded.append(audio.copy())
+        decoder.drop(len(audio))
+
+    assert max(offsets) > 0
+    assert sum(len(part) for part in decoded) == len(decode_bytes(data, format_name))
+
+
+def test_drop_releases_decoded_samples():
+    data = _recording("webm", seconds=1)
+    decoder = IncrementalDecoder("webm")
+    decoder.decode(data, final=True)
+    total = len(decoder.audio())
+    decoder.drop(1000)
+    assert len(decoder.audio()) == total - 1000
@@ -0,0 +1,59 @@
+import threading
+
+from interview_app.topic_summaries import TopicSummaries
+
+
+def test_closed_topics_are_summarized_once():
+    calls = []
+
+    def summarize(session_id, topic):
+        calls.append(topic)
+        return f"{topic} went well"
+
+    summaries = TopicSummaries(summarize, max_workers=1)
+    summaries.submit("s", "Algebra").result(timeout=5)
+    summaries.submit("s", "Algebra").result(timeout=5)
+
+    assert summaries.collect("s", ["Algebra", "Geometry"], timeout=5) == {
+        "Algebra": "Algebra went well",
+        "Geometry": "Geometry went well",
+    }
+    # Geometry (the last topic) was only started by collect
+    assert calls == ["Algebra", "Geometry"]
+
+
+def test_failed_summary_is_retried_by_collect():
+    attempts = []
+
+    def summarize(session_id, topic):
+        attempts.append(topic)
+        if len(attempts) == 1:
+            raise RuntimeError("LLM down")
+        return "ok"
+
+    summaries = TopicSummaries(summarize, max_workers=1)
+    summaries.submit("s", "Algebra").exception(timeout=5)
+    assert summaries.collect("s", ["Algebra"], timeout=5) == {"Algebra": "ok"}
+    assert summaries.stats()["failed"] == 1
+
+
+def test_collect_leaves_out_summaries_not_ready_in_time():
+    release = threading.Event()
+
+    def summarize(session_id, topic):
+        if topic == "Slow":
+            release.wait(5)
+        return topic
+
+    summaries = TopicSummaries(summarize, max_workers=2)
+    assert summaries.collect("s", ["Fast", "Slow"], timeout=0.2) == {"Fast": "Fast"}
+    release.set()
+
+
+def test_discard_starts_the_session_over():
+    calls = []
+    summaries = TopicSummaries(lambda session_id, topic: calls.append(topic) or topic, max_workers=1)
+    summaries.submit("s", "Algebra").result(timeout=5)
+    summaries.discard("s")
+    summaries.submit("s", "Algebra").result(timeout=5)
+    assert calls == ["Algebra", "Algebra"]
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+pytest.importorskip("faster_whisper")
+
+from interview_app.transcription_engine import WhisperEngine  # noqa: E402
+
+
+class SlowLoadingEngine(WhisperEngine):
+    def __init__(self, settings):
+        super().__init__(settings, {"backend": "off"})
+        self.loading = threading.Event()
+        self.release = threading.Event()
+        self.loaded = []
+
+    def _load(self, model_size):
+        self.loading.set()
+        self.release.wait(timeout=5)
+        self.loaded.append(model_size)
+        return object()
+
+
+def test_warm_loads_default_and_fast_models():
+    engine = SlowLoadingEngine({"model": "small", "fast_model": "base", "pool_size": 2})
+    engine.release.set()
+    engine.warm()
+    assert sorted(engine.loaded) == ["base", "base", "small", "small"]
+    assert engine.stats() == {
+        "small": {"instances": 2, "idle": 2},
+        "base": {"instances": 2, "idle": 2},
+    }
+
+
+def test_stats_are_not_blocked_by_a_model_load():
+    engine = SlowLoadingEngine({"model": "small"})
+    loader = threading.Thread(target=engine.warm)
+    loader.start()
+    assert engine.loading.wait(timeout=5)
+
+    finished = []
+    reader = threading.Thread(target=lambda: finished.append((engine.stats(), engine.vad_stats())))
+    reader.start()
+    reader.join(timeout=1)
+    engine.release.set()
+    loader.join(timeout=5)
+    assert finished and finished[0][0] == {}
+
+
+def test_concurrent_callers_load_a_model_once():
+    engine = SlowLoadingEngine({"model": "small"})
+    threads = [threading.Thread(target=engine.warm, args=("small",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    engine.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert engine.loaded == ["small"]
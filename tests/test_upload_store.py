@@ -0,0 +1,83 @@
+import io
+
+import pytest
+
+from interview_app.upload_store import ResumableUploads
+
+
+@pytest.fixture
+def uploads(tmp_path):
+    return ResumableUploads(str(tmp_path))
+
+
+def contents(uploads, file_id):
+    with open(uploads.path(file_id), 'rb') as f:
+        return f.read()
+
+
+def test_pieces_in_order(uploads):
+    first = uploads.write("a", 0, io.BytesIO(b"abc"))
+    second = uploads.write("a", 3, io.BytesIO(b"def"))
+    assert first == {"created": True, "duplicate": False, "before": 0, "offset": 3}
+    assert second == {"created": False, "duplicate": False, "before": 3, "offset": 6}
+    assert contents(uploads, "a") == b"abcdef"
+    assert uploads.offset("a") == 6
+
+
+def test_out_of_order_piece_fills_gap(uploads):
+    uploads.write("a", 0, io.BytesIO(b"ab"))
+    early = uploads.write("a", 4, io.BytesIO(b"ef"))
+    assert early["offset"] == 2
+    filled = uploads.write("a", 2, io.BytesIO(b"cd"))
+    assert filled["before"] == 2 and filled["offset"] == 6
+    assert contents(uploads, "a") == b"abcdef"
+
+
+def test_retried_piece_is_a_duplicate(uploads):
+    uploads.write("a", 0, io.BytesIO(b"abc"))
+    uploads.write("a", 3, io.BytesIO(b"def"))
+    retry = uploads.write("a", 3, io.BytesIO(b"def"), length=3)
+    assert retry["duplicate"] is True
+    assert retry["offset"] == 6
+    assert uploads.stats()["duplicates"] == 1
+
+
+def test_retried_first_piece_is_ignored(uploads):
+    uploads.write("a", 0, io.BytesIO(b"abc"))
+    uploads.write("a", 3, io.BytesIO(b"def"))
+
+    retry = uploads.write("a", 0, io.BytesIO(b"abc"), length=3)
+
+    assert retry == {"created": False, "duplicate": True, "before": 6, "offset": 6}
+    assert contents(uploads, "a") == b"abcdef"
+
+
+def test_restart_starts_the_upload_over(uploads):
+    uploads.write("a", 0, io.BytesIO(b"old recording"))
+    uploads.write("a", 13, io.BytesIO(b" tail"))
+
+    restart = uploads.write("a", 0, io.BytesIO(b"new"), length=3, restart=True)
+
+    assert restart == {"created": True, "duplicate": False, "before": 0, "offset": 3}
+    assert contents(uploads, "a") == b"new"
+    assert uploads.offset("a") == 3
+
+
+def test_offset_zero_without_restart_is_just_a_piece(uploads):
+    uploads.write("a", 3, io.BytesIO(b"def"))
+    first = uploads.write("a", 0, io.BytesIO(b"abc"), length=3)
+    assert first == {"created": False, "duplicate": False, "before": 0, "offset": 6}
+    assert contents(uploads, "a") == b"abcdef"
+
+
+def test_complete(uploads):
+    uploads.write("a", 0, io.BytesIO(b"abc"))
+    assert uploads.complete("a", size=5) == (3, False)
+    assert uploads.offset("a") == 3
+    assert uploads.complete("a", size=3) == (3, True)
+    assert uploads.offset("a") is None
+
+
+def test_unknown_upload(uploads):
+    assert uploads.offset("missing") is None
+    assert uploads.complete("missing") == (None, False)
@@ -0,0 +1,97 @@
+import io
+import os
+import time
+
+import pytest
+
+from interview_app.video_store import UploadFinished, VideoChunkStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    chunks_dir, final_dir = tmp_path / "chunks", tmp_path / "videos"
+    chunks_dir.mkdir()
+    final_dir.mkdir()
+    return VideoChunkStore(str(chunks_dir), str(final_dir))
+
+
+def add(store, index, data, session_id="s", recording_id="r1"):
+    return store.add_chunk(session_id, recording_id, index, io.BytesIO(data))
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_chunks_in_order_are_appended(store):
+    assert add(store, 1, b"aa") == "appended"
+    assert add(store, 2, b"bb") == "appended"
+    assert store.status("s", "r1")["next_chunk"] == 3
+    path, missing = store.finish("s", "r1", "s.mp4")
+    assert read(path) == b"aabb"
+    assert missing == []
+
+
+def test_early_chunks_are_parked_then_drained(store):
+    assert add(store, 3, b"cc") == "parked"
+    assert add(store, 2, b"bb") == "parked"
+    assert store.status("s", "r1")["missing"] == [1]
+    assert add(store, 1, b"aa") == "appended"
+
+    status = store.status("s", "r1")
+    assert (status["next_chunk"], status["bytes"], status["pending"]) == (4, 6, [])
+
+
+def test_duplicates(store):
+    add(store, 1, b"aa")
+    add(store, 3, b"cc")
+    assert add(store, 1, b"aa") == "duplicate"
+    assert add(store, 3, b"cc") == "duplicate"
+
+
+def test_finish_stops_at_the_first_gap(store):
+    add(store, 1, b"aa")
+    add(store, 3, b"cc")
+    path, missing = store.finish("s", "r1", "s.mp4", total_chunks=4)
+    # Chunk 3 can't be played without chunk 2, so it is left out too
+    assert read(path) == b"aa"
+    assert missing == [2, 3, 4]
+
+
+def test_finish_without_chunks(store):
+    assert store.finish("nothing", "r1", "x.mp4") == (None, [])
+
+
+def test_late_chunk_after_finish_is_refused(store):
+    add(store, 1, b"aa")
+    path, _ = store.finish("s", "r1", "s.mp4")
+
+    with pytest.raises(UploadFinished):
+        add(store, 2, b"bb")
+    with pytest.raises(UploadFinished):
+        store.finish("s", "r1", "s.mp4")
+
+    assert read(path) == b"aa"
+    assert store.status("s", "r1") == {"finished": True}
+    assert os.listdir(store._recording_dir("s", "r1")) == ["state"]
+
+
+def test_a_second_recording_in_the_same_session(store):
+    add(store, 1, b"aa")
+    first, _ = store.finish("s", "r1", "s-r1.mp4")
+
+    assert add(store, 1, b"xx", recording_id="r2") == "appended"
+    second, missing = store.finish("s", "r2", "s-r2.mp4")
+    assert (read(first), read(second), missing) == (b"aa", b"xx", [])
+
+
+def test_stale_recordings_are_cleaned_up(store):
+    add(store, 1, b"aa", recording_id="old")
+    store.finish("s", "old", "old.mp4")
+    add(store, 1, b"bb", session_id="other", recording_id="abandoned")
+    add(store, 1, b"cc", recording_id="live")
+
+    assert store.cleanup(now=time.time() + store.stale_after_s + 1) == 3
+    assert os.listdir(store.chunks_dir) == []
+    assert store.cleanup() == 0